@@ -0,0 +1,63 @@
+"""add question filter indexes
+
+Revision ID: 3c1f0a7b9d42
+Revises:
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f0a7b9d42"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nombre, tabla, columnas)
+INDEXES = [
+    ("ix_questions_subtopic_id_id", "questions", ["subtopic_id", "id"]),
+    ("ix_questions_difficulty_id_id", "questions", ["difficulty_id", "id"]),
+    ("ix_questions_question_type_id_id", "questions", ["question_type_id", "id"]),
+    (
+        "ix_question_areas_area_id_question_id",
+        "question_areas",
+        ["area_id", "question_id"],
+    ),
+    (
+        "ix_question_sources_source_id_question_id",
+        "question_sources",
+        ["source_id", "question_id"],
+    ),
+    ("ix_sources_year_id", "sources", ["year", "id"]),
+    ("ix_subtopics_topic_id", "subtopics", ["topic_id"]),
+    ("ix_topics_course_id", "topics", ["course_id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY no puede ejecutarse dentro de una transacción
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,64 @@
+"""add question random key
+
+Revision ID: 5b8f3e7c0d19
+Revises: c47a9e1d2b80
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8f3e7c0d19"
+down_revision: Union[str, Sequence[str], None] = "c47a9e1d2b80"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nombre, columnas)
+INDEXES = [
+    ("ix_questions_random_key", ["random_key"]),
+    ("ix_questions_subtopic_id_random_key", ["subtopic_id", "random_key"]),
+    ("ix_questions_difficulty_id_random_key", ["difficulty_id", "random_key"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Un DEFAULT volátil asigna un valor distinto a cada fila existente
+    op.add_column(
+        "questions",
+        sa.Column(
+            "random_key",
+            sa.Float(),
+            server_default=sa.text("random()"),
+            nullable=False,
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "questions",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="questions",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    op.drop_column("questions", "random_key")
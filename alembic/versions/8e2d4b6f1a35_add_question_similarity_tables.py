@@ -0,0 +1,57 @@
+"""add question similarity tables
+
+Revision ID: 8e2d4b6f1a35
+Revises: 3c1f0a7b9d42
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2d4b6f1a35"
+down_revision: Union[str, Sequence[str], None] = "3c1f0a7b9d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "question_signatures",
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        sa.Column("signature", postgresql.ARRAY(sa.BigInteger()), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["question_id"], ["questions.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("question_id"),
+    )
+    op.create_table(
+        "question_lsh_buckets",
+        sa.Column("band", sa.SmallInteger(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("question_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["question_id"], ["questions.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("band", "bucket", "question_id"),
+    )
+    op.create_index(
+        "ix_question_lsh_buckets_question_id",
+        "question_lsh_buckets",
+        ["question_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_question_lsh_buckets_question_id", table_name="question_lsh_buckets"
+    )
+    op.drop_table("question_lsh_buckets")
+    op.drop_table("question_signatures")
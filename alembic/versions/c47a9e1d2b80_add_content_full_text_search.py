@@ -0,0 +1,79 @@
+"""add content full text search
+
+Revision ID: c47a9e1d2b80
+Revises: 8e2d4b6f1a35
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c47a9e1d2b80"
+down_revision: Union[str, Sequence[str], None] = "8e2d4b6f1a35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["question_content", "choice_content", "solution_content"]
+
+# Debe coincidir con app.db.search.SEARCH_VECTOR_EXPRESSION
+SEARCH_VECTOR_EXPRESSION = (
+    "CASE WHEN type = 'text' THEN "
+    "to_tsvector('spanish'::regconfig, immutable_unaccent(value)) END"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() es STABLE (depende del diccionario); el envoltorio fija el
+    # diccionario para poder usarlo en columnas generadas e índices
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text)
+        RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+
+    # Una columna generada STORED reescribe cada tabla bajo ACCESS EXCLUSIVE: las
+    # lecturas y escrituras de contenidos esperan a que termine (ventana de
+    # mantenimiento en tablas grandes)
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+        )
+
+    # Solo los índices se crean sin bloquear escrituras (CONCURRENTLY, fuera de la
+    # transacción)
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f"ix_{table}_search_vector",
+                table,
+                ["search_vector"],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(
+                f"ix_{table}_search_vector",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    for table in reversed(TABLES):
+        op.drop_column(table, "search_vector")
+
+    op.execute("DROP FUNCTION IF EXISTS immutable_unaccent(text)")
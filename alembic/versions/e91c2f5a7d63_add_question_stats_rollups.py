@@ -0,0 +1,88 @@
+"""add question stats rollups
+
+Revision ID: e91c2f5a7d63
+Revises: 5b8f3e7c0d19
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e91c2f5a7d63"
+down_revision: Union[str, Sequence[str], None] = "5b8f3e7c0d19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _dimension_columns() -> list[sa.Column]:
+    return [
+        sa.Column("subtopic_id", sa.Integer(), nullable=False),
+        sa.Column("difficulty_id", sa.Integer(), nullable=False),
+        sa.Column("question_type_id", sa.Integer(), nullable=False),
+    ]
+
+
+def _dimension_fks() -> list[sa.ForeignKeyConstraint]:
+    return [
+        sa.ForeignKeyConstraint(["subtopic_id"], ["subtopics.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["difficulty_id"], ["difficulties.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["question_type_id"], ["question_types.id"], ondelete="CASCADE"
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "question_stats",
+        *_dimension_columns(),
+        sa.Column("question_count", sa.Integer(), nullable=False),
+        *_dimension_fks(),
+        sa.PrimaryKeyConstraint("subtopic_id", "difficulty_id", "question_type_id"),
+    )
+    op.create_table(
+        "question_area_stats",
+        sa.Column("area_id", sa.Integer(), nullable=False),
+        *_dimension_columns(),
+        sa.Column("question_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["area_id"], ["areas.id"], ondelete="CASCADE"),
+        *_dimension_fks(),
+        sa.PrimaryKeyConstraint(
+            "area_id", "subtopic_id", "difficulty_id", "question_type_id"
+        ),
+    )
+
+    # Carga inicial; desde aquí los conteos se mantienen en cada escritura
+    op.execute(
+        """
+        INSERT INTO question_stats
+            (subtopic_id, difficulty_id, question_type_id, question_count)
+        SELECT subtopic_id, difficulty_id, question_type_id, count(*)
+        FROM questions
+        GROUP BY subtopic_id, difficulty_id, question_type_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO question_area_stats
+            (area_id, subtopic_id, difficulty_id, question_type_id, question_count)
+        SELECT qa.area_id, q.subtopic_id, q.difficulty_id, q.question_type_id,
+               count(*)
+        FROM questions q
+        JOIN question_areas qa ON qa.question_id = q.id
+        GROUP BY qa.area_id, q.subtopic_id, q.difficulty_id, q.question_type_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("question_area_stats")
+    op.drop_table("question_stats")
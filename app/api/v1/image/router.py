@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, UploadFile, File, Depends, Query
@@ -11,6 +12,7 @@ image_router = APIRouter(tags=["Image"])
 
 
 # DEPENDENCIAS
+@lru_cache
 def get_gcp_storage() -> StoragePort:
     return GCPStorageAdapter()
 
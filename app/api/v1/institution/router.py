@@ -8,7 +8,7 @@ from app.api.v1.institution.schemas import (
     InstitutionPublic,
     InstitutionUpdate,
 )
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
 from app.helpers.build_paginated import build_paginated_response
 from app.schemas.pagination import PaginationMeta
 from app.schemas.response import ApiResponse
@@ -23,6 +23,14 @@ def get_institution_service(db: Annotated[Session, Depends(get_session)]):
     return InstitutionService(institution_repository)
 
 
+def get_read_institution_service(
+        db: Annotated[Session, Depends(get_read_session)],
+):
+    """Servicio para endpoints GET: usa la réplica de lectura si está disponible."""
+    institution_repository = InstitutionRepository(db)
+    return InstitutionService(institution_repository)
+
+
 @institution_router.post(
     "",
     response_model=ApiResponse[InstitutionPublic],
@@ -43,15 +51,28 @@ def add_institution(
     summary="Listar instituciones",
 )
 def read_institutions(
-        service: Annotated[InstitutionService, Depends(get_institution_service)],
+        service: Annotated[
+            InstitutionService, Depends(get_read_institution_service)
+        ],
         page: Annotated[int, Query(ge=1, description="Número de página")] = 1,
         limit: Annotated[
             int, Query(ge=1, le=100, description="Cantidad de elementos por página")
         ] = 50,
+        include_total: Annotated[
+            bool,
+            Query(
+                description=(
+                    "Calcular `meta.total` y `meta.pages`. Con `false` se omite el "
+                    "conteo; usar `meta.has_next` para saber si hay más páginas."
+                )
+            ),
+        ] = True,
 ):
     """Recupera instituciones de la base de datos con soporte para paginación."""
-    items, total = service.get_institutions(page, limit)
-    return build_paginated_response(items=items, total=total, page=page, limit=limit)
+    items, total, has_next = service.get_institutions(page, limit, include_total)
+    return build_paginated_response(
+        items=items, total=total, page=page, limit=limit, has_next=has_next
+    )
 
 
 @institution_router.get(
@@ -60,7 +81,9 @@ def read_institutions(
     summary="Obtener una institución por ID",
 )
 def read_institution(
-        service: Annotated[InstitutionService, Depends(get_institution_service)],
+        service: Annotated[
+            InstitutionService, Depends(get_read_institution_service)
+        ],
         institution_id: Annotated[int, Path(ge=1, description="ID de la institución")],
 ):
     institution = service.get_institution(institution_id)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter
+
+from app.api.v1.metrics.schemas import PoolStatsPublic, RedisStatsPublic
+from app.core.redis_client import redis_breaker
+from app.db.pool_metrics import pool_metrics
+from app.schemas.response import ApiResponse
+
+# Endpoints internos: no se publican en la documentación OpenAPI
+metrics_router = APIRouter(tags=["Metrics"], include_in_schema=False)
+
+
+@metrics_router.get(
+    "/db-pool",
+    response_model=ApiResponse[list[PoolStatsPublic]],
+    summary="Estadísticas de los pools de conexiones",
+)
+def read_db_pool_metrics():
+    """Devuelve el estado y las estadísticas acumuladas de cada pool de conexiones."""
+    return {"data": [metrics.snapshot() for metrics in pool_metrics.values()]}
+
+
+@metrics_router.get(
+    "/redis",
+    response_model=ApiResponse[RedisStatsPublic],
+    summary="Estado del circuit breaker de Redis",
+)
+def read_redis_metrics():
+    """Devuelve el estado del circuit breaker compartido por los clientes de Redis."""
+    return {"data": redis_breaker.snapshot()}
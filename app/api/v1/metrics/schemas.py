@@ -0,0 +1,39 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class PoolStatsPublic(BaseModel):
+    name: Annotated[str, Field(description="Nombre del motor", examples=["primary"])]
+    pool_size: Annotated[int, Field(description="Tamaño configurado del pool")]
+    checked_out: Annotated[int, Field(description="Conexiones en uso")]
+    checked_in: Annotated[int, Field(description="Conexiones libres en el pool")]
+    overflow: Annotated[int, Field(description="Conexiones de overflow actuales")]
+    connections_created: Annotated[int, Field(description="Conexiones abiertas")]
+    checkouts: Annotated[int, Field(description="Conexiones entregadas")]
+    checkins: Annotated[int, Field(description="Conexiones devueltas")]
+    invalidations: Annotated[int, Field(description="Conexiones invalidadas")]
+    checkout_timeouts: Annotated[
+        int, Field(description="Esperas que superaron DB_POOL_TIMEOUT")
+    ]
+    wait_count: Annotated[int, Field(description="Solicitudes de conexión medidas")]
+    wait_total_ms: Annotated[float, Field(description="Tiempo total de espera (ms)")]
+    wait_avg_ms: Annotated[float, Field(description="Tiempo medio de espera (ms)")]
+    wait_max_ms: Annotated[float, Field(description="Tiempo máximo de espera (ms)")]
+
+
+class RedisStatsPublic(BaseModel):
+    state: Annotated[
+        str,
+        Field(
+            description="Estado del circuit breaker",
+            examples=["closed", "open", "half_open"],
+        ),
+    ]
+    consecutive_failures: Annotated[
+        int, Field(description="Fallos de conexión/timeout seguidos")
+    ]
+    trips: Annotated[int, Field(description="Veces que se abrió el circuito")]
+    rejected: Annotated[
+        int, Field(description="Operaciones rechazadas con el circuito abierto")
+    ]
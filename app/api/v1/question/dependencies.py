@@ -1,28 +1,46 @@
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.api.v1.question.schemas import QuestionType
 from app.core.config import settings
-from app.db.session import get_session
+from app.db.session import (
+    get_async_read_session,
+    get_async_session,
+    get_read_session,
+    get_session,
+)
+from app.domain.question.filters import QuestionFilters
 from app.infrastructure.gcp.storage_adapter import GCPStorageAdapter
 from app.ports.storage_port import StoragePort
 from app.repositories.area_repository import AreaRepository
+from app.repositories.async_question_repository import AsyncQuestionRepository
 from app.repositories.choice_repository import ChoiceRepository
 from app.repositories.institution_repository import InstitutionRepository
 from app.repositories.question_content_repository import QuestionContentRepository
 from app.repositories.question_repository import QuestionRepository
+from app.repositories.question_similarity_repository import (
+    QuestionSimilarityRepository,
+)
 from app.repositories.question_source_repository import QuestionSourceRepository
+from app.repositories.question_stats_repository import QuestionStatsRepository
 from app.repositories.solution_repository import SolutionRepository
 from app.repositories.source_repository import SourceRepository
 from app.services.area_service import AreaService
+from app.services.async_question_service import AsyncQuestionService
 from app.services.choice_service import ChoiceService
 from app.services.image_service import ImageService
 from app.services.institution_service import InstitutionService
 from app.services.question_content_service import QuestionContentService
+from app.services.question_export_service import QuestionExportService
 from app.services.question_guard_service import QuestionGuardService
 from app.services.question_service import QuestionService
+from app.services.question_similarity_service import QuestionSimilarityService
 from app.services.question_source_service import QuestionSourceService
+from app.services.question_stats_service import QuestionStatsService
 from app.services.solution_service import SolutionService
 from app.services.source_service import SourceService
 
@@ -32,6 +50,8 @@ def get_area_service(db: Annotated[Session, Depends(get_session)]):
     return AreaService(area_repository)
 
 
+# El cliente de GCS (credenciales incluidas) se reutiliza entre peticiones
+@lru_cache
 def get_gcp_storage():
     return GCPStorageAdapter()
 
@@ -55,18 +75,70 @@ def get_image_service(storage: Annotated[StoragePort, Depends(get_gcp_storage)])
     return ImageService(storage, settings.CONTAINER_NAME)
 
 
+def get_question_similarity_service(
+    db: Annotated[Session, Depends(get_session)],
+    background_tasks: BackgroundTasks,
+) -> QuestionSimilarityService:
+    similarity_repository = QuestionSimilarityRepository(db)
+    return QuestionSimilarityService(similarity_repository, background_tasks)
+
+
+def get_read_question_similarity_service(
+    db: Annotated[Session, Depends(get_read_session)],
+) -> QuestionSimilarityService:
+    similarity_repository = QuestionSimilarityRepository(db)
+    return QuestionSimilarityService(similarity_repository)
+
+
 def get_question_service(
     db: Annotated[Session, Depends(get_session)],
     area_service: Annotated[AreaService, Depends(get_area_service)],
     source_service: Annotated[SourceService, Depends(get_source_service)],
     image_service: Annotated[ImageService, Depends(get_image_service)],
+    similarity_service: Annotated[
+        QuestionSimilarityService, Depends(get_question_similarity_service)
+    ],
 ) -> QuestionService:
     question_repository = QuestionRepository(db)
     return QuestionService(
-        question_repository, area_service, source_service, image_service
+        question_repository,
+        area_service,
+        source_service,
+        image_service,
+        similarity_service,
     )
 
 
+def get_async_question_service(
+    db: Annotated[AsyncSession, Depends(get_async_session)],
+    image_service: Annotated[ImageService, Depends(get_image_service)],
+) -> AsyncQuestionService:
+    question_repository = AsyncQuestionRepository(db)
+    return AsyncQuestionService(question_repository, image_service)
+
+
+def get_async_read_question_service(
+    db: Annotated[AsyncSession, Depends(get_async_read_session)],
+    image_service: Annotated[ImageService, Depends(get_image_service)],
+) -> AsyncQuestionService:
+    """Servicio para endpoints GET: usa la réplica de lectura si está disponible."""
+    question_repository = AsyncQuestionRepository(db)
+    return AsyncQuestionService(question_repository, image_service)
+
+
+def get_question_export_service(
+    db: Annotated[Session, Depends(get_read_session)],
+) -> QuestionExportService:
+    question_repository = QuestionRepository(db)
+    return QuestionExportService(question_repository)
+
+
+def get_read_question_stats_service(
+    db: Annotated[Session, Depends(get_read_session)],
+) -> QuestionStatsService:
+    return QuestionStatsService(QuestionStatsRepository(db))
+
+
 def get_question_guard_service(
     db: Annotated[Session, Depends(get_session)],
 ) -> QuestionGuardService:
@@ -77,35 +149,29 @@ def get_question_guard_service(
 def get_choice_service(
     db: Annotated[Session, Depends(get_session)],
     image_service: Annotated[ImageService, Depends(get_image_service)],
-    question_guard_service: Annotated[
-        QuestionGuardService, Depends(get_question_guard_service)
-    ],
 ) -> ChoiceService:
     choice_repository = ChoiceRepository(db)
-    return ChoiceService(choice_repository, image_service, question_guard_service)
+    return ChoiceService(choice_repository, image_service)
 
 
 def get_solution_service(
     db: Annotated[Session, Depends(get_session)],
     image_service: Annotated[ImageService, Depends(get_image_service)],
-    question_guard_service: Annotated[
-        QuestionGuardService, Depends(get_question_guard_service)
-    ],
 ) -> SolutionService:
     solution_repository = SolutionRepository(db)
-    return SolutionService(solution_repository, image_service, question_guard_service)
+    return SolutionService(solution_repository, image_service)
 
 
 def get_question_content_service(
     db: Annotated[Session, Depends(get_session)],
     image_service: Annotated[ImageService, Depends(get_image_service)],
-    question_guard_service: Annotated[
-        QuestionGuardService, Depends(get_question_guard_service)
+    similarity_service: Annotated[
+        QuestionSimilarityService, Depends(get_question_similarity_service)
     ],
 ) -> QuestionContentService:
     question_content_repository = QuestionContentRepository(db)
     return QuestionContentService(
-        question_content_repository, image_service, question_guard_service
+        question_content_repository, image_service, similarity_service
     )
 
 
@@ -120,3 +186,49 @@ def get_question_source_service(
     return QuestionSourceService(
         question_source_repository, source_service, question_guard_service
     )
+
+
+def get_question_filters(
+    subtopic_id: Annotated[
+        int | None, Query(gt=0, description="Filtrar por ID de subtema")
+    ] = None,
+    topic_id: Annotated[
+        int | None, Query(gt=0, description="Filtrar por ID de tema")
+    ] = None,
+    course_id: Annotated[
+        int | None, Query(gt=0, description="Filtrar por ID de curso")
+    ] = None,
+    difficulty_id: Annotated[
+        int | None, Query(gt=0, description="Filtrar por ID de dificultad")
+    ] = None,
+    question_type_id: Annotated[
+        QuestionType | None, Query(description="Filtrar por tipo de pregunta")
+    ] = None,
+    area_codes: Annotated[
+        list[str] | None,
+        Query(
+            description="Filtrar por códigos de área (coincide con cualquiera)",
+            examples=[["A", "B"]],
+        ),
+    ] = None,
+    source_id: Annotated[
+        int | None, Query(gt=0, description="Filtrar por ID de fuente")
+    ] = None,
+    year: Annotated[
+        int | None, Query(ge=1900, le=2100, description="Filtrar por año de la fuente")
+    ] = None,
+) -> QuestionFilters:
+    return QuestionFilters(
+        subtopic_id=subtopic_id,
+        topic_id=topic_id,
+        course_id=course_id,
+        difficulty_id=difficulty_id,
+        question_type_id=(
+            int(question_type_id) if question_type_id is not None else None
+        ),
+        area_codes=tuple(
+            sorted({code.strip().upper() for code in area_codes or [] if code.strip()})
+        ),
+        source_id=source_id,
+        year=year,
+    )
@@ -1,24 +1,45 @@
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Body, Depends, Path, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from app.api.v1.choice.schemas import ChoicePublic, ChoiceUpdateInput
 from app.api.v1.question.dependencies import (
+    get_async_question_service,
+    get_async_read_question_service,
     get_choice_service,
     get_question_content_service,
+    get_question_export_service,
+    get_question_filters,
     get_question_service,
     get_question_source_service,
+    get_read_question_similarity_service,
+    get_read_question_stats_service,
     get_solution_service,
 )
 from app.api.v1.question.schemas import (
+    ExamBlueprintInput,
     QuestionAreasSpecificUpdate,
+    QuestionBulkCreateResponse,
+    QuestionBulkItemResult,
+    QuestionBulkItemStatus,
     QuestionCreateInput,
     QuestionCreateResponse,
     QuestionDetailPublic,
     QuestionDifficultySpecificUpdate,
+    QuestionDuplicateCheckInput,
+    QuestionDuplicateCheckResult,
+    QuestionReclassifyInput,
+    QuestionReclassifyResponse,
+    QuestionSolveResponse,
+    QuestionStatsRow,
     QuestionSubtopicSpecificUpdate,
     QuestionSummaryPublic,
+    QuestionType,
     QuestionTypeSpecificUpdate,
+    SimilarQuestionPublic,
 )
 from app.api.v1.question_content.schemas import (
     QuestionContentResponse,
@@ -28,13 +49,21 @@ from app.api.v1.question_source.schemas import (
     QuestionSourceUpdateInput,
 )
 from app.api.v1.solution.schemas import SolutionPublic, SolutionUpdateInput
+from app.core.config import settings
+from app.core.exceptions.base import DomainException
+from app.domain.question.filters import QuestionFilters
 from app.helpers.build_paginated import build_paginated_response
+from app.helpers.ndjson import iter_ndjson_lines
 from app.schemas.pagination import PaginationMeta
 from app.schemas.response import ApiResponse
+from app.services.async_question_service import AsyncQuestionService
 from app.services.choice_service import ChoiceService
 from app.services.question_content_service import QuestionContentService
-from app.services.question_service import QuestionService
+from app.services.question_export_service import QuestionExportService
+from app.services.question_service import QuestionService, build_bulk_response
+from app.services.question_similarity_service import QuestionSimilarityService
 from app.services.question_source_service import QuestionSourceService
+from app.services.question_stats_service import QuestionStatsService
 from app.services.solution_service import SolutionService
 
 question_router = APIRouter(tags=["Question"])
@@ -46,17 +75,200 @@ question_router = APIRouter(tags=["Question"])
     status_code=status.HTTP_201_CREATED,
     summary="Crear pregunta",
 )
-async def add_question(
+def add_question(
         service: Annotated[QuestionService, Depends(get_question_service)],
         question: QuestionCreateInput,
 ):
     """Endpoint para crear una nueva pregunta."""
 
-    return await service.create_question(
+    # ``def``: FastAPI lo ejecuta en el threadpool (ORM, Redis y MinHash bloquean)
+    return service.create_question(
         question=question,
     )
 
 
+@question_router.post(
+    "/bulk",
+    response_model=ApiResponse[QuestionBulkCreateResponse],
+    summary="Crear preguntas en lote",
+)
+def add_questions_bulk(
+        service: Annotated[QuestionService, Depends(get_question_service)],
+        questions: Annotated[
+            list[QuestionCreateInput],
+            Body(min_length=1, max_length=settings.BULK_IMPORT_MAX_ITEMS),
+        ],
+):
+    """
+    Crea varias preguntas en una sola transacción.
+
+    Las preguntas duplicadas (mismo hash) o con áreas/fuentes inexistentes se omiten
+    y se informan en `items` con su posición, sin abortar el resto del lote.
+
+    Las preguntas casi duplicadas (`similar_questions`) solo se informan en lotes de
+    hasta `SIMILARITY_INLINE_MAX_ITEMS`; los mayores se indexan tras la respuesta.
+    """
+    return {"data": service.create_questions_bulk(questions)}
+
+
+@question_router.patch(
+    "/bulk",
+    response_model=ApiResponse[QuestionReclassifyResponse],
+    summary="Reclasificar preguntas en lote",
+)
+def reclassify_questions_bulk(
+        service: Annotated[QuestionService, Depends(get_question_service)],
+        payload: QuestionReclassifyInput,
+):
+    """
+    Cambia el subtema, la dificultad, el tipo y/o las áreas de varias preguntas en
+    una sola transacción (sentencias por conjunto, no una por pregunta).
+
+    Las áreas se agregan (`add_area_ids`) o quitan (`remove_area_ids`) sin
+    reemplazar las demás. Cada ID se informa en `items` como `updated`,
+    `unchanged`, `not_found` o `invalid` (se quedaría sin áreas; no se modifica).
+    """
+    return {"data": service.reclassify_questions(payload)}
+
+
+@question_router.post(
+    "/bulk/ndjson",
+    response_model=ApiResponse[QuestionBulkCreateResponse],
+    summary="Crear preguntas en lote desde NDJSON",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def add_questions_bulk_ndjson(
+        service: Annotated[QuestionService, Depends(get_question_service)],
+        request: Request,
+):
+    """
+    Crea preguntas a partir de un cuerpo NDJSON (una pregunta por línea) que se
+    procesa a medida que llega, en lotes de `BULK_IMPORT_BATCH_SIZE` preguntas por
+    transacción.
+
+    Las líneas inválidas (JSON o UTF-8 inválido, o de más de
+    `BULK_IMPORT_MAX_LINE_BYTES` bytes) se informan con su posición (sin contar
+    líneas vacías).
+    Los lotes mayores que `SIMILARITY_INLINE_MAX_ITEMS` se indexan para similitud
+    tras la respuesta, sin `similar_questions`.
+    """
+    results: list[QuestionBulkItemResult] = []
+    batch: list[QuestionCreateInput] = []
+    batch_indexes: list[int] = []
+
+    async def flush():
+        response = await run_in_threadpool(
+            service.create_questions_bulk, list(batch), list(batch_indexes)
+        )
+        results.extend(response.items)
+        batch.clear()
+        batch_indexes.clear()
+
+    index = -1
+    async for line in iter_ndjson_lines(
+            request.stream(), settings.BULK_IMPORT_MAX_LINE_BYTES
+    ):
+        index += 1
+        if line is None:
+            results.append(
+                QuestionBulkItemResult(
+                    index=index,
+                    status=QuestionBulkItemStatus.INVALID,
+                    message=(
+                        "Línea de más de "
+                        f"{settings.BULK_IMPORT_MAX_LINE_BYTES} bytes"
+                    ),
+                )
+            )
+            continue
+
+        try:
+            question = QuestionCreateInput.model_validate_json(line)
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"])
+            results.append(
+                QuestionBulkItemResult(
+                    index=index,
+                    status=QuestionBulkItemStatus.INVALID,
+                    message=f"{location}: {error['msg']}" if location else error["msg"],
+                )
+            )
+            continue
+        except DomainException as e:
+            results.append(
+                QuestionBulkItemResult(
+                    index=index,
+                    status=QuestionBulkItemStatus.INVALID,
+                    message=e.message,
+                )
+            )
+            continue
+
+        batch.append(question)
+        batch_indexes.append(index)
+        if len(batch) >= settings.BULK_IMPORT_BATCH_SIZE:
+            await flush()
+
+    if batch:
+        await flush()
+
+    results.sort(key=lambda item: item.index)
+    return {"data": build_bulk_response(results)}
+
+
+@question_router.post(
+    "/check-duplicates",
+    response_model=ApiResponse[list[QuestionDuplicateCheckResult]],
+    summary="Verificar preguntas duplicadas",
+)
+def check_duplicate_questions(
+        service: Annotated[QuestionService, Depends(get_question_service)],
+        candidates: Annotated[
+            list[QuestionDuplicateCheckInput],
+            Body(min_length=1, max_length=settings.DUPLICATE_CHECK_MAX_ITEMS),
+        ],
+):
+    """
+    Verifica en lote si las preguntas candidatas ya existen, a partir solo de su
+    contenido (el mismo criterio que usa la creación para detectar duplicados).
+
+    Permite que un importador omita los duplicados sin enviar las preguntas completas.
+    """
+    return {"data": service.check_duplicates(candidates)}
+
+
+@question_router.post(
+    "/exam",
+    response_model=ApiResponse[list[QuestionSolveResponse]],
+    summary="Generar simulacro",
+)
+async def generate_exam(
+        service: Annotated[
+            AsyncQuestionService, Depends(get_async_read_question_service)
+        ],
+        blueprint: ExamBlueprintInput,
+):
+    """
+    Genera un simulacro con preguntas al azar según las cuotas de cada sección
+    (curso, tema o subtema y dificultad), limitado a las áreas indicadas.
+
+    - Una pregunta no se repite entre secciones.
+    - `exclude_hashes` permite omitir preguntas ya resueltas (usar `question_hash`
+      de la respuesta).
+    - Si alguna sección no tiene preguntas suficientes se responde con error 422.
+
+    Cada pregunta incluye su enunciado y alternativas (sin soluciones).
+    """
+    questions = await service.generate_exam(blueprint)
+    return {"data": questions}
+
+
 @question_router.get(
     "",
     response_model=ApiResponse[
@@ -64,8 +276,11 @@ async def add_question(
     ],
     summary="Listar preguntas",
 )
-def get_questions(
-        service: Annotated[QuestionService, Depends(get_question_service)],
+async def get_questions(
+        service: Annotated[
+            AsyncQuestionService, Depends(get_async_read_question_service)
+        ],
+        filters: Annotated[QuestionFilters, Depends(get_question_filters)],
         page: Annotated[int, Query(ge=1, description="Página actual")] = 1,
         limit: Annotated[
             int, Query(ge=1, le=100, description="Cantidad de preguntas por página")
@@ -74,16 +289,205 @@ def get_questions(
             Literal["summary", "full"],
             Query(description="Nivel de detalle de la pregunta."),
         ] = "full",
+        cursor: Annotated[
+            str | None,
+            Query(
+                description=(
+                    "Cursor devuelto en `meta.next_cursor`. Si se envía, se ignora "
+                    "`page`."
+                )
+            ),
+        ] = None,
+        include_total: Annotated[
+            bool,
+            Query(
+                description=(
+                    "Calcular `meta.total` y `meta.pages`. Con `false` se omite el "
+                    "conteo; usar `meta.has_next` para saber si hay más páginas."
+                )
+            ),
+        ] = True,
 ):
     """
-    Este endpoint recupera preguntas de la base de datos con soporte para paginación.
+    Este endpoint recupera preguntas de la base de datos con soporte para paginación
+    y filtros.
+
+    Filtros (opcionales, se combinan con AND):
+    - `subtopic_id`, `topic_id`, `course_id`: Clasificación temática.
+    - `difficulty_id`, `question_type_id`: Dificultad y tipo de pregunta.
+    - `area_codes`: Una o más áreas (basta con que coincida una).
+    - `source_id`, `year`: Fuente y año de la fuente.
+
+    Paginación:
+    - `page`: Paginación por número de página (OFFSET).
+    - `cursor`: Paginación por cursor (keyset); el costo es el mismo en cualquier
+      página. Usar el valor de `meta.next_cursor` de la respuesta anterior.
+
+    - `include_total=false`: Omite el conteo total (más rápido, p. ej. para scroll
+      infinito); `meta.has_next` indica si hay más resultados.
 
     Nivel de detalle (view):
     - `summary`: Versión resumida que no incluye alternativas ni solución.
     - `full`: Versión completa que incluye toda la información disponible.
     """
-    items, total = service.get_all_questions(page=page, limit=limit, view=view)
-    return build_paginated_response(items=items, total=total, page=page, limit=limit)
+    items, total, next_cursor = await service.get_all_questions(
+        page=page,
+        limit=limit,
+        view=view,
+        cursor=cursor,
+        filters=filters,
+        include_total=include_total,
+    )
+    # Los documentos ya tienen la forma de ``response_model`` (armados en
+    # PostgreSQL): se responden directamente, sin volver a validarlos
+    return JSONResponse(
+        build_paginated_response(
+            items=items,
+            total=total,
+            page=page if cursor is None else None,
+            limit=limit,
+            next_cursor=next_cursor,
+            has_next=next_cursor is not None,
+        )
+    )
+
+
+@question_router.get(
+    "/search",
+    response_model=ApiResponse[
+        list[QuestionSummaryPublic | QuestionDetailPublic], PaginationMeta
+    ],
+    summary="Buscar preguntas",
+)
+async def search_questions(
+        service: Annotated[
+            AsyncQuestionService, Depends(get_async_read_question_service)
+        ],
+        filters: Annotated[QuestionFilters, Depends(get_question_filters)],
+        q: Annotated[
+            str,
+            Query(
+                min_length=2,
+                max_length=200,
+                description="Texto a buscar",
+                examples=['"ecuación cuadrática" -discriminante'],
+            ),
+        ],
+        page: Annotated[int, Query(ge=1, description="Página actual")] = 1,
+        limit: Annotated[
+            int, Query(ge=1, le=100, description="Cantidad de preguntas por página")
+        ] = 15,
+        view: Annotated[
+            Literal["summary", "full"],
+            Query(description="Nivel de detalle de la pregunta."),
+        ] = "full",
+        include_total: Annotated[
+            bool,
+            Query(
+                description=(
+                    "Calcular `meta.total` y `meta.pages`. Con `false` se omite el "
+                    "conteo; usar `meta.has_next` para saber si hay más páginas."
+                )
+            ),
+        ] = True,
+):
+    """
+    Búsqueda de texto completo en el enunciado, las alternativas y las soluciones.
+
+    No distingue mayúsculas ni tildes y reconoce variaciones de las palabras
+    (configuración en español). Admite la sintaxis de buscadores web: `"frase
+    exacta"`, `-excluir` y `OR`.
+
+    Los resultados se ordenan por relevancia (el enunciado pesa más que las
+    alternativas, y estas más que las soluciones). Acepta los mismos filtros y
+    niveles de detalle (`view`) que el listado de preguntas.
+    """
+    items, total, has_next = await service.search_questions(
+        query=q,
+        page=page,
+        limit=limit,
+        view=view,
+        filters=filters,
+        include_total=include_total,
+    )
+    return JSONResponse(
+        build_paginated_response(
+            items=items, total=total, page=page, limit=limit, has_next=has_next
+        )
+    )
+
+
+@question_router.get(
+    "/stats",
+    response_model=ApiResponse[list[QuestionStatsRow]],
+    summary="Conteo de preguntas por taxonomía",
+)
+def get_question_stats(
+        service: Annotated[
+            QuestionStatsService, Depends(get_read_question_stats_service)
+        ],
+        group_by: Annotated[
+            list[
+                Literal[
+                    "course", "topic", "subtopic", "difficulty", "question_type", "area"
+                ]
+            ],
+            Query(description="Dimensiones por las que se agrupa el conteo"),
+        ] = ["course"],
+        course_id: Annotated[int | None, Query(gt=0)] = None,
+        topic_id: Annotated[int | None, Query(gt=0)] = None,
+        subtopic_id: Annotated[int | None, Query(gt=0)] = None,
+        difficulty_id: Annotated[int | None, Query(gt=0)] = None,
+        question_type_id: Annotated[QuestionType | None, Query()] = None,
+        area_codes: Annotated[list[str] | None, Query()] = None,
+):
+    """
+    Cantidad de preguntas agrupada por curso, tema, subtema, dificultad, tipo y/o
+    área, con filtros opcionales sobre las mismas dimensiones.
+
+    Los conteos están precalculados (se actualizan con cada escritura), por lo que
+    la consulta no recorre la tabla de preguntas. Al agrupar o filtrar por área,
+    una pregunta con varias áreas cuenta una vez en cada una.
+    """
+    stats = service.get_stats(
+        group_by=list(dict.fromkeys(group_by)),
+        course_id=course_id,
+        topic_id=topic_id,
+        subtopic_id=subtopic_id,
+        difficulty_id=difficulty_id,
+        question_type_id=(
+            int(question_type_id) if question_type_id is not None else None
+        ),
+        area_codes=tuple(
+            sorted({code.strip().upper() for code in area_codes or [] if code.strip()})
+        ),
+    )
+    return {"data": stats}
+
+
+@question_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    summary="Exportar preguntas (NDJSON)",
+)
+def export_questions(
+        service: Annotated[QuestionExportService, Depends(get_question_export_service)],
+        filters: Annotated[QuestionFilters, Depends(get_question_filters)],
+):
+    """
+    Exporta las preguntas completas (contenidos, alternativas, soluciones, áreas y
+    fuentes) en formato NDJSON, una pregunta por línea.
+
+    La respuesta se envía a medida que se lee la base de datos, por lo que el uso de
+    memoria no depende del tamaño del banco. Acepta los mismos filtros que el listado.
+    Las imágenes se exportan con el nombre del objeto, sin firmar.
+    """
+    return StreamingResponse(
+        service.export_ndjson(filters=filters),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="questions.ndjson"'},
+    )
 
 
 @question_router.get(
@@ -91,8 +495,10 @@ def get_questions(
     response_model=ApiResponse[QuestionSummaryPublic | QuestionDetailPublic],
     summary="Obtener una pregunta",
 )
-def get_question(
-        service: Annotated[QuestionService, Depends(get_question_service)],
+async def get_question(
+        service: Annotated[
+            AsyncQuestionService, Depends(get_async_read_question_service)
+        ],
         question_id: Annotated[int, Path(ge=1, description="ID de la pregunta")],
         view: Annotated[
             Literal["summary", "full"],
@@ -106,10 +512,62 @@ def get_question(
     - `summary`: Versión resumida que no incluye alternativas ni solución.
     - `full`: Versión completa que incluye toda la información disponible.
     """
-    question = service.get_question(question_id=question_id, view=view)
+    question = await service.get_question(question_id=question_id, view=view)
     return {"data": question}
 
 
+@question_router.get(
+    "/{question_id}/similar",
+    response_model=ApiResponse[list[SimilarQuestionPublic]],
+    summary="Preguntas similares",
+)
+def get_similar_questions(
+        service: Annotated[
+            QuestionSimilarityService, Depends(get_read_question_similarity_service)
+        ],
+        question_id: Annotated[int, Path(ge=1, description="ID de la pregunta")],
+        limit: Annotated[
+            int, Query(ge=1, le=50, description="Cantidad máxima de resultados")
+        ] = 10,
+        min_similarity: Annotated[
+            float,
+            Query(gt=0, le=1, description="Similitud mínima (Jaccard estimada)"),
+        ] = settings.SIMILARITY_MIN_SCORE,
+):
+    """
+    Preguntas casi duplicadas de una pregunta: mismo texto salvo tildes, signos de
+    puntuación, espacios o pequeñas reformulaciones.
+
+    Usa firmas MinHash e índices LSH, por lo que no compara contra todo el banco.
+    Con `min_similarity` por debajo de ~0.5 pueden omitirse coincidencias, ya que el
+    LSH solo propone candidatos con alta probabilidad de superar ~0.7.
+    """
+    similar = service.get_similar_questions(
+        question_id=question_id, limit=limit, min_similarity=min_similarity
+    )
+    return {"data": similar}
+
+
+@question_router.put(
+    "/{question_id}",
+    response_model=QuestionCreateResponse,
+    summary="Reemplazar pregunta",
+)
+def replace_question(
+        service: Annotated[QuestionService, Depends(get_question_service)],
+        question_id: Annotated[int, Path(ge=1, description="ID de la pregunta")],
+        question: QuestionCreateInput,
+):
+    """
+    Reemplaza una pregunta completa con el mismo documento que la creación.
+
+    Se guardan solo las diferencias, en una transacción. Los contenidos se
+    emparejan por `order`, las alternativas por `label`, las soluciones por
+    posición y las fuentes por `source_id`.
+    """
+    return service.replace_question(question_id=question_id, question=question)
+
+
 @question_router.patch(
     "/{question_id}/question-type",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -251,10 +709,10 @@ def update_solution(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Eliminar una pregunta",
 )
-def delete_question(
-        service: Annotated[QuestionService, Depends(get_question_service)],
+async def delete_question(
+        service: Annotated[AsyncQuestionService, Depends(get_async_question_service)],
         question_id: Annotated[int, Path(ge=1, description="ID de la pregunta")],
 ):
     """Elimina una pregunta por su ID."""
-    service.delete_question(question_id=question_id)
+    await service.delete_question(question_id=question_id)
     return None
@@ -1,7 +1,7 @@
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 from typing import Annotated, List
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.api.v1.choice.schemas import ChoiceCreateInput, ChoicePublic
 from app.api.v1.difficulty.schemas import DifficultyPublic
@@ -16,6 +16,7 @@ from app.api.v1.question_source.schemas import (
 from app.api.v1.question_type.schemas import QuestionTypeCodeOnly
 from app.api.v1.solution.schemas import SolutionCreateInput, SolutionPublic
 from app.api.v1.subtopic.schemas import SubtopicSimplePublic
+from app.core.config import settings
 from app.core.exceptions.domain import (
     DuplicateChoiceContentError,
     MultipleCorrectChoicesError,
@@ -149,6 +150,87 @@ class QuestionAreasSpecificUpdate(BaseModel):
     ]
 
 
+class QuestionReclassifyInput(BaseModel):
+    question_ids: Annotated[
+        List[int],
+        Field(
+            min_length=1,
+            max_length=settings.BULK_RECLASSIFY_MAX_ITEMS,
+            description="IDs de las preguntas a reclasificar",
+            examples=[[1, 2, 3]],
+        ),
+    ]
+    subtopic_id: Annotated[
+        int | None, Field(default=None, gt=0, description="Nuevo subtema")
+    ]
+    difficulty_id: Annotated[
+        int | None, Field(default=None, gt=0, description="Nueva dificultad")
+    ]
+    question_type_id: Annotated[
+        QuestionType | None, Field(default=None, description="Nuevo tipo")
+    ]
+    add_area_ids: Annotated[
+        List[int],
+        Field(default_factory=list, description="Áreas a agregar", examples=[[1]]),
+    ]
+    remove_area_ids: Annotated[
+        List[int],
+        Field(default_factory=list, description="Áreas a quitar", examples=[[2]]),
+    ]
+
+    @model_validator(mode="after")
+    def validate_changes(self):
+        if not (
+            self.subtopic_id
+            or self.difficulty_id
+            or self.question_type_id
+            or self.add_area_ids
+            or self.remove_area_ids
+        ):
+            raise ValueError("Debe indicarse al menos un cambio")
+
+        repeated = set(self.add_area_ids) & set(self.remove_area_ids)
+        if repeated:
+            raise ValueError(
+                f"Áreas a agregar y a quitar a la vez: {sorted(repeated)}"
+            )
+
+        return self
+
+    def field_updates(self) -> dict:
+        """Columnas de ``questions`` a modificar (las indicadas en la petición)"""
+        return self.model_dump(
+            include={"subtopic_id", "difficulty_id", "question_type_id"},
+            exclude_none=True,
+        )
+
+
+class QuestionReclassifyItemStatus(StrEnum):
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    NOT_FOUND = "not_found"
+    INVALID = "invalid"
+
+
+class QuestionReclassifyItemResult(BaseModel):
+    id: Annotated[int, Field(description="ID de la pregunta")]
+    status: Annotated[QuestionReclassifyItemStatus, Field(description="Resultado")]
+
+
+class QuestionReclassifyResponse(BaseModel):
+    updated: Annotated[int, Field(description="Preguntas modificadas")]
+    unchanged: Annotated[
+        int, Field(description="Preguntas que ya tenían la clasificación pedida")
+    ]
+    not_found: Annotated[int, Field(description="IDs inexistentes")]
+    invalid: Annotated[
+        int, Field(description="Preguntas omitidas por quedar sin áreas")
+    ]
+    items: Annotated[
+        list[QuestionReclassifyItemResult], Field(description="Resultado por ID")
+    ]
+
+
 class QuestionAreasSectionResponse(BaseModel):
     id: int
     areas: list[str]
@@ -173,6 +255,13 @@ class QuestionAreasSectionResponse(BaseModel):
 
 # PÚBLICO
 # Para estudio / banco
+class SimilarQuestionPublic(BaseModel):
+    id: Annotated[int, Field(description="ID de la pregunta similar")]
+    similarity: Annotated[
+        float, Field(description="Similitud de Jaccard estimada (0 a 1)")
+    ]
+
+
 class QuestionCreateResponse(BaseModel):
     id: int
     question_type: QuestionTypeCodeOnly
@@ -189,6 +278,13 @@ class QuestionCreateResponse(BaseModel):
             description="Fuentes asociadas a la pregunta",
         ),
     ]
+    similar_questions: Annotated[
+        list[SimilarQuestionPublic],
+        Field(
+            default_factory=list,
+            description="Preguntas existentes casi idénticas (advertencia)",
+        ),
+    ]
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -280,6 +376,78 @@ class QuestionDetailPublic(BaseModel):
         return out
 
 
+class QuestionExportRecord(QuestionDetailPublic):
+    """Pregunta completa para exportación (las imágenes van sin firmar)."""
+
+    question_hash: str
+    question_type_id: int
+
+
+class QuestionBulkItemStatus(StrEnum):
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+class QuestionBulkItemResult(BaseModel):
+    index: Annotated[int, Field(description="Posición de la pregunta en el lote")]
+    status: Annotated[QuestionBulkItemStatus, Field(description="Resultado")]
+    id: Annotated[
+        int | None, Field(default=None, description="ID de la pregunta creada")
+    ]
+    question_hash: Annotated[
+        str | None, Field(default=None, description="Hash de la pregunta")
+    ]
+    message: Annotated[
+        str | None, Field(default=None, description="Detalle del resultado")
+    ]
+    similar_questions: Annotated[
+        list[SimilarQuestionPublic],
+        Field(
+            default_factory=list,
+            description=(
+                "Preguntas existentes casi idénticas (advertencia); vacío en "
+                "lotes indexados en segundo plano"
+            ),
+        ),
+    ]
+
+
+class QuestionBulkCreateResponse(BaseModel):
+    created: Annotated[int, Field(description="Preguntas creadas")]
+    duplicates: Annotated[int, Field(description="Preguntas duplicadas omitidas")]
+    invalid: Annotated[int, Field(description="Preguntas inválidas omitidas")]
+    items: Annotated[
+        list[QuestionBulkItemResult], Field(description="Resultado por pregunta")
+    ]
+
+
+class QuestionDuplicateCheckInput(BaseModel):
+    contents: Annotated[
+        list[QuestionContentCreateInput],
+        Field(min_length=1, description="Contenido de la pregunta candidata"),
+    ]
+
+
+class QuestionDuplicateCheckResult(BaseModel):
+    index: Annotated[int, Field(description="Posición del candidato en la petición")]
+    question_hash: Annotated[str, Field(description="Hash de la pregunta")]
+    exists: Annotated[bool, Field(description="Si la pregunta ya existe")]
+    question_id: Annotated[
+        int | None, Field(default=None, description="ID de la pregunta existente")
+    ]
+
+
+class QuestionStatsRow(BaseModel):
+    course_id: int | None = None
+    topic_id: int | None = None
+    subtopic_id: int | None = None
+    difficulty_id: int | None = None
+    question_type_id: int | None = None
+    area_code: str | None = None
+    count: Annotated[int, Field(description="Cantidad de preguntas")]
+
+
 # Para simulacros exámenes
 class QuestionSolveResponse(BaseModel):
     id: int
@@ -288,3 +456,63 @@ class QuestionSolveResponse(BaseModel):
     choices: List[ChoicePublic]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ExamSectionInput(BaseModel):
+    count: Annotated[
+        int, Field(ge=1, le=100, description="Cantidad de preguntas de la sección")
+    ]
+    course_id: Annotated[int | None, Field(default=None, gt=0, examples=[1])]
+    topic_id: Annotated[int | None, Field(default=None, gt=0, examples=[None])]
+    subtopic_id: Annotated[int | None, Field(default=None, gt=0, examples=[None])]
+    difficulty_id: Annotated[
+        int | None,
+        Field(
+            default=None,
+            gt=0,
+            description=(
+                "Dificultad de la sección. Para mezclar dificultades se usan varias "
+                "secciones con el mismo curso/tema y distinta dificultad."
+            ),
+        ),
+    ]
+
+
+class ExamBlueprintInput(BaseModel):
+    sections: Annotated[
+        list[ExamSectionInput],
+        Field(min_length=1, max_length=50, description="Cuotas del examen"),
+    ]
+    area_codes: Annotated[
+        list[str],
+        Field(
+            default_factory=list,
+            description="Áreas admitidas (basta con que coincida una)",
+            examples=[["A", "B"]],
+        ),
+    ]
+    exclude_hashes: Annotated[
+        list[str],
+        Field(
+            default_factory=list,
+            max_length=5000,
+            description="Hashes de preguntas ya vistas que no deben repetirse",
+        ),
+    ]
+    shuffle: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Mezclar el orden (si no, las preguntas van por sección)",
+        ),
+    ]
+
+    @model_validator(mode="after")
+    def validate_total(self):
+        total = sum(section.count for section in self.sections)
+        if total > settings.EXAM_MAX_QUESTIONS:
+            raise ValueError(
+                f"El examen no puede tener más de {settings.EXAM_MAX_QUESTIONS} "
+                f"preguntas (se pidieron {total})"
+            )
+        return self
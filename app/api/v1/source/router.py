@@ -8,7 +8,7 @@ from app.api.v1.source.schemas import (
     SourcePublic,
     SourceUpdate,
 )
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
 from app.helpers.build_paginated import build_paginated_response
 from app.schemas.pagination import PaginationMeta
 from app.schemas.response import ApiResponse
@@ -33,6 +33,12 @@ def get_source_service(
     return SourceService(source_repository, institution_service)
 
 
+def get_read_source_service(db: Annotated[Session, Depends(get_read_session)]):
+    """Servicio para endpoints GET: usa la réplica de lectura si está disponible."""
+    source_repository = SourceRepository(db)
+    return SourceService(source_repository)
+
+
 @source_router.post(
     "",
     response_model=ApiResponse[SourcePublic],
@@ -53,14 +59,25 @@ def add_source(
     summary="Listar fuentes",
 )
 def read_sources(
-    service: Annotated[SourceService, Depends(get_source_service)],
+    service: Annotated[SourceService, Depends(get_read_source_service)],
     page: Annotated[int, Query(ge=1, description="Número de página")] = 1,
     limit: Annotated[
     int, Query(ge=1, le=100, description="Cantidad de elementos por página")
     ] = 50,
+        include_total: Annotated[
+            bool,
+            Query(
+                description=(
+                    "Calcular `meta.total` y `meta.pages`. Con `false` se omite el "
+                    "conteo; usar `meta.has_next` para saber si hay más páginas."
+                )
+            ),
+        ] = True,
 ):
-    items, total = service.get_sources(page, limit)
-    return build_paginated_response(items=items, total=total, page=page, limit=limit)
+    items, total, has_next = service.get_sources(page, limit, include_total)
+    return build_paginated_response(
+        items=items, total=total, page=page, limit=limit, has_next=has_next
+    )
 
 
 @source_router.get(
@@ -69,7 +86,7 @@ def read_sources(
     summary="Obtener una fuente por ID",
 )
 def read_source(
-    service: Annotated[SourceService, Depends(get_source_service)],
+    service: Annotated[SourceService, Depends(get_read_source_service)],
     source_id: Annotated[int, Path(ge=1, description="ID de la fuente")],
 ):
     source = service.get_source(source_id)
@@ -8,7 +8,7 @@ from app.api.v1.subtopic.schemas import (
     SubtopicPublic,
     SubtopicUpdate,
 )
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
 from app.helpers.build_paginated import build_paginated_response
 from app.schemas.pagination import PaginationMeta
 from app.schemas.response import ApiResponse
@@ -34,6 +34,12 @@ def get_subtopic_service(
     return SubtopicService(subtopic_repository, topic_service)
 
 
+def get_read_subtopic_service(db: Annotated[Session, Depends(get_read_session)]):
+    """Servicio para endpoints GET: usa la réplica de lectura si está disponible."""
+    subtopic_repository = SubtopicRepository(db)
+    return SubtopicService(subtopic_repository, TopicService(TopicRepository(db)))
+
+
 @subtopic_router.post(
     "",
     response_model=ApiResponse[SubtopicPublic],
@@ -55,15 +61,26 @@ def add_subtopic(
     summary="Lista de subtemas",
 )
 def read_subtopics(
-        service: Annotated[SubtopicService, Depends(get_subtopic_service)],
+        service: Annotated[SubtopicService, Depends(get_read_subtopic_service)],
         page: Annotated[int, Query(ge=1, description="Número de página")] = 1,
         limit: Annotated[
             int, Query(ge=1, le=100, description="Cantidad de elementos por página")
         ] = 100,
+        include_total: Annotated[
+            bool,
+            Query(
+                description=(
+                    "Calcular `meta.total` y `meta.pages`. Con `false` se omite el "
+                    "conteo; usar `meta.has_next` para saber si hay más páginas."
+                )
+            ),
+        ] = True,
 ):
     """Recupera una lista de subtemas con soporte de paginación."""
-    items, total = service.get_subtopics(page, limit)
-    return build_paginated_response(items=items, total=total, page=page, limit=limit)
+    items, total, has_next = service.get_subtopics(page, limit, include_total)
+    return build_paginated_response(
+        items=items, total=total, page=page, limit=limit, has_next=has_next
+    )
 
 
 @subtopic_router.get(
@@ -72,7 +89,7 @@ def read_subtopics(
     summary="Obtener un subtema por ID",
 )
 def read_subtopic(
-        service: Annotated[SubtopicService, Depends(get_subtopic_service)],
+        service: Annotated[SubtopicService, Depends(get_read_subtopic_service)],
         subtopic_id: Annotated[int, Path(ge=1, description="ID del subtema")],
 ):
     """
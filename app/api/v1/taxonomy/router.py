@@ -0,0 +1,50 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.v1.taxonomy.schemas import TaxonomyPublic
+from app.db.session import get_session
+from app.repositories.taxonomy_repository import TaxonomyRepository
+from app.schemas.response import ApiResponse
+from app.services.taxonomy_service import TaxonomyService
+
+taxonomy_router = APIRouter(tags=["Taxonomy"])
+
+
+# Inyección de Dependencia
+def get_taxonomy_service(db: Annotated[Session, Depends(get_session)]):
+    # Primario y no réplica: un snapshot leído con retraso quedaría marcado con la
+    # versión nueva hasta el próximo cambio. La sesión solo se usa al reconstruirlo
+    return TaxonomyService(TaxonomyRepository(db))
+
+
+@taxonomy_router.get(
+    "",
+    response_model=ApiResponse[TaxonomyPublic],
+    summary="Árbol de la taxonomía",
+)
+def read_taxonomy(
+        service: Annotated[TaxonomyService, Depends(get_taxonomy_service)],
+        if_none_match: Annotated[str | None, Header()] = None,
+):
+    """
+    Devuelve en una sola respuesta el árbol curso → tema → subtema, junto con las
+    áreas, dificultades y tipos de pregunta, para armar selectores y filtros.
+
+    La respuesta se sirve desde memoria y se reconstruye solo cuando cambia la
+    taxonomía. Incluye un `ETag`: con `If-None-Match` se responde `304` si no hubo
+    cambios.
+    """
+    snapshot = service.get_taxonomy()
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+
+    if if_none_match and snapshot.etag in {
+        tag.strip() for tag in if_none_match.split(",")
+    }:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Ya serializado en el snapshot: se entrega tal cual
+    return Response(
+        content=snapshot.body, media_type="application/json", headers=headers
+    )
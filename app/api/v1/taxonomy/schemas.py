@@ -0,0 +1,53 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class TaxonomySubtopic(BaseModel):
+    id: Annotated[int, Field(description="ID del subtema", examples=[1])]
+    name: Annotated[
+        str,
+        Field(description="Nombre del subtema", examples=["Los Organelos Celulares"]),
+    ]
+
+
+class TaxonomyTopic(BaseModel):
+    id: Annotated[int, Field(description="ID del tema", examples=[1])]
+    name: Annotated[str, Field(description="Nombre del tema", examples=["La célula"])]
+    subtopics: Annotated[
+        list[TaxonomySubtopic], Field(description="Subtemas del tema")
+    ]
+
+
+class TaxonomyCourse(BaseModel):
+    id: Annotated[int, Field(description="ID del curso", examples=[1])]
+    name: Annotated[str, Field(description="Nombre del curso", examples=["Biología"])]
+    code: Annotated[str, Field(description="Código del curso", examples=["BI"])]
+    topics: Annotated[list[TaxonomyTopic], Field(description="Temas del curso")]
+
+
+class TaxonomyReference(BaseModel):
+    id: Annotated[int, Field(description="ID", examples=[1])]
+    name: Annotated[str, Field(description="Nombre", examples=["Fácil"])]
+    code: Annotated[str, Field(description="Código", examples=["1"])]
+
+
+class TaxonomyPublic(BaseModel):
+    version: Annotated[
+        int,
+        Field(
+            description="Versión de la taxonomía; aumenta con cada cambio en cursos, "
+            "temas o subtemas",
+            examples=[12],
+        ),
+    ]
+    courses: Annotated[
+        list[TaxonomyCourse], Field(description="Árbol curso → tema → subtema")
+    ]
+    areas: Annotated[list[TaxonomyReference], Field(description="Áreas")]
+    difficulties: Annotated[
+        list[TaxonomyReference], Field(description="Dificultades")
+    ]
+    question_types: Annotated[
+        list[TaxonomyReference], Field(description="Tipos de pregunta")
+    ]
@@ -9,7 +9,7 @@ from app.api.v1.topic.schemas import (
     TopicPublicNoDescription,
     TopicUpdate,
 )
-from app.db.session import get_session
+from app.db.session import get_read_session, get_session
 from app.helpers.build_paginated import build_paginated_response
 from app.schemas.pagination import PaginationMeta
 from app.schemas.response import ApiResponse
@@ -36,6 +36,12 @@ def get_topic_service(
     return TopicService(topic_repository, course_service)
 
 
+def get_read_topic_service(db: Annotated[Session, Depends(get_read_session)]):
+    """Servicio para endpoints GET: usa la réplica de lectura si está disponible."""
+    topic_repository = TopicRepository(db)
+    return TopicService(topic_repository)
+
+
 @topic_router.post(
     "",
     response_model=ApiResponse[TopicPublic],
@@ -56,15 +62,26 @@ def add_topic(
     summary="Lista de temas",
 )
 def read_topics(
-        service: Annotated[TopicService, Depends(get_topic_service)],
+        service: Annotated[TopicService, Depends(get_read_topic_service)],
         page: Annotated[int, Query(ge=1, description="Número de página")] = 1,
         limit: Annotated[
             int, Query(ge=1, le=100, description="Cantidad de elementos por página")
         ] = 50,
+        include_total: Annotated[
+            bool,
+            Query(
+                description=(
+                    "Calcular `meta.total` y `meta.pages`. Con `false` se omite el "
+                    "conteo; usar `meta.has_next` para saber si hay más páginas."
+                )
+            ),
+        ] = True,
 ):
     """Recupera una lista de temas con soporte de paginación."""
-    items, total = service.get_topics(page, limit)
-    return build_paginated_response(items=items, total=total, page=page, limit=limit)
+    items, total, has_next = service.get_topics(page, limit, include_total)
+    return build_paginated_response(
+        items=items, total=total, page=page, limit=limit, has_next=has_next
+    )
 
 
 @topic_router.get(
@@ -73,7 +90,7 @@ def read_topics(
     summary="Obtener un tema",
 )
 def read_topic(
-        service: Annotated[TopicService, Depends(get_topic_service)],
+        service: Annotated[TopicService, Depends(get_read_topic_service)],
         topic_id: Annotated[int, Path(description="ID del tema", ge=1)],
         include_description: Annotated[
             bool, Query(description="Incluir descripción del tema")
@@ -0,0 +1,125 @@
+"""
+Compara el rendimiento (preguntas/segundo) del listado de preguntas:
+
+- ``orm``: entidades ``Question`` con las cargas de ``question_load_options``,
+  validadas y serializadas con el esquema público (lo que hacía el endpoint).
+- ``json``: documentos JSON armados en PostgreSQL (``app.db.question_json``) y
+  serializados tal cual.
+
+Ambos recorren las mismas páginas por cursor (keyset), como lo hace el endpoint.
+Ejecutar contra una copia de la BD con datos representativos.
+
+Uso:
+    python -m app.cli.benchmark_question_listing --view summary --rows 5000
+    python -m app.cli.benchmark_question_listing --view full --page-size 50
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from app.api.v1.question.schemas import QuestionDetailPublic, QuestionSummaryPublic
+from app.db.engine import engine, replica_engine
+from app.repositories.question_repository import (
+    build_questions_document_page_stmt,
+    build_questions_page_stmt,
+)
+
+# Cada página devuelve ``(preguntas, último ID)``
+FetchPage = Callable[[Session, str, int, int | None], tuple[int, int | None]]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Mide preguntas/segundo del listado de preguntas (ORM vs JSON)."
+    )
+    parser.add_argument(
+        "--view",
+        choices=("summary", "full"),
+        default="summary",
+        help="Nivel de detalle",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=5000, help="Preguntas a recorrer por pasada"
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=100, help="Preguntas por página (limit)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Pasadas por modo (se usa la mejor)"
+    )
+    parser.add_argument(
+        "--replica",
+        action="store_true",
+        help="Leer desde la réplica (si está configurada)",
+    )
+    return parser.parse_args(argv)
+
+
+def fetch_orm_page(session: Session, view: str, limit: int, after_id: int | None):
+    schema = QuestionSummaryPublic if view == "summary" else QuestionDetailPublic
+    stmt = build_questions_page_stmt(limit=limit, view=view, after_id=after_id)
+    questions = session.scalars(stmt).all()[:limit]
+    body = [schema.model_validate(question).model_dump_json() for question in questions]
+    last_id = questions[-1].id if questions else None
+    # Como en el endpoint: sin identity map compartido entre peticiones
+    session.expunge_all()
+    return len(body), last_id
+
+
+def fetch_json_page(session: Session, view: str, limit: int, after_id: int | None):
+    stmt = build_questions_document_page_stmt(
+        view=view, limit=limit, after_id=after_id
+    )
+    documents = session.scalars(stmt).all()[:limit]
+    json.dumps(documents, ensure_ascii=False, separators=(",", ":"))
+    last_id = documents[-1]["id"] if documents else None
+    return len(documents), last_id
+
+
+def run(
+        session: Session, fetch_page: FetchPage, view: str, rows: int, page_size: int
+) -> tuple[int, float]:
+    """Recorre hasta ``rows`` preguntas; devuelve ``(preguntas, segundos)``."""
+    fetched = 0
+    after_id = None
+    started = time.perf_counter()
+
+    while fetched < rows:
+        count, after_id = fetch_page(
+            session, view, min(page_size, rows - fetched), after_id
+        )
+        if not count:
+            break
+        fetched += count
+
+    return fetched, time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    bind = replica_engine if args.replica and replica_engine is not None else engine
+
+    modes = {"orm": fetch_orm_page, "json": fetch_json_page}
+    results: dict[str, float] = {}
+
+    with Session(bind) as session:
+        for name, fetch_page in modes.items():
+            best = 0.0
+            for _ in range(args.repeat):
+                fetched, seconds = run(
+                    session, fetch_page, args.view, args.rows, args.page_size
+                )
+                best = max(best, fetched / seconds if seconds else 0.0)
+            results[name] = best
+            print(f"{name:>4}: {fetched} preguntas, {best:,.0f} preguntas/s")
+
+    if results["orm"]:
+        print(f"Aceleración: x{results['json'] / results['orm']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
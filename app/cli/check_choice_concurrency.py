@@ -0,0 +1,98 @@
+"""
+Verifica que las ediciones simultáneas de alternativas mantengan el invariante de
+una sola alternativa correcta por pregunta.
+
+Toma una pregunta con al menos dos alternativas y lanza ``--workers`` hilos que,
+``--rounds`` veces cada uno, marcan como correcta una alternativa distinta (cada
+hilo con su propia sesión, como peticiones concurrentes). Al terminar debe quedar
+exactamente una alternativa correcta; se restaura la original y termina con código
+1 si el invariante no se cumplió. Ejecutar contra una copia de la BD con datos.
+
+Uso:
+    python -m app.cli.check_choice_concurrency [--workers 8] [--rounds 20]
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db.engine import engine
+from app.models.choice import Choice
+from app.repositories.choice_repository import ChoiceRepository
+
+
+def mark_correct(question_id: int, choice_id: int):
+    """Mismo flujo que ``ChoiceService.update_choice`` con ``is_correct=True``"""
+    with Session(engine) as session:
+        repository = ChoiceRepository(session)
+        choices = repository.lock_question_choices_db(question_id)
+        repository.update_choice_db(
+            choice=choices[choice_id],
+            question_id=question_id,
+            label=None,
+            is_correct=True,
+            contents=None,
+            demote_others=True,
+        )
+
+
+def correct_choice_ids(question_id: int) -> list[int]:
+    with Session(engine) as session:
+        stmt = select(Choice.id).where(
+            Choice.question_id == question_id, Choice.is_correct.is_(True)
+        )
+        return list(session.scalars(stmt))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        question_id = session.scalar(
+            select(Choice.question_id)
+            .group_by(Choice.question_id)
+            .having(func.count() >= 2)
+            .order_by(Choice.question_id)
+            .limit(1)
+        )
+        if question_id is None:
+            print("Sin preguntas con dos o más alternativas")
+            return
+        choice_ids = list(
+            session.scalars(
+                select(Choice.id)
+                .where(Choice.question_id == question_id)
+                .order_by(Choice.id)
+            )
+        )
+
+    original = correct_choice_ids(question_id)
+    targets = [
+        choice_ids[(worker + i) % len(choice_ids)]
+        for worker in range(args.workers)
+        for i in range(args.rounds)
+    ]
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        # ``list`` propaga la primera excepción de los hilos
+        list(executor.map(mark_correct, [question_id] * len(targets), targets))
+
+    correct = correct_choice_ids(question_id)
+    if original:
+        mark_correct(question_id, original[0])
+
+    print(
+        f"Pregunta {question_id}: {len(targets)} ediciones, "
+        f"{len(correct)} alternativa(s) correcta(s) al final"
+    )
+    if len(correct) != 1:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
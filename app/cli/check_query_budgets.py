@@ -0,0 +1,131 @@
+"""
+Verifica que los endpoints de lectura no superen su presupuesto de sentencias SQL
+(``QUERY_BUDGETS`` en ``app.db.query_counter``).
+
+Cada endpoint se llama en proceso (ASGI, sin servidor) con un ID existente y con
+las cachés frías (conteos y detalle de pregunta invalidados), y se cuentan las
+sentencias ejecutadas. Termina con código 1 si alguno supera su presupuesto o no
+responde 200: sirve como verificación antes de publicar cambios en los modelos o
+en las consultas. Ejecutar contra una copia de la BD con datos.
+
+Uso:
+    python -m app.cli.check_query_budgets
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import invalidate_counts
+from app.core.question_cache import invalidate_question_cache
+from app.db.engine import engine
+from app.db.query_counter import QUERY_BUDGETS, count_queries
+from app.main import app
+from app.models.institution import Institution
+from app.models.question import Question
+from app.models.source import Source
+from app.models.subtopic import Subtopic
+from app.models.topic import Topic
+from app.repositories.question_repository import (
+    QUESTIONS_COUNT_NAMESPACE,
+    QUESTIONS_FILTERED_COUNT_NAMESPACE,
+)
+
+# (endpoint de ``QUERY_BUDGETS``, modelo del parámetro de ruta, query string)
+CHECKS = [
+    ("GET /api/v1/topics", None, "limit=50"),
+    ("GET /api/v1/subtopics", None, "limit=50"),
+    ("GET /api/v1/institutions", None, "limit=50"),
+    ("GET /api/v1/sources", None, "limit=50"),
+    ("GET /api/v1/questions", None, "limit=50&view=full"),
+    ("GET /api/v1/questions/search", None, "q=celula&limit=50&view=full"),
+    ("GET /api/v1/topics/{topic_id}", Topic, ""),
+    ("GET /api/v1/subtopics/{subtopic_id}", Subtopic, ""),
+    ("GET /api/v1/institutions/{institution_id}", Institution, ""),
+    ("GET /api/v1/sources/{source_id}", Source, ""),
+    ("GET /api/v1/questions/{question_id}", Question, "view=full"),
+    ("GET /api/v1/taxonomy", None, ""),
+]
+
+COUNT_NAMESPACES = (
+    "topics",
+    "subtopics",
+    "institutions",
+    "sources",
+    QUESTIONS_COUNT_NAMESPACE,
+    QUESTIONS_FILTERED_COUNT_NAMESPACE,
+)
+
+
+async def get(path: str, query: str) -> tuple[int, int]:
+    """Petición GET en proceso; devuelve ``(status, sentencias)``"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    with count_queries() as counter:
+        await app(scope, receive, send)
+    return status, counter.statements
+
+
+async def run_checks(sample_ids: dict[type, int | None]) -> bool:
+    ok = True
+    for endpoint, model, query in CHECKS:
+        template = endpoint.split(" ", 1)[1]
+        path = template
+        if model is not None:
+            if sample_ids[model] is None:
+                print(f"{'-':>4}  {endpoint}: sin datos, omitido")
+                continue
+            # Las rutas tienen un solo parámetro: ``{<entidad>_id}``
+            path = template[: template.index("{")] + str(sample_ids[model])
+            if model is Question:
+                invalidate_question_cache(sample_ids[model])
+
+        status, statements = await get(path, query)
+        budget = QUERY_BUDGETS[endpoint]
+        passed = status == 200 and statements <= budget
+        ok = ok and passed
+        print(
+            f"{'ok' if passed else 'FAIL':>4}  {endpoint}: {statements}/{budget}"
+            f" sentencias (HTTP {status})"
+        )
+    return ok
+
+
+def main() -> None:
+    with Session(engine) as session:
+        sample_ids = {
+            model: session.scalar(select(func.min(model.id)))
+            for model in (Topic, Subtopic, Institution, Source, Question)
+        }
+
+    invalidate_counts(*COUNT_NAMESPACES)
+    if not asyncio.run(run_checks(sample_ids)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
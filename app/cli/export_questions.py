@@ -0,0 +1,82 @@
+"""
+Exporta el banco de preguntas en formato NDJSON (una pregunta por línea).
+
+Uso:
+    python -m app.cli.export_questions --output preguntas.ndjson
+    python -m app.cli.export_questions --course-id 3 --year 2024 > preguntas.ndjson
+"""
+
+import argparse
+import sys
+from contextlib import nullcontext
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.engine import engine, replica_engine
+from app.domain.question.filters import QuestionFilters
+from app.repositories.question_repository import QuestionRepository
+from app.services.question_export_service import QuestionExportService
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Exporta las preguntas en formato NDJSON."
+    )
+    parser.add_argument(
+        "-o", "--output", help="Archivo de salida (por defecto, salida estándar)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.EXPORT_BATCH_SIZE,
+        help="Filas leídas por vuelta del cursor",
+    )
+    parser.add_argument(
+        "--replica",
+        action="store_true",
+        help="Leer desde la réplica (si está configurada)",
+    )
+    parser.add_argument("--subtopic-id", type=int)
+    parser.add_argument("--topic-id", type=int)
+    parser.add_argument("--course-id", type=int)
+    parser.add_argument("--difficulty-id", type=int)
+    parser.add_argument("--question-type-id", type=int)
+    parser.add_argument(
+        "--area-code",
+        action="append",
+        default=[],
+        dest="area_codes",
+        help="Código de área (se puede repetir)",
+    )
+    parser.add_argument("--source-id", type=int)
+    parser.add_argument("--year", type=int)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    filters = QuestionFilters(
+        subtopic_id=args.subtopic_id,
+        topic_id=args.topic_id,
+        course_id=args.course_id,
+        difficulty_id=args.difficulty_id,
+        question_type_id=args.question_type_id,
+        area_codes=tuple(sorted({code.strip().upper() for code in args.area_codes})),
+        source_id=args.source_id,
+        year=args.year,
+    )
+    bind = replica_engine if args.replica and replica_engine is not None else engine
+
+    output = (
+        open(args.output, "wb") if args.output else nullcontext(sys.stdout.buffer)
+    )
+    with Session(bind) as session, output as stream:
+        service = QuestionExportService(QuestionRepository(session))
+        for chunk in service.export_ndjson(filters=filters, batch_size=args.batch_size):
+            stream.write(chunk)
+
+
+if __name__ == "__main__":
+    main()
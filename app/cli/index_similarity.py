@@ -0,0 +1,63 @@
+"""
+Calcula las firmas de similitud (MinHash/LSH) de las preguntas que aún no las tienen,
+por ejemplo las creadas antes de existir el índice.
+
+Uso:
+    python -m app.cli.index_similarity
+    python -m app.cli.index_similarity --rebuild  # recalcula todas las firmas
+"""
+
+import argparse
+import logging
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.db.engine import engine
+from app.domain.question.similarity import question_signature
+from app.models.question_signature import QuestionSignature
+from app.repositories.question_similarity_repository import (
+    QuestionSimilarityRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Indexa las preguntas para la detección de casi duplicados."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Descarta las firmas existentes y recalcula todas",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    with Session(engine) as session:
+        if args.rebuild:
+            # Los buckets se reemplazan al guardar cada firma
+            session.execute(delete(QuestionSignature))
+            session.commit()
+
+        repository = QuestionSimilarityRepository(session)
+        total = 0
+        for contents_by_id in repository.iter_unindexed_contents_db(args.batch_size):
+            repository.save_signatures_db(
+                {
+                    question_id: question_signature(contents)
+                    for question_id, contents in contents_by_id.items()
+                }
+            )
+            total += len(contents_by_id)
+            logger.info("Preguntas indexadas: %s", total)
+
+
+if __name__ == "__main__":
+    main()
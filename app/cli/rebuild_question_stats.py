@@ -0,0 +1,24 @@
+"""
+Recalcula los conteos de preguntas por taxonomía (``question_stats`` y
+``question_area_stats``) a partir de las preguntas existentes.
+
+Los conteos se mantienen en cada escritura; este comando solo es necesario para
+corregir desvíos (por ejemplo, tras modificar preguntas directamente en la BD).
+
+Uso:
+    python -m app.cli.rebuild_question_stats
+"""
+
+from sqlalchemy.orm import Session
+
+from app.db.engine import engine
+from app.repositories.question_stats_repository import QuestionStatsRepository
+
+
+def main() -> None:
+    with Session(engine) as session:
+        QuestionStatsRepository(session).rebuild_stats_db()
+
+
+if __name__ == "__main__":
+    main()
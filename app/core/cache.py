@@ -1,26 +1,374 @@
+import asyncio
+import logging
+import math
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from app.core.redis_client import async_redis_client, redis_client
+
+logger = logging.getLogger(__name__)
+
+# Lee la generación vigente del namespace y el valor cacheado en un solo viaje. El
+# campo depende de la generación, pero la clave (el hash) se declara en KEYS
+_READ_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+local value = redis.call('HGET', KEYS[2], 'g' .. generation .. ':' .. ARGV[1])
+return {generation, value}
+"""
+
+# Libera el candado solo si sigue siendo del mismo dueño
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class CountCache:
+    """
+    Caché de conteos (``COUNT(*)``) en Redis.
+
+    - Namespaces: cada tabla (o conjunto de filtros) tiene su namespace y cada
+      combinación de filtros es una variante dentro de él. Las variantes de un
+      namespace son campos ``g<generación>:<variante>`` de un solo hash, con el
+      instante de expiración dentro del valor; todas las claves de un namespace
+      comparten hash tag (``{namespace}``), como exige Redis Cluster a los scripts.
+    - Invalidación por versión: invalidar incrementa el contador de generación del
+      namespace y borra su hash; un valor calculado antes del cambio se guarda con
+      la generación anterior y ya no se lee (no se recorre el keyspace).
+    - Single-flight: ante un fallo, solo quien obtiene el candado recalcula; el
+      resto espera brevemente el nuevo valor en lugar de repetir la consulta.
+    - Refresco anticipado probabilístico (XFetch): poco antes de expirar, una
+      petición al azar recalcula el valor mientras las demás usan el actual.
+
+    Si Redis no está disponible (o su circuito está abierto) el conteo se calcula
+    directamente. Las variantes ``a*`` usan el cliente ``redis.asyncio``.
+    """
+
+    def __init__(
+            self,
+            client: Redis,
+            async_client: AsyncRedis,
+            lock_ttl: float = 10.0,
+            wait_timeout: float = 2.0,
+            wait_interval: float = 0.05,
+            beta: float = 1.0,
+    ):
+        self.client = client
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.wait_interval = wait_interval
+        self.beta = beta
+        self.async_client = async_client
+        self._read = client.register_script(_READ_SCRIPT)
+        self._release = client.register_script(_RELEASE_SCRIPT)
+        self._aread = async_client.register_script(_READ_SCRIPT)
+        self._arelease = async_client.register_script(_RELEASE_SCRIPT)
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"count:{{{namespace}}}:generation"
+
+    @staticmethod
+    def _values_key(namespace: str) -> str:
+        return f"count:{{{namespace}}}"
+
+    @staticmethod
+    def _value_field(generation: str, variant: str) -> str:
+        return f"g{generation}:{variant}"
+
+    def _lookup(self, namespace: str, variant: str) -> tuple[str, int | None, bool]:
+        """
+        :return: ``(generación, valor, refrescar)``. ``refrescar`` indica que el
+            valor falta o que esta petición fue elegida para recalcularlo antes de
+            que expire.
+        """
+        generation, raw = self._read(
+            keys=[self._generation_key(namespace), self._values_key(namespace)],
+            args=[variant],
+        )
+        return self._parse(generation, raw)
+
+    async def _alookup(
+            self, namespace: str, variant: str
+    ) -> tuple[str, int | None, bool]:
+        generation, raw = await self._aread(
+            keys=[self._generation_key(namespace), self._values_key(namespace)],
+            args=[variant],
+        )
+        return self._parse(generation, raw)
+
+    def _parse(self, generation: str, raw: str | None) -> tuple[str, int | None, bool]:
+        if raw is None:
+            return generation, None, True
+
+        # Formato: "valor|segundos que tomó calcularlo|instante de expiración"
+        value, delta, expires_at = raw.split("|")
+        now = time.time()
+        if now >= float(expires_at):
+            # Los campos del hash no expiran solos: el vencimiento es lógico
+            return generation, None, True
+
+        early = float(delta) * self.beta * -math.log(1.0 - random.random())
+        refresh = now + early >= float(expires_at)
+        return generation, int(value), refresh
+
+    @staticmethod
+    def _encode(value: int, delta: float, ttl: int) -> str:
+        expires_at = time.time() + ttl
+        return f"{value}|{delta:.4f}|{expires_at:.3f}"
+
+    def _lock_key(self, namespace: str, generation: str, variant: str) -> str:
+        field = self._value_field(generation, variant)
+        return f"{self._values_key(namespace)}:{field}:lock"
+
+    def get_or_compute(
+            self,
+            namespace: str,
+            variant: str,
+            compute: Callable[[], int],
+            ttl: int = 300,
+    ) -> int:
+        try:
+            generation, value, refresh = self._lookup(namespace, variant)
+        except RedisError:
+            logger.warning("Caché de conteos no disponible", exc_info=True)
+            return compute()
+
+        if not refresh:
+            return value
+
+        lock_key = self._lock_key(namespace, generation, variant)
+        token = self._try_acquire(lock_key)
+        if token is None:
+            if value is not None:
+                # Otro proceso ya lo está refrescando: se usa el valor actual
+                return value
+
+            deadline = time.monotonic() + self.wait_timeout
+            while time.monotonic() < deadline:
+                time.sleep(self.wait_interval)
+                value = self._peek(namespace, variant)
+                if value is not None:
+                    return value
+            return compute()
+
+        try:
+            started = time.perf_counter()
+            value = compute()
+            delta = time.perf_counter() - started
+            self._safe_store(namespace, generation, variant, value, delta, ttl)
+            return value
+        finally:
+            self._safe_release(lock_key, token)
+
+    async def aget_or_compute(
+            self,
+            namespace: str,
+            variant: str,
+            compute: Callable[[], Awaitable[int]],
+            ttl: int = 300,
+    ) -> int:
+        """Variante de ``get_or_compute`` para cálculos asíncronos."""
+        try:
+            generation, value, refresh = await self._alookup(namespace, variant)
+        except RedisError:
+            logger.warning("Caché de conteos no disponible", exc_info=True)
+            return await compute()
+
+        if not refresh:
+            return value
+
+        lock_key = self._lock_key(namespace, generation, variant)
+        token = await self._atry_acquire(lock_key)
+        if token is None:
+            if value is not None:
+                return value
+
+            deadline = time.monotonic() + self.wait_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.wait_interval)
+                value = await self._apeek(namespace, variant)
+                if value is not None:
+                    return value
+            return await compute()
+
+        try:
+            started = time.perf_counter()
+            value = await compute()
+            delta = time.perf_counter() - started
+            await self._asafe_store(namespace, generation, variant, value, delta, ttl)
+            return value
+        finally:
+            await self._asafe_release(lock_key, token)
+
+    def bump(self, *namespaces: str):
+        """Invalida todos los conteos de los namespaces indicados"""
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for namespace in namespaces:
+                pipe.incr(self._generation_key(namespace))
+                pipe.delete(self._values_key(namespace))
+            pipe.execute()
+        except RedisError:
+            logger.warning(
+                "No se pudo invalidar los conteos de %s", namespaces, exc_info=True
+            )
+
+    async def abump(self, *namespaces: str):
+        try:
+            pipe = self.async_client.pipeline(transaction=False)
+            for namespace in namespaces:
+                pipe.incr(self._generation_key(namespace))
+                pipe.delete(self._values_key(namespace))
+            await pipe.execute()
+        except RedisError:
+            logger.warning(
+                "No se pudo invalidar los conteos de %s", namespaces, exc_info=True
+            )
+
+    def _peek(self, namespace: str, variant: str) -> int | None:
+        try:
+            _, value, _ = self._lookup(namespace, variant)
+        except RedisError:
+            return None
+        return value
+
+    async def _apeek(self, namespace: str, variant: str) -> int | None:
+        try:
+            _, value, _ = await self._alookup(namespace, variant)
+        except RedisError:
+            return None
+        return value
+
+    def _try_acquire(self, lock_key: str) -> str | None:
+        # Sin candado no se puede coordinar: se calcula sin guardar
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.client.set(
+                lock_key, token, nx=True, px=int(self.lock_ttl * 1000)
+            )
+        except RedisError:
+            return None
+        return token if acquired else None
+
+    async def _atry_acquire(self, lock_key: str) -> str | None:
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.async_client.set(
+                lock_key, token, nx=True, px=int(self.lock_ttl * 1000)
+            )
+        except RedisError:
+            return None
+        return token if acquired else None
+
+    def _store_pipeline(
+            self,
+            pipe,
+            namespace: str,
+            generation: str,
+            variant: str,
+            encoded: str,
+            ttl: int,
+    ):
+        """
+        Guarda el campo y mantiene el TTL del hash en el mayor de sus variantes
+        (``NX`` lo fija si no tiene, ``GT`` solo lo alarga): un namespace sin uso
+        desaparece solo.
+        """
+        key = self._values_key(namespace)
+        pipe.hset(key, self._value_field(generation, variant), encoded)
+        pipe.expire(key, ttl, nx=True)
+        pipe.expire(key, ttl, gt=True)
+        return pipe
+
+    def _safe_store(
+            self,
+            namespace: str,
+            generation: str,
+            variant: str,
+            value: int,
+            delta: float,
+            ttl: int,
+    ):
+        try:
+            self._store_pipeline(
+                self.client.pipeline(transaction=False),
+                namespace,
+                generation,
+                variant,
+                self._encode(value, delta, ttl),
+                ttl,
+            ).execute()
+        except RedisError:
+            logger.warning("No se pudo guardar el conteo en caché", exc_info=True)
+
+    async def _asafe_store(
+            self,
+            namespace: str,
+            generation: str,
+            variant: str,
+            value: int,
+            delta: float,
+            ttl: int,
+    ):
+        try:
+            await self._store_pipeline(
+                self.async_client.pipeline(transaction=False),
+                namespace,
+                generation,
+                variant,
+                self._encode(value, delta, ttl),
+                ttl,
+            ).execute()
+        except RedisError:
+            logger.warning("No se pudo guardar el conteo en caché", exc_info=True)
+
+    def _safe_release(self, lock_key: str, token: str):
+        try:
+            self._release(keys=[lock_key], args=[token])
+        except RedisError:
+            pass
+
+    async def _asafe_release(self, lock_key: str, token: str):
+        try:
+            await self._arelease(keys=[lock_key], args=[token])
+        except RedisError:
+            pass
+
 
-from app.core.config import settings
+count_cache = CountCache(redis_client, async_redis_client)
 
-# TODO realizar una configuración para producción
 
-# https://redis.io/docs/latest/develop/clients/redis-py/connect/#basic-connection
-redis_client = Redis(
-    host=settings.REDIS_HOST, port=settings.REDIS_PORT, decode_responses=True
-)
+def get_or_compute_count(
+        namespace: str, variant: str, compute: Callable[[], int], ttl: int = 300
+) -> int:
+    """Obtener un conteo cacheado o calcularlo (TTL en segundos)"""
+    return count_cache.get_or_compute(namespace, variant, compute, ttl)
 
 
-def set_cached_count(name: str, value: int, ttl: int = 300):
-    """Guardar count en cache (TTL en segundos)"""
-    redis_client.set(name=name, value=value, ex=ttl)
+async def aget_or_compute_count(
+        namespace: str,
+        variant: str,
+        compute: Callable[[], Awaitable[int]],
+        ttl: int = 300,
+) -> int:
+    """Variante asíncrona de ``get_or_compute_count``"""
+    return await count_cache.aget_or_compute(namespace, variant, compute, ttl)
 
 
-def get_cached_count(name: str) -> int | None:
-    """Obtener count cacheado"""
-    cached = redis_client.get(name)
-    return int(cached) if cached else None
+def invalidate_counts(*namespaces: str):
+    """Invalidar los conteos cuando se crean/modifican/eliminan registros"""
+    count_cache.bump(*namespaces)
 
 
-def invalidate_count_cache(name: str):
-    """Invalidar cache cuando se crean/eliminan preguntas"""
-    redis_client.delete(name)
+async def ainvalidate_counts(*namespaces: str):
+    """Variante asíncrona de ``invalidate_counts``"""
+    await count_cache.abump(*namespaces)
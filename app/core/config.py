@@ -11,11 +11,82 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: int
     DB_NAME: str
+    DB_SSLMODE: str = "require"
+    # Motor de base de datos
+    DB_ECHO: bool = False  # registra cada sentencia SQL; solo para depuración
+    DB_POOL_SIZE: int = 5  # conexiones permanentes abiertas
+    DB_MAX_OVERFLOW: int = 10  # conexiones extra en picos
+    DB_POOL_TIMEOUT: int = 30  # segundos de espera por una conexión libre
+    DB_POOL_RECYCLE: int = 1800  # recicla conexiones cada 30 min
+    DB_POOL_PRE_PING: bool = True  # verifica que la conexión sigue viva
+    DB_ASYNC_POOL_SIZE: int = 20
+    DB_ASYNC_MAX_OVERFLOW: int = 20
+    # Réplica de lectura (opcional). Sin DB_REPLICA_HOST todo va al primario
+    DB_REPLICA_HOST: str | None = None
+    DB_REPLICA_PORT: int | None = None  # por defecto DB_PORT
+    # Retraso tolerado antes de usar el primario
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = 5.0  # segundos entre mediciones del retraso
+    # Sin mensajes del primario en este tiempo el receptor de WAL se da por caído
+    # (el primario envía un keepalive cada wal_sender_timeout / 2 = 30s si no hay
+    # escrituras)
+    DB_REPLICA_RECEIVER_TIMEOUT: float = 35.0
+    # Sentencias SQL por petición (cabecera X-Query-Count y advertencia en el log
+    # cuando un endpoint supera su presupuesto de ``QUERY_BUDGETS``)
+    DB_QUERY_BUDGET_ENABLED: bool = True
+    DB_QUERY_BUDGET_DEFAULT: int = 10  # endpoints sin presupuesto propio
     CONTAINER_NAME: str
     # Solo para desarrollo local
     GOOGLE_APPLICATION_CREDENTIALS: str | None = None
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = "6379"
+    REDIS_MAX_CONNECTIONS: int = 50  # por proceso y por cliente (sync/async)
+    REDIS_POOL_TIMEOUT: float = 1.0  # segundos de espera por una conexión libre
+    REDIS_SOCKET_TIMEOUT: float = 0.5  # por operación; Redis lento = Redis caído
+    REDIS_CONNECT_TIMEOUT: float = 0.5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # PING a conexiones ociosas (segundos)
+    # Circuit breaker: fallos seguidos para abrirlo y segundos antes de reintentar
+    REDIS_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    REDIS_CIRCUIT_RESET_TIMEOUT: float = 30.0
+    # Importación masiva de preguntas
+    BULK_IMPORT_MAX_ITEMS: int = 1000  # máximo por petición JSON
+    BULK_IMPORT_BATCH_SIZE: int = 500  # preguntas por transacción (NDJSON)
+    BULK_IMPORT_MAX_LINE_BYTES: int = 1_048_576  # tamaño máximo de una línea NDJSON
+    # Reclasificación masiva: preguntas por petición (una sola transacción)
+    BULK_RECLASSIFY_MAX_ITEMS: int = 5000
+    # Exportación: filas leídas por vuelta del cursor del servidor
+    EXPORT_BATCH_SIZE: int = 500
+    # Índice de hashes (detección de duplicados): se reconstruye desde la BD al vencer
+    QUESTION_HASH_INDEX_TTL: int = 86_400
+    DUPLICATE_CHECK_MAX_ITEMS: int = 1000
+    # Preguntas casi duplicadas (MinHash/LSH): similitud de Jaccard estimada mínima
+    SIMILARITY_MIN_SCORE: float = 0.8
+    SIMILARITY_MAX_CANDIDATES: int = 200  # candidatos LSH evaluados por pregunta
+    # Lotes mayores se indexan en segundo plano, sin advertencia de similares
+    SIMILARITY_INLINE_MAX_ITEMS: int = 10
+    # Simulacros: máximo de preguntas por examen
+    EXAM_MAX_QUESTIONS: int = 200
+    # Preguntas consecutivas (en random_key) tomadas desde cada punto al azar
+    EXAM_SAMPLE_RUN_LENGTH: int = 2
+    # Caché de GET /questions/{id} (JSON sin URLs firmadas)
+    QUESTION_CACHE_TTL: int = 3600
+    # Snapshot en memoria de GET /taxonomy: antigüedad máxima y cada cuántos
+    # segundos se compara su versión con la de Redis
+    TAXONOMY_SNAPSHOT_TTL: float = 300.0
+    TAXONOMY_VERSION_CHECK_INTERVAL: float = 1.0
+    # Caché en memoria de tablas de referencia (segundos por tabla); los cambios
+    # se propagan entre workers por pub/sub, el TTL es el respaldo
+    REFERENCE_CACHE_TTL: float = 3600.0  # áreas, dificultades, tipos de pregunta
+    REFERENCE_CACHE_INSTITUTIONS_TTL: float = 600.0
+    REFERENCE_CACHE_SOURCES_TTL: float = 300.0
+    # Ante IDs desconocidos se recarga la tabla, como máximo cada tantos segundos
+    REFERENCE_CACHE_MISS_RELOAD_INTERVAL: float = 5.0
+    # URLs firmadas de imágenes
+    SIGNED_URL_EXPIRATION_MINUTES: int = 15
+    # Debe ser menor que la expiración para no entregar URLs a punto de vencer
+    SIGNED_URL_CACHE_TTL: int = 600
+    SIGNED_URL_CACHE_MAX_SIZE: int = 10_000
+    SIGNED_URL_CACHE_REDIS: bool = False
 
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / ".env", env_file_encoding="utf-8"
@@ -28,6 +28,15 @@ class ForeignKeyViolationError(DomainException):
         super().__init__(message=message, status_code=400)
 
 
+class InvalidCursorError(DomainException):
+    """Cursor de paginación inválido o corrupto"""
+
+    error_code = "invalid_cursor"
+
+    def __init__(self, message: str = "Invalid cursor"):
+        super().__init__(message=message, status_code=400)
+
+
 # QUESTION
 class MultipleCorrectChoicesError(DomainException):
     """Más de una alternativa marcada como correcta"""
@@ -56,6 +65,15 @@ class DuplicateChoiceContentError(DomainException):
         super().__init__(message=message, status_code=400)
 
 
+class InsufficientQuestionsError(DomainException):
+    """No hay suficientes preguntas para cubrir la cuota de una sección del examen"""
+
+    error_code = "insufficient_questions"
+
+    def __init__(self, message: str = "Insufficient questions"):
+        super().__init__(message=message, status_code=422)
+
+
 # IMAGE
 class ContentTypeError(DomainException):
     """Tipo de contenido no válido"""
@@ -1,6 +1,9 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.config import settings
+from app.db.query_counter import check_query_budget, count_queries
+
 
 def register_middleware(app: FastAPI):
     # Solo para DEV
@@ -13,3 +16,27 @@ def register_middleware(app: FastAPI):
         allow_methods = ["*"],
         allow_headers = ["*"]
     )
+
+    if settings.DB_QUERY_BUDGET_ENABLED:
+        app.middleware("http")(count_request_queries)
+
+
+async def count_request_queries(request: Request, call_next):
+    """
+    Cuenta las sentencias SQL de la petición (ver ``app.db.query_counter``). En
+    respuestas en streaming solo se cuentan las ejecutadas antes del primer byte.
+    """
+    with count_queries() as counter:
+        response = await call_next(request)
+
+    response.headers["X-Query-Count"] = str(counter.statements)
+
+    # El router deja la ruta resuelta en el scope (plantilla, no la URL)
+    route = request.scope.get("route")
+    if route is not None:
+        check_query_budget(
+            f"{request.method} {route.path}",
+            counter.statements,
+            settings.DB_QUERY_BUDGET_DEFAULT,
+        )
+    return response
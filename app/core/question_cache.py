@@ -0,0 +1,135 @@
+import logging
+import math
+from collections.abc import Iterable
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis_client import async_redis_client, redis_client
+
+logger = logging.getLogger(__name__)
+
+QUESTION_VIEWS = ("summary", "full")
+
+# Tras una escritura, durante este tiempo no se vuelve a poblar la caché: una lectura
+# desde la réplica podría devolver todavía la versión anterior. La réplica se sigue
+# usando hasta ``DB_REPLICA_LAG_CHECK_INTERVAL`` segundos después de medir su retraso,
+# así que puede ir atrasada hasta el máximo permitido más ese intervalo
+DIRTY_TTL = (
+    math.ceil(
+        settings.DB_REPLICA_MAX_LAG_SECONDS + settings.DB_REPLICA_LAG_CHECK_INTERVAL
+    )
+    + 2
+)
+
+# Guarda el valor solo si la pregunta no fue modificada recientemente (atómico)
+_SET_IF_CLEAN_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    return redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+end
+return nil
+"""
+_SET_IF_CLEAN = redis_client.register_script(_SET_IF_CLEAN_SCRIPT)
+_ASET_IF_CLEAN = async_redis_client.register_script(_SET_IF_CLEAN_SCRIPT)
+
+
+def _detail_key(question_id: int, view: str) -> str:
+    return f"questions:detail:{question_id}:{view}"
+
+
+def _dirty_key(question_id: int) -> str:
+    return f"questions:detail:{question_id}:dirty"
+
+
+def get_cached_question(question_id: int, view: str) -> str | None:
+    """Obtener la pregunta serializada (JSON, con imágenes sin firmar)"""
+    try:
+        return redis_client.get(_detail_key(question_id, view))
+    except RedisError:
+        logger.warning("Caché de preguntas no disponible", exc_info=True)
+        return None
+
+
+def set_cached_question(
+        question_id: int,
+        view: str,
+        payload: str,
+        ttl: int = settings.QUESTION_CACHE_TTL,
+):
+    """Guardar la pregunta serializada, salvo que haya cambiado hace poco"""
+    try:
+        _SET_IF_CLEAN(
+            keys=[_detail_key(question_id, view), _dirty_key(question_id)],
+            args=[payload, ttl],
+        )
+    except RedisError:
+        logger.warning("No se pudo guardar la pregunta en caché", exc_info=True)
+
+
+def invalidate_question_cache(question_id: int):
+    """Invalidar cache cuando se modifica/elimina una pregunta (todas sus vistas)"""
+    invalidate_question_caches([question_id])
+
+
+def invalidate_question_caches(question_ids: Iterable[int]):
+    """Como ``invalidate_question_cache`` para varias preguntas, en un solo pipeline"""
+    question_ids = list(question_ids)
+    if not question_ids:
+        return
+
+    try:
+        pipe = redis_client.pipeline()
+        for question_id in question_ids:
+            pipe.set(_dirty_key(question_id), 1, ex=DIRTY_TTL)
+        pipe.delete(
+            *(
+                _detail_key(question_id, view)
+                for question_id in question_ids
+                for view in QUESTION_VIEWS
+            )
+        )
+        pipe.execute()
+    except RedisError:
+        logger.warning(
+            "No se pudo invalidar %s preguntas en caché",
+            len(question_ids),
+            exc_info=True,
+        )
+
+
+async def aget_cached_question(question_id: int, view: str) -> str | None:
+    """Variante asíncrona de ``get_cached_question``"""
+    try:
+        return await async_redis_client.get(_detail_key(question_id, view))
+    except RedisError:
+        logger.warning("Caché de preguntas no disponible", exc_info=True)
+        return None
+
+
+async def aset_cached_question(
+        question_id: int,
+        view: str,
+        payload: str,
+        ttl: int = settings.QUESTION_CACHE_TTL,
+):
+    """Variante asíncrona de ``set_cached_question``"""
+    try:
+        await _ASET_IF_CLEAN(
+            keys=[_detail_key(question_id, view), _dirty_key(question_id)],
+            args=[payload, ttl],
+        )
+    except RedisError:
+        logger.warning("No se pudo guardar la pregunta en caché", exc_info=True)
+
+
+async def ainvalidate_question_cache(question_id: int):
+    """Variante asíncrona de ``invalidate_question_cache``"""
+    try:
+        pipe = async_redis_client.pipeline()
+        pipe.set(_dirty_key(question_id), 1, ex=DIRTY_TTL)
+        pipe.delete(*(_detail_key(question_id, view) for view in QUESTION_VIEWS))
+        await pipe.execute()
+    except RedisError:
+        logger.warning(
+            "No se pudo invalidar la pregunta %s en caché", question_id, exc_info=True
+        )
@@ -0,0 +1,206 @@
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from itertools import batched
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis_client import async_redis_client, redis_client
+
+logger = logging.getLogger(__name__)
+
+# Modifica el índice y, si hay una reconstrucción en curso (KEYS[2] existe), también
+# la copia en construcción (KEYS[3]), de modo que el RENAME final no pierda el cambio
+_UPDATE_SCRIPT = """
+redis.call(ARGV[1], KEYS[1], unpack(ARGV, 2))
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call(ARGV[1], KEYS[3], unpack(ARGV, 2))
+end
+"""
+
+
+class QuestionHashIndex:
+    """
+    Índice en Redis (un SET) con los ``question_hash`` existentes, para descartar
+    duplicados antes de construir e insertar una pregunta.
+
+    El índice solo descarta candidatos: un hash ausente del SET se considera nuevo
+    sin consultar la BD y un hash presente se confirma contra la BD. Por eso:
+
+    - Un hash sobrante (una baja que no llegó a Redis) solo cuesta una consulta.
+    - Un hash faltante sería un falso "nuevo" (``check-duplicates`` respondería
+      ``exists=false``). Si un alta no se puede registrar se descarta la marca de
+      índice listo, de modo que las búsquedas vuelven a la BD hasta reconstruirlo;
+      durante una reconstrucción las altas se escriben también en la copia en
+      construcción.
+
+    Mientras el índice no está construido (o expiró) se consulta directamente la BD y
+    se reconstruye en segundo plano, con un candado para que lo haga un solo worker.
+    """
+
+    def __init__(
+            self,
+            client: Redis,
+            async_client: AsyncRedis,
+            key: str = "questions:hashes",
+            ttl: int = 86_400,
+            batch_size: int = 5000,
+    ):
+        self.client = client
+        self.async_client = async_client
+        self.key = key
+        self.ready_key = f"{key}:ready"
+        self.lock_key = f"{key}:rebuilding"
+        self.staging_key = f"{key}:staging"
+        # Existe mientras se llena ``staging_key`` (ver ``rebuild``)
+        self.staging_active_key = f"{key}:staging:active"
+        self._update = client.register_script(_UPDATE_SCRIPT)
+        self._aupdate = async_client.register_script(_UPDATE_SCRIPT)
+        # Un alta no registrada cuya invalidación tampoco llegó a Redis
+        self._invalidation_pending = False
+        self.ttl = ttl
+        self.batch_size = batch_size
+
+    def filter_candidates(
+            self, hashes: set[str], load_hashes: Callable[[], Iterable[str]]
+    ) -> set[str]:
+        """
+        Devuelve los hashes que podrían existir (los demás seguro son nuevos).
+
+        :param load_hashes: Fuente de todos los hashes de la BD; se usa para
+            reconstruir el índice si aún no está disponible.
+        """
+        if not hashes:
+            return set()
+
+        if self._invalidation_pending:
+            self._invalidate()
+            return hashes
+
+        ordered = list(hashes)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.exists(self.ready_key)
+            pipe.smismember(self.key, ordered)
+            ready, members = pipe.execute()
+        except RedisError:
+            logger.warning("Índice de hashes no disponible", exc_info=True)
+            return hashes
+
+        if not ready:
+            self._rebuild_in_background(load_hashes)
+            return hashes
+
+        return {h for h, member in zip(ordered, members) if member}
+
+    def add(self, hashes: Iterable[str]):
+        hashes = list(hashes)
+        if not hashes:
+            return
+        try:
+            self._update(keys=self._update_keys(), args=["SADD", *hashes])
+        except RedisError:
+            # Un hash faltante haría pasar la pregunta por nueva: hasta reconstruir
+            # el índice las búsquedas van a la BD
+            logger.warning("No se pudo agregar hashes al índice", exc_info=True)
+            self._invalidate()
+
+    def remove(self, hashes: Iterable[str]):
+        hashes = list(hashes)
+        if not hashes:
+            return
+        try:
+            self._update(keys=self._update_keys(), args=["SREM", *hashes])
+        except RedisError:
+            # Un hash sobrante se descarta al confirmarlo contra la BD
+            logger.warning("No se pudo quitar hashes del índice", exc_info=True)
+
+    async def aremove(self, hashes: Iterable[str]):
+        """Variante asíncrona de ``remove`` (no bloquea el event loop)"""
+        hashes = list(hashes)
+        if not hashes:
+            return
+        try:
+            await self._aupdate(keys=self._update_keys(), args=["SREM", *hashes])
+        except RedisError:
+            logger.warning("No se pudo quitar hashes del índice", exc_info=True)
+
+    def rebuild(self, hashes: Iterable[str]) -> int:
+        """
+        Reconstruye el índice a partir de ``hashes``. Se escribe en una clave temporal
+        que reemplaza a la actual con RENAME, para no exponer un índice incompleto.
+
+        La copia se marca como activa antes de leer ``hashes`` (un iterador que
+        consulta la BD al recorrerlo): las altas confirmadas después de esa lectura
+        se escriben también en la copia, y las anteriores ya vienen en ``hashes``.
+        """
+        total = 0
+
+        pipe = self.client.pipeline()
+        pipe.delete(self.staging_key)
+        pipe.set(self.staging_active_key, 1, ex=self.ttl)
+        pipe.execute()
+
+        try:
+            for chunk in batched(hashes, self.batch_size):
+                self.client.sadd(self.staging_key, *chunk)
+                total += len(chunk)
+
+            # Atómico (MULTI) respecto de las altas concurrentes. El miembro vacío
+            # garantiza que la copia exista (RENAME falla si no hay hashes)
+            pipe = self.client.pipeline()
+            pipe.sadd(self.staging_key, "")
+            pipe.rename(self.staging_key, self.key)
+            pipe.srem(self.key, "")
+            pipe.delete(self.staging_active_key)
+            pipe.set(self.ready_key, 1, ex=self.ttl)
+            pipe.execute()
+        except BaseException:
+            self.client.delete(self.staging_active_key, self.staging_key)
+            raise
+
+        logger.info("Índice de hashes reconstruido con %s preguntas", total)
+        return total
+
+    def _update_keys(self) -> list[str]:
+        return [self.key, self.staging_active_key, self.staging_key]
+
+    def _invalidate(self):
+        """Descarta la marca de índice listo: las búsquedas vuelven a la BD"""
+        try:
+            self.client.delete(self.ready_key)
+        except RedisError:
+            # Se reintenta en la próxima búsqueda de este proceso
+            self._invalidation_pending = True
+            logger.warning("No se pudo invalidar el índice de hashes", exc_info=True)
+        else:
+            self._invalidation_pending = False
+
+    def _rebuild_in_background(self, load_hashes: Callable[[], Iterable[str]]):
+        try:
+            acquired = self.client.set(self.lock_key, 1, nx=True, ex=600)
+        except RedisError:
+            return
+        if not acquired:
+            return
+
+        def run():
+            try:
+                self.rebuild(load_hashes())
+            except Exception:
+                logger.exception("Error al reconstruir el índice de hashes")
+            finally:
+                try:
+                    self.client.delete(self.lock_key)
+                except RedisError:
+                    pass
+
+        threading.Thread(target=run, name="question-hash-index", daemon=True).start()
+
+
+question_hash_index = QuestionHashIndex(
+    redis_client, async_redis_client, ttl=settings.QUESTION_HASH_INDEX_TTL
+)
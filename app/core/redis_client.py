@@ -0,0 +1,290 @@
+import logging
+import threading
+import time
+
+from redis import BlockingConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import ConnectionError, RedisError, TimeoutError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisUnavailableError(ConnectionError):
+    """El circuito está abierto: no se intenta contactar a Redis."""
+
+
+class RedisPoolExhaustedError(ConnectionError):
+    """
+    No hubo una conexión libre en el pool a tiempo. Es saturación local, no una
+    falla de Redis: no cuenta para el circuit breaker.
+    """
+
+
+# Mensaje de ``BlockingConnectionPool`` (síncrono y asíncrono) al vencer la espera
+_POOL_EXHAUSTED_MESSAGE = "No connection available."
+
+
+class _BlockingConnectionPool(BlockingConnectionPool):
+    def get_connection(self, *args, **kwargs):
+        try:
+            return super().get_connection(*args, **kwargs)
+        except ConnectionError as e:
+            if str(e) == _POOL_EXHAUSTED_MESSAGE:
+                raise RedisPoolExhaustedError(_POOL_EXHAUSTED_MESSAGE) from e
+            raise
+
+
+class _AsyncBlockingConnectionPool(AsyncBlockingConnectionPool):
+    async def get_connection(self, *args, **kwargs):
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except ConnectionError as e:
+            if str(e) == _POOL_EXHAUSTED_MESSAGE:
+                raise RedisPoolExhaustedError(_POOL_EXHAUSTED_MESSAGE) from e
+            raise
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker compartido por los clientes de Redis.
+
+    - ``closed``: las operaciones pasan; tras ``failure_threshold`` fallos de
+      conexión/timeout seguidos se abre el circuito.
+    - ``open``: las operaciones fallan al instante con ``RedisUnavailableError``
+      (los llamadores ya degradan ante ``RedisError``: conteos desde la BD, caché
+      omitida, etc.) sin esperar los timeouts del socket.
+    - ``half_open``: pasado ``reset_timeout`` se deja pasar una sola operación de
+      prueba; si responde se cierra el circuito, si falla se vuelve a abrir. Si la
+      prueba no informa resultado (cancelada o error ajeno a Redis), pasado otro
+      ``reset_timeout`` se deja pasar una nueva.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+
+            now = time.monotonic()
+            if (
+                    self.state == "open"
+                    and now - self.opened_at >= self.reset_timeout
+            ) or (
+                    self.state == "half_open"
+                    and now - self.probe_started_at >= self.reset_timeout
+            ):
+                self.state = "half_open"
+                self.probe_started_at = now
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                logger.info("Redis disponible nuevamente: circuito cerrado")
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "open":
+                return
+
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.trips += 1
+                logger.error(
+                    "Redis no disponible (%s fallos): circuito abierto por %ss",
+                    self.failures,
+                    self.reset_timeout,
+                )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+class _PipelineProxy:
+    """Envuelve un pipeline para que ``execute`` pase por el circuit breaker."""
+
+    def __init__(self, pipeline, breaker: CircuitBreaker):
+        self._pipeline = pipeline
+        self._breaker = breaker
+
+    def __getattr__(self, name):
+        return getattr(self._pipeline, name)
+
+
+class _GuardedPipeline(_PipelineProxy):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._pipeline.reset()
+
+    def execute(self, raise_on_error: bool = True):
+        if not self._breaker.allow():
+            self._pipeline.reset()
+            raise RedisUnavailableError("Circuito de Redis abierto")
+
+        try:
+            result = self._pipeline.execute(raise_on_error=raise_on_error)
+        except RedisPoolExhaustedError:
+            # Pool agotado: ni éxito ni falla de Redis
+            raise
+        except (ConnectionError, TimeoutError):
+            self._breaker.record_failure()
+            raise
+        except RedisError:
+            self._breaker.record_success()
+            raise
+
+        self._breaker.record_success()
+        return result
+
+
+class _AsyncGuardedPipeline(_PipelineProxy):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._pipeline.reset()
+
+    async def execute(self, raise_on_error: bool = True):
+        if not self._breaker.allow():
+            await self._pipeline.reset()
+            raise RedisUnavailableError("Circuito de Redis abierto")
+
+        try:
+            result = await self._pipeline.execute(raise_on_error=raise_on_error)
+        except RedisPoolExhaustedError:
+            # Pool agotado: ni éxito ni falla de Redis
+            raise
+        except (ConnectionError, TimeoutError):
+            self._breaker.record_failure()
+            raise
+        except RedisError:
+            self._breaker.record_success()
+            raise
+
+        self._breaker.record_success()
+        return result
+
+
+class GuardedRedis(Redis):
+    """Cliente síncrono cuyas operaciones pasan por el circuit breaker."""
+
+    def __init__(self, *args, breaker: CircuitBreaker, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.breaker = breaker
+
+    def execute_command(self, *args, **options):
+        if not self.breaker.allow():
+            raise RedisUnavailableError("Circuito de Redis abierto")
+
+        try:
+            result = super().execute_command(*args, **options)
+        except RedisPoolExhaustedError:
+            # Pool agotado: ni éxito ni falla de Redis
+            raise
+        except (ConnectionError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        except RedisError:
+            # Redis respondió (p. ej. error de tipo): el servidor está sano
+            self.breaker.record_success()
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    def pipeline(self, transaction: bool = True, shard_hint=None):
+        return _GuardedPipeline(
+            super().pipeline(transaction=transaction, shard_hint=shard_hint),
+            self.breaker,
+        )
+
+
+class AsyncGuardedRedis(AsyncRedis):
+    """Cliente ``redis.asyncio`` cuyas operaciones pasan por el circuit breaker."""
+
+    def __init__(self, *args, breaker: CircuitBreaker, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.breaker = breaker
+
+    async def execute_command(self, *args, **options):
+        if not self.breaker.allow():
+            raise RedisUnavailableError("Circuito de Redis abierto")
+
+        try:
+            result = await super().execute_command(*args, **options)
+        except RedisPoolExhaustedError:
+            # Pool agotado: ni éxito ni falla de Redis
+            raise
+        except (ConnectionError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        except RedisError:
+            self.breaker.record_success()
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    def pipeline(self, transaction: bool = True, shard_hint=None):
+        return _AsyncGuardedPipeline(
+            super().pipeline(transaction=transaction, shard_hint=shard_hint),
+            self.breaker,
+        )
+
+
+# Ambos clientes hablan con el mismo servidor: comparten el estado de salud
+redis_breaker = CircuitBreaker(
+    failure_threshold=settings.REDIS_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.REDIS_CIRCUIT_RESET_TIMEOUT,
+)
+
+_POOL_OPTIONS = {
+    "host": settings.REDIS_HOST,
+    "port": settings.REDIS_PORT,
+    "decode_responses": True,
+    "max_connections": settings.REDIS_MAX_CONNECTIONS,
+    # Espera por una conexión libre antes de fallar (pool agotado)
+    "timeout": settings.REDIS_POOL_TIMEOUT,
+    "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+    "socket_connect_timeout": settings.REDIS_CONNECT_TIMEOUT,
+    "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL,
+}
+
+# https://redis.io/docs/latest/develop/clients/redis-py/connect/
+redis_client = GuardedRedis(
+    connection_pool=_BlockingConnectionPool(**_POOL_OPTIONS), breaker=redis_breaker
+)
+
+# Para los endpoints ``async def``: no bloquea el event loop mientras espera a Redis
+async_redis_client = AsyncGuardedRedis(
+    connection_pool=_AsyncBlockingConnectionPool(**_POOL_OPTIONS),
+    breaker=redis_breaker,
+)
@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import Row
+
+from app.core.config import settings
+from app.core.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Filas de una tabla de referencia (``Row`` es inmutable) indexadas por ``id``
+ReferenceRows = Mapping[int, Row]
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    rows: ReferenceRows
+    loaded_at: float
+
+
+class ReferenceDataCache:
+    """
+    Caché en memoria, por proceso, de tablas de referencia (áreas, dificultades,
+    tipos de pregunta, instituciones, fuentes): cambian pocas veces al año pero se
+    consultan en cada escritura de preguntas y fuentes.
+
+    - Cada tabla tiene su TTL; al vencer se vuelve a cargar completa (una consulta).
+    - Invalidación entre workers: quien modifica una tabla publica su nombre en un
+      canal de Redis; un hilo suscrito en cada proceso descarta la copia local. Si
+      la suscripción se corta (o Redis no está disponible) se descartan todas las
+      tablas al reconectar y, mientras tanto, rige el TTL.
+    - Una carga que se cruza con una invalidación no se guarda (generación por
+      tabla): nunca queda en caché una copia anterior al cambio.
+    - Las tablas sin escritura desde la app (filas agregadas por migración o SQL)
+      no publican invalidaciones: ante IDs desconocidos ``resolve`` recarga la
+      tabla una vez, como máximo cada ``miss_reload_interval`` segundos.
+    """
+
+    def __init__(
+            self,
+            client: Redis,
+            channel: str = "reference-data:invalidate",
+            reconnect_delay: float = 5.0,
+            miss_reload_interval: float = 5.0,
+    ):
+        self.client = client
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.miss_reload_interval = miss_reload_interval
+        self._ttls: dict[str, float] = {}
+        self._entries: dict[str, _Entry] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._listener: threading.Thread | None = None
+
+    def register(self, table: str, ttl: float):
+        self._ttls[table] = ttl
+        self._generations.setdefault(table, 0)
+
+    def rows(self, table: str, load: Callable[[], Sequence[Row]]) -> ReferenceRows:
+        """
+        Filas vigentes de ``table``; si faltan o vencieron se cargan con ``load``
+        (todas las filas de la tabla, con una columna ``id``).
+        """
+        self._ensure_listener()
+
+        entry = self._entries.get(table)
+        if entry is not None and time.monotonic() - entry.loaded_at < self._ttls[table]:
+            return entry.rows
+
+        generation = self._generations[table]
+        rows = MappingProxyType({row.id: row for row in load()})
+
+        with self._lock:
+            if self._generations[table] == generation:
+                self._entries[table] = _Entry(rows, time.monotonic())
+        return rows
+
+    def resolve(
+            self, table: str, ids: Iterable[int], load: Callable[[], Sequence[Row]]
+    ) -> tuple[list[Row], set[int]]:
+        """
+        Resuelve ``ids`` en memoria.
+
+        Si falta alguno y la copia tiene más de ``miss_reload_interval`` segundos,
+        se recarga la tabla antes de darlos por inexistentes.
+
+        :return: ``(filas encontradas en el orden de ids, ids faltantes)``.
+        """
+        ids = list(dict.fromkeys(ids))
+        found, missing = self._split(self.rows(table, load), ids)
+        if missing and self._expire_for_miss(table):
+            found, missing = self._split(self.rows(table, load), ids)
+        return found, missing
+
+    @staticmethod
+    def _split(rows: ReferenceRows, ids: list[int]) -> tuple[list[Row], set[int]]:
+        found, missing = [], set()
+        for item_id in ids:
+            row = rows.get(item_id)
+            if row is None:
+                missing.add(item_id)
+            else:
+                found.append(row)
+        return found, missing
+
+    def _expire_for_miss(self, table: str) -> bool:
+        """Descarta la copia local de ``table`` si no se cargó hace poco"""
+        with self._lock:
+            entry = self._entries.get(table)
+            if (
+                    entry is None
+                    or time.monotonic() - entry.loaded_at < self.miss_reload_interval
+            ):
+                return False
+
+            self._entries.pop(table)
+            self._generations[table] += 1
+            return True
+
+    def invalidate(self, *tables: str):
+        """Descarta ``tables`` en este proceso y avisa a los demás workers"""
+        self._drop(tables)
+        for table in tables:
+            try:
+                self.client.publish(self.channel, table)
+            except RedisError:
+                logger.warning(
+                    "No se pudo publicar la invalidación de %s", table, exc_info=True
+                )
+
+    def _drop(self, tables: Iterable[str]):
+        with self._lock:
+            for table in tables:
+                self._entries.pop(table, None)
+                self._generations[table] = self._generations.get(table, 0) + 1
+
+    def _ensure_listener(self):
+        if self._listener is not None:
+            return
+
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="reference-data-listener", daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self):
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                # Pudo haber cambios mientras no se estaba suscrito
+                self._drop(list(self._ttls))
+                while True:
+                    # ``get_message`` con timeout no falla por inactividad (a
+                    # diferencia de ``listen`` con el timeout de socket del pool)
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        self._drop([message["data"]])
+            except RedisError:
+                logger.warning(
+                    "Suscripción de invalidaciones interrumpida; reintentando en %ss",
+                    self.reconnect_delay,
+                    exc_info=True,
+                )
+            finally:
+                try:
+                    pubsub.close()
+                except RedisError:
+                    pass
+            time.sleep(self.reconnect_delay)
+
+
+AREAS = "areas"
+DIFFICULTIES = "difficulties"
+QUESTION_TYPES = "question_types"
+INSTITUTIONS = "institutions"
+SOURCES = "sources"
+
+reference_cache = ReferenceDataCache(
+    redis_client, miss_reload_interval=settings.REFERENCE_CACHE_MISS_RELOAD_INTERVAL
+)
+reference_cache.register(AREAS, settings.REFERENCE_CACHE_TTL)
+reference_cache.register(DIFFICULTIES, settings.REFERENCE_CACHE_TTL)
+reference_cache.register(QUESTION_TYPES, settings.REFERENCE_CACHE_TTL)
+reference_cache.register(INSTITUTIONS, settings.REFERENCE_CACHE_INSTITUTIONS_TTL)
+reference_cache.register(SOURCES, settings.REFERENCE_CACHE_SOURCES_TTL)
+
+
+def invalidate_reference_data(*tables: str):
+    """Invalidar tablas de referencia tras crear/modificar/eliminar registros"""
+    reference_cache.invalidate(*tables)
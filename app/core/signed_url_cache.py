@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Margen mínimo de validez que debe tener una URL firmada al entregarse al cliente
+MIN_REMAINING_VALIDITY = 300
+
+
+class SignedUrlCache:
+    """
+    Caché de URLs firmadas por nombre de objeto.
+
+    Primer nivel: LRU en memoria del proceso. Segundo nivel (opcional): Redis, para
+    compartir las firmas entre workers. Cada entrada guarda su instante de expiración
+    absoluto, de modo que una URL leída de Redis no se conserva más allá del TTL.
+    """
+
+    def __init__(self, ttl: int, max_size: int, use_redis: bool = False):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.use_redis = use_redis
+        self._entries: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _redis_key(storage_container_name: str, storage_object_name: str) -> str:
+        return f"signed_url:{storage_container_name}:{storage_object_name}"
+
+    def get_many(
+            self, storage_container_name: str, storage_object_names: Iterable[str]
+    ) -> dict[str, str]:
+        """Devuelve las URLs vigentes encontradas en caché (las faltantes se omiten)."""
+        found: dict[str, str] = {}
+        missing: list[str] = []
+        now = time.time()
+
+        with self._lock:
+            for name in storage_object_names:
+                entry = self._entries.get((storage_container_name, name))
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end((storage_container_name, name))
+                    found[name] = entry[0]
+                    continue
+
+                if entry is not None:
+                    del self._entries[(storage_container_name, name)]
+                missing.append(name)
+
+        if not missing or not self.use_redis:
+            return found
+
+        try:
+            values = redis_client.mget(
+                [self._redis_key(storage_container_name, name) for name in missing]
+            )
+        except RedisError:
+            logger.warning("No se pudo leer URLs firmadas desde Redis", exc_info=True)
+            return found
+
+        for name, value in zip(missing, values):
+            if not value:
+                continue
+
+            expires_at, url = value.split("|", 1)
+            if float(expires_at) <= now:
+                continue
+
+            found[name] = url
+            self._store_local(storage_container_name, name, url, float(expires_at))
+
+        return found
+
+    def set_many(self, storage_container_name: str, urls: Mapping[str, str]):
+        """Guarda URLs recién firmadas en memoria y, si está habilitado, en Redis."""
+        if not urls:
+            return
+
+        expires_at = time.time() + self.ttl
+        for name, url in urls.items():
+            self._store_local(storage_container_name, name, url, expires_at)
+
+        if not self.use_redis:
+            return
+
+        try:
+            pipeline = redis_client.pipeline(transaction=False)
+            for name, url in urls.items():
+                pipeline.set(
+                    name=self._redis_key(storage_container_name, name),
+                    value=f"{expires_at}|{url}",
+                    ex=self.ttl,
+                )
+            pipeline.execute()
+        except RedisError:
+            logger.warning("No se pudo guardar URLs firmadas en Redis", exc_info=True)
+
+    def _store_local(
+            self, storage_container_name: str, name: str, url: str, expires_at: float
+    ):
+        with self._lock:
+            self._entries[(storage_container_name, name)] = (url, expires_at)
+            self._entries.move_to_end((storage_container_name, name))
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+signed_url_cache = SignedUrlCache(
+    ttl=min(
+        settings.SIGNED_URL_CACHE_TTL,
+        settings.SIGNED_URL_EXPIRATION_MINUTES * 60 - MIN_REMAINING_VALIDITY,
+    ),
+    max_size=settings.SIGNED_URL_CACHE_MAX_SIZE,
+    use_redis=settings.SIGNED_URL_CACHE_REDIS,
+)
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TaxonomySnapshot:
+    """Árbol de taxonomía ya serializado; se reemplaza completo, nunca se modifica."""
+
+    version: int
+    body: bytes
+    etag: str
+    built_at: float
+
+
+class TaxonomyCache:
+    """
+    Snapshot en memoria del árbol curso → tema → subtema (más áreas, dificultades y
+    tipos de pregunta), compartido por todas las peticiones del proceso.
+
+    - Versión: un contador en Redis que las escrituras incrementan. Cada worker
+      compara su versión con la de Redis (a lo sumo cada ``check_interval``
+      segundos) y reconstruye el snapshot si cambió; así la invalidación llega a
+      todos los workers sin mensajes entre ellos.
+    - La versión se lee antes de consultar la BD: un snapshot nunca queda marcado
+      con una versión más nueva que sus datos.
+    - ``ttl``: antigüedad máxima del snapshot, por si un incremento se pierde (Redis
+      caído durante la escritura). Sin Redis solo se aplica el TTL.
+    - Un candado evita que varias peticiones del mismo proceso lo reconstruyan a
+      la vez.
+    """
+
+    def __init__(
+            self,
+            client: Redis,
+            key: str = "taxonomy:version",
+            ttl: float = 300.0,
+            check_interval: float = 1.0,
+    ):
+        self.client = client
+        self.key = key
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._snapshot: TaxonomySnapshot | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, load: Callable[[], dict]) -> TaxonomySnapshot:
+        """
+        Devuelve el snapshot vigente o lo reconstruye con ``load`` (el árbol como
+        ``dict``).
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_current(snapshot):
+            return snapshot
+
+        with self._lock:
+            current = self._snapshot
+            if current is not None and current is not snapshot:
+                # Otra petición lo reconstruyó mientras se esperaba el candado
+                return current
+
+            version = self._remote_version()
+            if version is None:
+                version = snapshot.version if snapshot is not None else 0
+
+            self._snapshot = self._build(version, load())
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self):
+        """Descarta el snapshot local e incrementa la versión para los demás workers"""
+        self._snapshot = None
+        self._checked_at = 0.0
+        try:
+            self.client.incr(self.key)
+        except RedisError:
+            # Los demás workers lo reconstruyen al vencer el TTL
+            logger.warning("No se pudo invalidar la taxonomía", exc_info=True)
+
+    def _is_current(self, snapshot: TaxonomySnapshot) -> bool:
+        now = time.monotonic()
+        if now - snapshot.built_at >= self.ttl:
+            return False
+        if now - self._checked_at < self.check_interval:
+            return True
+
+        version = self._remote_version()
+        self._checked_at = now
+        return version is None or version == snapshot.version
+
+    def _remote_version(self) -> int | None:
+        try:
+            return int(self.client.get(self.key) or 0)
+        except RedisError:
+            logger.warning("Versión de la taxonomía no disponible", exc_info=True)
+            return None
+
+    @staticmethod
+    def _build(version: int, tree: dict) -> TaxonomySnapshot:
+        body = json.dumps(
+            {"data": {"version": version, **tree}},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+        # El ETag depende del contenido: es válido aunque la versión no avance
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return TaxonomySnapshot(version, body, etag, time.monotonic())
+
+
+taxonomy_cache = TaxonomyCache(
+    redis_client,
+    ttl=settings.TAXONOMY_SNAPSHOT_TTL,
+    check_interval=settings.TAXONOMY_VERSION_CHECK_INTERVAL,
+)
+
+
+def invalidate_taxonomy():
+    """Invalidar la taxonomía tras crear/modificar/eliminar cursos, temas o subtemas"""
+    taxonomy_cache.invalidate()
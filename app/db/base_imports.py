@@ -6,8 +6,12 @@ from app.models.course import Course
 from app.models.difficulty import Difficulty
 from app.models.institution import Institution
 from app.models.question import Question
+from app.models.question_area_stat import QuestionAreaStat
 from app.models.question_content import QuestionContent
+from app.models.question_lsh_bucket import QuestionLshBucket
+from app.models.question_signature import QuestionSignature
 from app.models.question_source import QuestionSource
+from app.models.question_stat import QuestionStat
 from app.models.question_type import QuestionType
 from app.models.solution import Solution
 from app.models.solution_content import SolutionContent
@@ -1,6 +1,10 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
+from app.db.pool_metrics import PoolMetrics, pool_metrics, timed_pool_class
+from app.db.query_counter import attach_query_counter
 
 USER = settings.DB_USER
 PASSWORD = settings.DB_PASSWORD
@@ -9,15 +13,78 @@ PORT = settings.DB_PORT
 DBNAME = settings.DB_NAME
 
 DATABASE_URL = (
-    f"postgresql+psycopg://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}?sslmode=require"
+    f"postgresql+psycopg://{USER}:{PASSWORD}@{HOST}:{PORT}/{DBNAME}"
+    f"?sslmode={settings.DB_SSLMODE}"
 )
 
+pool_metrics["primary"] = PoolMetrics("primary")
 engine = create_engine(
     url=DATABASE_URL,
-    echo=True,
+    echo=settings.DB_ECHO,
     future=True,
-    pool_size=5,  # conexiones permanentes abiertas
-    max_overflow=10,  # conexiones extra en picos
-    pool_pre_ping=True,  # verifica que la conexión sigue viva
-    pool_recycle=1800,  # recicla conexiones cada 30 min
+    poolclass=timed_pool_class(QueuePool, pool_metrics["primary"]),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
+pool_metrics["primary"].attach(engine)
+attach_query_counter(engine)
+
+# Motor asíncrono (psycopg 3 en modo async) para los endpoints ``async def``
+pool_metrics["primary_async"] = PoolMetrics("primary_async")
+async_engine = create_async_engine(
+    url=DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=timed_pool_class(AsyncAdaptedQueuePool, pool_metrics["primary_async"]),
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
+pool_metrics["primary_async"].attach(async_engine.sync_engine)
+attach_query_counter(async_engine.sync_engine)
+
+# Réplica de lectura (streaming replication). Solo se crea si está configurada
+replica_engine = None
+async_replica_engine = None
+
+if settings.DB_REPLICA_HOST:
+    REPLICA_PORT = settings.DB_REPLICA_PORT or PORT
+    REPLICA_DATABASE_URL = (
+        f"postgresql+psycopg://{USER}:{PASSWORD}@{settings.DB_REPLICA_HOST}:"
+        f"{REPLICA_PORT}/{DBNAME}?sslmode={settings.DB_SSLMODE}"
+    )
+
+    pool_metrics["replica"] = PoolMetrics("replica")
+    replica_engine = create_engine(
+        url=REPLICA_DATABASE_URL,
+        echo=settings.DB_ECHO,
+        future=True,
+        poolclass=timed_pool_class(QueuePool, pool_metrics["replica"]),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    pool_metrics["replica"].attach(replica_engine)
+    attach_query_counter(replica_engine)
+
+    pool_metrics["replica_async"] = PoolMetrics("replica_async")
+    async_replica_engine = create_async_engine(
+        url=REPLICA_DATABASE_URL,
+        echo=settings.DB_ECHO,
+        poolclass=timed_pool_class(
+            AsyncAdaptedQueuePool, pool_metrics["replica_async"]
+        ),
+        pool_size=settings.DB_ASYNC_POOL_SIZE,
+        max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    pool_metrics["replica_async"].attach(async_replica_engine.sync_engine)
+    attach_query_counter(async_replica_engine.sync_engine)
@@ -0,0 +1,108 @@
+import threading
+import time
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import Pool
+
+
+class PoolMetrics:
+    """Estadísticas acumuladas de un pool de conexiones."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.connections_created = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.checkout_timeouts = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.engine: Engine | None = None
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def _increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def attach(self, engine: Engine):
+        """
+        Registra los listeners de eventos del pool del motor. Los listeners se
+        conservan si el pool se recrea (``engine.dispose()``).
+        """
+        self.engine = engine
+        pool = engine.pool
+        event.listen(pool, "connect", lambda *_: self._increment("connections_created"))
+        event.listen(pool, "checkout", lambda *_: self._increment("checkouts"))
+        event.listen(pool, "checkin", lambda *_: self._increment("checkins"))
+        event.listen(pool, "invalidate", lambda *_: self._increment("invalidations"))
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool if self.engine is not None else None
+        with self._lock:
+            wait_avg = self.wait_total / self.wait_count if self.wait_count else 0.0
+            return {
+                "name": self.name,
+                "pool_size": pool.size() if pool is not None else 0,
+                "checked_out": pool.checkedout() if pool is not None else 0,
+                "checked_in": pool.checkedin() if pool is not None else 0,
+                "overflow": pool.overflow() if pool is not None else 0,
+                "connections_created": self.connections_created,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "checkout_timeouts": self.checkout_timeouts,
+                "wait_count": self.wait_count,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_avg_ms": round(wait_avg * 1000, 3),
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+def timed_pool_class(base: type[Pool], metrics: PoolMetrics) -> type[Pool]:
+    """
+    Subclase de ``base`` que mide el tiempo de espera al obtener una conexión.
+    Los eventos del pool no exponen el inicio de la espera, por eso se mide aquí.
+
+    Solo se mide la espera en la cola del pool: cuando hay overflow disponible,
+    ``_do_get`` también abre la conexión nueva (TCP, TLS, autenticación), y esa
+    latencia no indica falta de conexiones.
+    """
+
+    class TimedPool(base):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            queue_get = self._pool.get
+
+            def timed_get(block=True, timeout=None):
+                start = time.perf_counter()
+                try:
+                    return queue_get(block, timeout)
+                finally:
+                    metrics.record_wait(time.perf_counter() - start)
+
+            self._pool.get = timed_get
+
+        def _do_get(self):
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+# Registro de métricas por motor (sync, async, ...)
+pool_metrics: dict[str, PoolMetrics] = {}
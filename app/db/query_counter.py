@@ -0,0 +1,103 @@
+"""
+Conteo de sentencias SQL por petición.
+
+Un listener ``before_cursor_execute`` en cada motor incrementa el contador activo
+en el contexto (``ContextVar``), de modo que cuenta tanto las sesiones síncronas
+(threadpool de FastAPI, que copia el contexto) como las asíncronas (el greenlet de
+SQLAlchemy hereda el contexto de la tarea).
+
+``QUERY_BUDGETS`` fija el máximo de sentencias de cada endpoint con la caché fría:
+con ``lazy="raise"`` en los modelos no debería haber N+1 implícitos, pero una
+carga de más (o un ``selectinload`` olvidado que se reemplace por consultas a
+mano) aparece como un endpoint que supera su presupuesto.
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+# Máximo de sentencias por endpoint ("MÉTODO ruta"); los conteos cacheados
+# (``include_total``) se cuentan como fallos de caché
+QUERY_BUDGETS: dict[str, int] = {
+    # Página (limit + 1) y conteo
+    "GET /api/v1/topics": 2,
+    "GET /api/v1/subtopics": 2,
+    "GET /api/v1/institutions": 2,
+    "GET /api/v1/sources": 2,
+    "GET /api/v1/questions": 2,
+    "GET /api/v1/questions/search": 2,
+    # Entidad con su relación many-to-one (JOIN)
+    "GET /api/v1/topics/{topic_id}": 1,
+    "GET /api/v1/subtopics/{subtopic_id}": 1,
+    "GET /api/v1/institutions/{institution_id}": 1,
+    "GET /api/v1/sources/{source_id}": 1,
+    # Pregunta (con subtema y dificultad) + contenidos, áreas y fuentes; con
+    # ``view=full`` además alternativas y soluciones con sus contenidos
+    "GET /api/v1/questions/{question_id}": 8,
+    # Árbol completo en un documento JSON (0 si el snapshot está vigente)
+    "GET /api/v1/taxonomy": 1,
+    # Reclasificación masiva: bloqueo, áreas actuales, UPDATE, DELETE, INSERT y
+    # conteos (2), más las tablas de referencia (3) si la caché está fría; no
+    # depende de la cantidad de preguntas
+    "PATCH /api/v1/questions/bulk": 10,
+}
+
+
+class QueryCounter:
+    """
+    Sentencias ejecutadas dentro de un ``count_queries``. Los contadores se anidan:
+    cada sentencia suma también en los contadores externos (``parent``).
+    """
+
+    def __init__(self, parent: "QueryCounter | None" = None):
+        self.statements = 0
+        self.parent = parent
+
+
+_current_counter: ContextVar[QueryCounter | None] = ContextVar(
+    "query_counter", default=None
+)
+
+
+def _on_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    counter = _current_counter.get()
+    while counter is not None:
+        counter.statements += 1
+        counter = counter.parent
+
+
+def attach_query_counter(engine: Engine):
+    """Registra el listener en ``engine`` (para async: ``async_engine.sync_engine``)"""
+    event.listen(engine, "before_cursor_execute", _on_cursor_execute)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Cuenta las sentencias ejecutadas por el código dentro del bloque"""
+    counter = QueryCounter(parent=_current_counter.get())
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def query_budget(endpoint: str, default: int) -> int:
+    return QUERY_BUDGETS.get(endpoint, default)
+
+
+def check_query_budget(endpoint: str, statements: int, default: int) -> bool:
+    """Registra una advertencia si ``endpoint`` superó su presupuesto"""
+    budget = query_budget(endpoint, default)
+    if statements <= budget:
+        return True
+
+    logger.warning(
+        "%s ejecutó %s sentencias SQL (presupuesto: %s)", endpoint, statements, budget
+    )
+    return False
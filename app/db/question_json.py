@@ -0,0 +1,163 @@
+"""
+Proyecciones JSON de preguntas construidas en PostgreSQL (``json_build_object`` y
+``json_agg``). Cada expresión devuelve el documento completo de una pregunta en una
+sola columna, con la misma forma (claves y orden) que los esquemas públicos
+``QuestionSummaryPublic``/``QuestionDetailPublic``/``QuestionExportRecord``, de modo
+que se puede entregar al cliente sin materializar entidades del ORM ni modelos de
+Pydantic.
+"""
+
+from sqlalchemy import ColumnElement, Select, Text, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from app.models.area import Area
+from app.models.choice import Choice
+from app.models.choice_content import ChoiceContent
+from app.models.difficulty import Difficulty
+from app.models.question import Question
+from app.models.question_areas import question_areas
+from app.models.question_content import QuestionContent
+from app.models.question_source import QuestionSource
+from app.models.solution import Solution
+from app.models.solution_content import SolutionContent
+from app.models.source import Source
+from app.models.subtopic import Subtopic
+
+EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def json_array(element, order_by, *where) -> ColumnElement:
+    """Subconsulta correlacionada: ``element`` de cada fila agregado en un arreglo."""
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(element, order_by)), EMPTY_JSON_ARRAY
+            )
+        )
+        .where(*where)
+        .scalar_subquery()
+    )
+
+
+def content_json(model) -> ColumnElement:
+    """Objeto de un contenido (enunciado, alternativa o solución)."""
+    fields = ["id", model.id]
+    if hasattr(model, "label"):
+        # Solo los contenidos del enunciado tienen etiqueta (I, II, ...)
+        fields += ["label", model.label]
+    fields += ["type", model.type, "value", model.value, "order", model.order]
+    return func.json_build_object(*fields)
+
+
+def question_contents_json() -> ColumnElement:
+    return json_array(
+        content_json(QuestionContent),
+        QuestionContent.order,
+        QuestionContent.question_id == Question.id,
+    )
+
+
+def question_choices_json() -> ColumnElement:
+    contents = json_array(
+        content_json(ChoiceContent),
+        ChoiceContent.order,
+        ChoiceContent.choice_id == Choice.id,
+    )
+    choice = func.json_build_object(
+        "id",
+        Choice.id,
+        "is_correct",
+        Choice.is_correct,
+        "label",
+        Choice.label,
+        "contents",
+        contents,
+    )
+    return json_array(choice, Choice.label, Choice.question_id == Question.id)
+
+
+def question_solutions_json() -> ColumnElement:
+    contents = json_array(
+        content_json(SolutionContent),
+        SolutionContent.order,
+        SolutionContent.solution_id == Solution.id,
+    )
+    solution = func.json_build_object("id", Solution.id, "contents", contents)
+    return json_array(solution, Solution.id, Solution.question_id == Question.id)
+
+
+def question_areas_json() -> ColumnElement:
+    return json_array(
+        Area.code,
+        Area.code,
+        question_areas.c.question_id == Question.id,
+        question_areas.c.area_id == Area.id,
+    )
+
+
+def question_sources_json() -> ColumnElement:
+    source = func.json_build_object(
+        "page",
+        QuestionSource.page,
+        "source",
+        func.json_build_object(
+            "id", Source.id, "name", Source.name, "year", Source.year
+        ),
+    )
+    return json_array(
+        source,
+        QuestionSource.id,
+        QuestionSource.question_id == Question.id,
+        QuestionSource.source_id == Source.id,
+    )
+
+
+def question_document_fields(view: str) -> list:
+    """
+    Pares clave/valor del documento de una pregunta según ``view`` (``summary`` o
+    ``full``). Requiere los JOIN de ``join_question_document``.
+    """
+    fields = [
+        "id",
+        Question.id,
+        "contents",
+        question_contents_json(),
+        "difficulty",
+        func.json_build_object("name", Difficulty.name, "code", Difficulty.code),
+        "areas",
+        question_areas_json(),
+        "subtopic",
+        func.json_build_object("id", Subtopic.id, "name", Subtopic.name),
+    ]
+    if view == "full":
+        fields += [
+            "choices",
+            question_choices_json(),
+            "solutions",
+            question_solutions_json(),
+        ]
+    fields += ["sources", question_sources_json()]
+    return fields
+
+
+def join_question_document(stmt: Select) -> Select:
+    """Agrega los JOIN a uno que necesita ``question_document_fields``."""
+    return stmt.join(Difficulty, Difficulty.id == Question.difficulty_id).join(
+        Subtopic, Subtopic.id == Question.subtopic_id
+    )
+
+
+def question_document_json(view: str) -> ColumnElement:
+    """Documento de la pregunta (``json``; el driver lo entrega como ``dict``)."""
+    return func.json_build_object(*question_document_fields(view))
+
+
+def question_export_json() -> ColumnElement:
+    """Documento de ``QuestionExportRecord`` como texto (se escribe tal cual)."""
+    fields = question_document_fields("full") + [
+        "question_hash",
+        Question.question_hash,
+        "question_type_id",
+        Question.question_type_id,
+    ]
+    return cast(func.json_build_object(*fields), Text)
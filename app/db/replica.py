@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import threading
+import time
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Retraso de la réplica en segundos. Si ya reprodujo todo lo recibido el retraso es 0
+# (aunque la última transacción sea antigua); en el primario también es 0. Eso solo
+# vale con el receptor de WAL conectado y recibiendo: si está desconectado o sin
+# mensajes del primario en ``DB_REPLICA_RECEIVER_TIMEOUT`` segundos, el retraso es
+# desconocido (``NULL``). Leer ``pg_stat_wal_receiver`` requiere ``pg_monitor``.
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1
+            FROM pg_stat_wal_receiver
+            WHERE status = 'streaming'
+              AND last_msg_receipt_time
+                  > now() - make_interval(secs => :receiver_timeout)
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+).bindparams(receiver_timeout=settings.DB_REPLICA_RECEIVER_TIMEOUT)
+
+
+def _to_lag(value) -> float | None:
+    return float(value) if value is not None else None
+
+class ReplicaLagMonitor:
+    """
+    Decide si una réplica puede atender lecturas según su retraso de replicación.
+    El retraso se mide como máximo una vez cada ``check_interval`` segundos; si la
+    medición falla la réplica se considera no disponible hasta la siguiente.
+    """
+
+    def __init__(self, name: str, max_lag: float, check_interval: float):
+        self.name = name
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag: float | None = None
+        self._healthy = False
+        self._checked_at: float | None = None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._checked_at is not None
+            and time.monotonic() - self._checked_at < self.check_interval
+        )
+
+    def _record(self, lag: float | None):
+        self.lag = lag
+        healthy = lag is not None and lag <= self.max_lag
+
+        if healthy != self._healthy:
+            if healthy:
+                logger.info("Réplica '%s' disponible (retraso %.2fs)", self.name, lag)
+            else:
+                logger.warning(
+                    "Réplica '%s' no disponible (retraso %s), se usa el primario",
+                    self.name,
+                    f"{lag:.2f}s" if lag is not None else "desconocido",
+                )
+
+        self._healthy = healthy
+        self._checked_at = time.monotonic()
+
+
+class SyncReplicaLagMonitor(ReplicaLagMonitor):
+    def __init__(self, engine: Engine, **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self._lock = threading.Lock()
+
+    def is_healthy(self) -> bool:
+        if self._is_fresh():
+            return self._healthy
+
+        with self._lock:
+            # Otro hilo pudo medir mientras se esperaba el lock
+            if self._is_fresh():
+                return self._healthy
+
+            try:
+                with self.engine.connect() as connection:
+                    lag = _to_lag(connection.scalar(REPLICA_LAG_QUERY))
+            except SQLAlchemyError:
+                logger.exception("Error al medir el retraso de la réplica")
+                lag = None
+
+            self._record(lag)
+            return self._healthy
+
+
+class AsyncReplicaLagMonitor(ReplicaLagMonitor):
+    def __init__(self, engine: AsyncEngine, **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self._lock = asyncio.Lock()
+
+    async def is_healthy(self) -> bool:
+        if self._is_fresh():
+            return self._healthy
+
+        async with self._lock:
+            if self._is_fresh():
+                return self._healthy
+
+            try:
+                async with self.engine.connect() as connection:
+                    lag = _to_lag(await connection.scalar(REPLICA_LAG_QUERY))
+            except SQLAlchemyError:
+                logger.exception("Error al medir el retraso de la réplica")
+                lag = None
+
+            self._record(lag)
+            return self._healthy
+
+
+def build_monitor_kwargs(name: str) -> dict:
+    return {
+        "name": name,
+        "max_lag": settings.DB_REPLICA_MAX_LAG_SECONDS,
+        "check_interval": settings.DB_REPLICA_LAG_CHECK_INTERVAL,
+    }
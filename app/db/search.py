@@ -0,0 +1,20 @@
+"""Búsqueda de texto completo en Postgres (configuración en español, sin tildes)."""
+
+from sqlalchemy import func, literal_column
+
+SEARCH_CONFIG = "spanish"
+
+# Columnas generadas ``search_vector`` de los contenidos (las imágenes no se indexan).
+# ``immutable_unaccent`` se crea en la migración: ``unaccent`` no es IMMUTABLE y no
+# puede usarse directamente en una columna generada ni en un índice.
+SEARCH_VECTOR_EXPRESSION = (
+    "CASE WHEN type = 'text' THEN "
+    f"to_tsvector('{SEARCH_CONFIG}'::regconfig, immutable_unaccent(value)) END"
+)
+
+
+def search_tsquery(text: str):
+    """Consulta en sintaxis de buscador web: "frase exacta", -excluir, OR."""
+    return func.websearch_to_tsquery(
+        literal_column(f"'{SEARCH_CONFIG}'::regconfig"), func.immutable_unaccent(text)
+    )
@@ -1,8 +1,57 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.engine import engine
+from app.db.engine import async_engine, async_replica_engine, engine, replica_engine
+from app.db.replica import (
+    AsyncReplicaLagMonitor,
+    SyncReplicaLagMonitor,
+    build_monitor_kwargs,
+)
+
+replica_monitor = (
+    SyncReplicaLagMonitor(replica_engine, **build_monitor_kwargs("replica"))
+    if replica_engine is not None
+    else None
+)
+async_replica_monitor = (
+    AsyncReplicaLagMonitor(
+        async_replica_engine, **build_monitor_kwargs("replica_async")
+    )
+    if async_replica_engine is not None
+    else None
+)
 
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+
+def get_read_session():
+    """
+    Sesión de solo lectura: usa la réplica si está configurada y su retraso está
+    dentro de lo tolerado; en otro caso usa el primario.
+    """
+    bind = engine
+    if replica_monitor is not None and replica_monitor.is_healthy():
+        bind = replica_engine
+
+    with Session(bind) as session:
+        yield session
+
+
+async def get_async_session():
+    # expire_on_commit=False: evita cargas implícitas (no permitidas en async)
+    # al acceder a los atributos después de un commit
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def get_async_read_session():
+    """Variante asíncrona de ``get_read_session``."""
+    bind = async_engine
+    if async_replica_monitor is not None and await async_replica_monitor.is_healthy():
+        bind = async_replica_engine
+
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        yield session
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, fields
+
+
+@dataclass(frozen=True)
+class QuestionFilters:
+    """Criterios de búsqueda de preguntas. Los campos en ``None`` no filtran."""
+
+    subtopic_id: int | None = None
+    topic_id: int | None = None
+    course_id: int | None = None
+    difficulty_id: int | None = None
+    question_type_id: int | None = None
+    area_codes: tuple[str, ...] = ()
+    source_id: int | None = None
+    year: int | None = None
+
+    def is_empty(self) -> bool:
+        return not any(getattr(self, field.name) for field in fields(self))
+
+    def cache_key(self) -> str:
+        """
+        Representación estable de los filtros activos (ej.
+        ``subtopic_id=3&year=2024``).
+        """
+        parts = []
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if not value:
+                continue
+
+            if isinstance(value, tuple):
+                value = ",".join(sorted(value))
+
+            parts.append(f"{field.name}={value}")
+
+        return "&".join(parts)
@@ -0,0 +1,99 @@
+"""
+Detección de preguntas casi duplicadas con MinHash + LSH.
+
+El texto de la pregunta se normaliza (sin tildes, signos de puntuación ni espacios
+repetidos) y se divide en shingles de caracteres. La firma MinHash de ese conjunto
+permite estimar la similitud de Jaccard entre dos preguntas, y el LSH agrupa las
+firmas en bandas: dos preguntas son candidatas si coinciden en al menos una banda,
+lo que evita comparar cada pregunta con todas las demás.
+
+Los parámetros (semilla, número de permutaciones, bandas) definen las firmas
+guardadas: si se cambian, se deben recalcular todas (``app.cli.index_similarity``).
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+from collections.abc import Iterable, Sequence
+
+from app.domain.question.hash import QuestionHashContent
+
+SHINGLE_SIZE = 5
+NUM_PERMUTATIONS = 128
+# 16 bandas de 8 filas: umbral efectivo del LSH ~ (1/16)^(1/8) ≈ 0.7
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_SEED = 20260101
+
+_rng = random.Random(_SEED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    """Minúsculas, sin tildes, sin puntuación y con un solo espacio entre palabras."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_WORD.sub(" ", without_accents).strip()
+
+
+def question_text(contents: Iterable[QuestionHashContent]) -> str:
+    """Texto normalizado de los contenidos de tipo texto, en su orden."""
+    ordered = sorted(contents, key=lambda i: i.order)
+    parts = [
+        normalize_text(item.value)
+        for item in ordered
+        if getattr(item.type, "value", item.type) == "text"
+    ]
+    return " ".join(part for part in parts if part)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    if len(text) <= size:
+        return {text} if text else set()
+
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def _hash64(value: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "big")
+
+
+def minhash_signature(items: set[str]) -> list[int]:
+    hashes = [_hash64(item.encode("utf-8")) for item in items]
+    return [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    ]
+
+
+def question_signature(contents: Iterable[QuestionHashContent]) -> list[int] | None:
+    """Firma MinHash de una pregunta; ``None`` si no tiene texto (solo imágenes)."""
+    items = shingles(question_text(contents))
+    if not items:
+        return None
+
+    return minhash_signature(items)
+
+
+def lsh_buckets(signature: Sequence[int]) -> list[int]:
+    """Un bucket (entero de 64 bits con signo, cabe en BIGINT) por cada banda."""
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(
+            ",".join(map(str, rows)).encode(), digest_size=8
+        ).digest()
+        buckets.append(int.from_bytes(digest, "big", signed=True))
+    return buckets
+
+
+def estimate_similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Similitud de Jaccard estimada: fracción de permutaciones coincidentes."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERMUTATIONS
@@ -4,9 +4,32 @@ from typing import TypeVar
 T = TypeVar("T")
 
 
-def build_paginated_response(items: list[T], total: int, page: int, limit: int):
-    pages = math.ceil(total / limit) if total > 0 else 1
+def build_paginated_response(
+    items: list[T],
+    total: int | None,
+    page: int | None,
+    limit: int,
+    next_cursor: str | None = None,
+    has_next: bool | None = None,
+):
+    """
+    ``total`` puede ser ``None`` cuando el cliente no lo solicitó; en ese caso
+    ``has_next`` debe indicarse (se obtiene pidiendo ``limit + 1`` registros).
+    """
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / limit) if total > 0 else 1
+        if has_next is None:
+            has_next = (page or 1) < pages
+
     return {
         "data": items,
-        "meta": {"page": page, "size": len(items), "total": total, "pages": pages},
+        "meta": {
+            "page": page,
+            "size": len(items),
+            "total": total,
+            "pages": pages,
+            "has_next": bool(has_next),
+            "next_cursor": next_cursor,
+        },
     }
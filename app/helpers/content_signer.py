@@ -6,11 +6,46 @@ class SignableContent(Protocol):
     value: str
 
 
+def _is_image(content: SignableContent) -> bool:
+    content_type = getattr(content.type, "value", content.type)
+    return content_type == "image"
+
+
 def sign_image_contents(
         contents: Iterable[SignableContent],
         sign_storage_object_name: Callable[[str], str],
 ) -> None:
     for content in contents:
-        content_type = getattr(content.type, "value", content.type)
-        if content_type == "image":
+        if _is_image(content):
             content.value = sign_storage_object_name(content.value)
+
+
+def sign_image_contents_bulk(
+        contents: Iterable[SignableContent],
+        sign_storage_object_names: Callable[[list[str]], dict[str, str]],
+) -> None:
+    """
+    Firma todas las imágenes de ``contents`` con una sola llamada, de modo que los
+    nombres repetidos se firman una única vez.
+    """
+    image_contents = [content for content in contents if _is_image(content)]
+    if not image_contents:
+        return
+
+    urls = sign_storage_object_names([content.value for content in image_contents])
+    for content in image_contents:
+        content.value = urls[content.value]
+
+
+def sign_image_documents_bulk(
+        contents: Iterable[dict],
+        sign_storage_object_names: Callable[[list[str]], dict[str, str]],
+) -> None:
+    """Igual que ``sign_image_contents_bulk`` para contenidos de documentos JSON."""
+    image_contents = [content for content in contents if content["type"] == "image"]
+    if not image_contents:
+        return
+
+    urls = sign_storage_object_names([content["value"] for content in image_contents])
+    for content in image_contents:
+        content["value"] = urls[content["value"]]
@@ -0,0 +1,27 @@
+import base64
+import binascii
+import json
+
+from app.core.exceptions.domain import InvalidCursorError
+
+
+def encode_cursor(last_id: int) -> str:
+    """Genera un cursor opaco a partir del último ID devuelto en la página."""
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Obtiene el último ID a partir de un cursor generado con ``encode_cursor``."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = int(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("El cursor de paginación no es válido") from e
+
+    if last_id < 0:
+        raise InvalidCursorError("El cursor de paginación no es válido")
+
+    return last_id
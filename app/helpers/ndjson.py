@@ -0,0 +1,49 @@
+from collections.abc import AsyncIterator
+
+
+async def iter_ndjson_lines(
+        chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[bytes | None]:
+    """
+    Recorre un cuerpo NDJSON (un documento JSON por línea) a medida que llega, sin
+    cargarlo completo en memoria. Las líneas vacías se omiten.
+
+    Las líneas se devuelven sin decodificar (el validador informa el UTF-8
+    inválido). Una línea de más de ``max_line_bytes`` se descarta sin acumularla y
+    se devuelve ``None`` en su lugar.
+    """
+    buffer = bytearray()
+    skipping = False  # descartando el resto de una línea demasiado larga
+    async for chunk in chunks:
+        start = 0
+        # Solo se busca el salto de línea en el fragmento nuevo
+        while (end := chunk.find(b"\n", start)) != -1:
+            piece = chunk[start:end]
+            start = end + 1
+            if skipping:
+                skipping = False
+                continue
+
+            if len(buffer) + len(piece) > max_line_bytes:
+                buffer.clear()
+                yield None
+                continue
+
+            buffer += piece
+            if buffer.strip():
+                yield bytes(buffer)
+            buffer.clear()
+
+        if skipping:
+            continue
+
+        rest = chunk[start:]
+        if len(buffer) + len(rest) > max_line_bytes:
+            buffer.clear()
+            skipping = True
+            yield None
+        else:
+            buffer += rest
+
+    if not skipping and buffer.strip():
+        yield bytes(buffer)
@@ -1,4 +1,5 @@
 import datetime
+from collections.abc import Iterable
 
 from google.cloud.storage import Client
 
@@ -33,12 +34,28 @@ class GCPStorageAdapter(StoragePort):
         # La URL firmada solo valida permisos y expiración, no existencia del blob.
         url = blob.generate_signed_url(
             version="v4",
-            expiration=datetime.timedelta(minutes=15),
+            expiration=datetime.timedelta(
+                minutes=settings.SIGNED_URL_EXPIRATION_MINUTES
+            ),
             method="GET",
         )
 
         return url
 
+    def generate_signed_urls(
+            self, storage_container_name: str, storage_object_names: Iterable[str]
+    ) -> dict[str, str]:
+        # Un solo bucket para todas las firmas
+        bucket = self.storage_client.bucket(storage_container_name)
+        expiration = datetime.timedelta(minutes=settings.SIGNED_URL_EXPIRATION_MINUTES)
+
+        return {
+            name: bucket.blob(name).generate_signed_url(
+                version="v4", expiration=expiration, method="GET"
+            )
+            for name in storage_object_names
+        }
+
     # https://docs.cloud.google.com/storage/docs/uploading-objects-from-memory?hl=es-419#uploading-an-object-from-memory
     def upload_object_from_bytes(
             self,
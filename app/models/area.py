@@ -18,5 +18,5 @@ class Area(Base):
     code: Mapped[str] = mapped_column(String(1), unique=True)
 
     questions: Mapped[list["Question"]] = relationship(
-        secondary=question_areas, back_populates="areas"
+        secondary=question_areas, back_populates="areas", lazy="raise"
     )
@@ -20,10 +20,10 @@ class Choice(Base):
     label: Mapped[str] = mapped_column(String(1), nullable=True)  # CAMBIAR A FALSE
     is_correct: Mapped[bool] = mapped_column(Boolean, nullable=False)
 
-    question: Mapped["Question"] = relationship(back_populates="choices")
+    question: Mapped["Question"] = relationship(back_populates="choices", lazy="raise")
     contents: Mapped[list["ChoiceContent"]] = relationship(
         back_populates="choice",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
         order_by="ChoiceContent.order",
     )
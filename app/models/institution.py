@@ -26,5 +26,7 @@ class Institution(Base):
     type: Mapped[InstitutionType] = mapped_column(String(20), nullable=False)
 
     sources: Mapped[list["Source"]] = relationship(
-        back_populates="institution", lazy="selectin"
+        # Sin cascada: no se cargan las fuentes al eliminar una institución (la FK
+        # de ``sources`` rechaza el borrado si tiene fuentes asociadas)
+        back_populates="institution", lazy="raise", passive_deletes="all"
     )
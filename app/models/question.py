@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -19,6 +19,16 @@ if TYPE_CHECKING:
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        # Filtros + paginación ordenada por id (keyset)
+        Index("ix_questions_subtopic_id_id", "subtopic_id", "id"),
+        Index("ix_questions_difficulty_id_id", "difficulty_id", "id"),
+        Index("ix_questions_question_type_id_id", "question_type_id", "id"),
+        # Muestreo aleatorio de simulacros (ver ``random_key``)
+        Index("ix_questions_random_key", "random_key"),
+        Index("ix_questions_subtopic_id_random_key", "subtopic_id", "random_key"),
+        Index("ix_questions_difficulty_id_random_key", "difficulty_id", "random_key"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     question_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True)
@@ -29,13 +39,18 @@ class Question(Base):
     difficulty_id: Mapped[int] = mapped_column(
         ForeignKey("difficulties.id"), index=True
     )
+    # Clave aleatoria fija en [0, 1): tomar las N siguientes a un punto al azar es
+    # una muestra aleatoria que usa índice, a diferencia de ORDER BY random()
+    random_key: Mapped[float] = mapped_column(
+        Float, nullable=False, server_default=func.random()
+    )
 
     question_type: Mapped["QuestionType"] = relationship(lazy="raise")
-    subtopic: Mapped["Subtopic"] = relationship(lazy="joined")
-    difficulty: Mapped["Difficulty"] = relationship(lazy="joined")
+    subtopic: Mapped["Subtopic"] = relationship(lazy="raise")
+    difficulty: Mapped["Difficulty"] = relationship(lazy="raise")
 
     areas: Mapped[list["Area"]] = relationship(
-        secondary=question_areas, back_populates="questions", lazy="selectin"
+        secondary=question_areas, back_populates="questions", lazy="raise"
     )
     choices: Mapped[list["Choice"]] = relationship(
         back_populates="question",
@@ -46,11 +61,11 @@ class Question(Base):
     contents: Mapped[list["QuestionContent"]] = relationship(
         back_populates="question",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="raise",
         order_by="QuestionContent.order",
     )
     question_sources: Mapped[list["QuestionSource"]] = relationship(
-        back_populates="question", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="question", cascade="all, delete-orphan", lazy="raise"
     )
     solutions: Mapped[list["Solution"]] = relationship(
         back_populates="question", cascade="all, delete-orphan", lazy="raise"
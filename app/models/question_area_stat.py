@@ -0,0 +1,24 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class QuestionAreaStat(Base):
+    """Conteo de preguntas por (área, subtema, dificultad, tipo)."""
+
+    __tablename__ = "question_area_stats"
+
+    area_id: Mapped[int] = mapped_column(
+        ForeignKey("areas.id", ondelete="CASCADE"), primary_key=True
+    )
+    subtopic_id: Mapped[int] = mapped_column(
+        ForeignKey("subtopics.id", ondelete="CASCADE"), primary_key=True
+    )
+    difficulty_id: Mapped[int] = mapped_column(
+        ForeignKey("difficulties.id", ondelete="CASCADE"), primary_key=True
+    )
+    question_type_id: Mapped[int] = mapped_column(
+        ForeignKey("question_types.id", ondelete="CASCADE"), primary_key=True
+    )
+    question_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 
 from app.db.base import Base
 
@@ -17,4 +17,6 @@ question_areas = Table(
         primary_key=True,
         index=True,
     ),
+    # Búsqueda de preguntas por área (la PK cubre question_id, area_id)
+    Index("ix_question_areas_area_id_question_id", "area_id", "question_id"),
 )
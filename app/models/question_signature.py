@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class QuestionSignature(Base):
+    """Firma MinHash del texto de una pregunta (``None`` si solo tiene imágenes)."""
+
+    __tablename__ = "question_signatures"
+
+    question_id: Mapped[int] = mapped_column(
+        ForeignKey("questions.id", ondelete="CASCADE"), primary_key=True
+    )
+    signature: Mapped[list[int] | None] = mapped_column(ARRAY(BigInteger))
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 class QuestionSource(Base):
     __tablename__ = "question_sources"
+    __table_args__ = (
+        Index("ix_question_sources_source_id_question_id", "source_id", "question_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     question_id: Mapped[int] = mapped_column(
@@ -22,5 +25,9 @@ class QuestionSource(Base):
     )
     page: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    question: Mapped["Question"] = relationship(back_populates="question_sources")
-    source: Mapped["Source"] = relationship(back_populates="question_sources", lazy="joined")
+    question: Mapped["Question"] = relationship(
+        back_populates="question_sources", lazy="raise"
+    )
+    source: Mapped["Source"] = relationship(
+        back_populates="question_sources", lazy="raise"
+    )
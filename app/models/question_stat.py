@@ -0,0 +1,25 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class QuestionStat(Base):
+    """
+    Conteo de preguntas por (subtema, dificultad, tipo). Se mantiene en la misma
+    transacción que crea, modifica o elimina preguntas; el curso y el tema se
+    obtienen del subtema al consultar.
+    """
+
+    __tablename__ = "question_stats"
+
+    subtopic_id: Mapped[int] = mapped_column(
+        ForeignKey("subtopics.id", ondelete="CASCADE"), primary_key=True
+    )
+    difficulty_id: Mapped[int] = mapped_column(
+        ForeignKey("difficulties.id", ondelete="CASCADE"), primary_key=True
+    )
+    question_type_id: Mapped[int] = mapped_column(
+        ForeignKey("question_types.id", ondelete="CASCADE"), primary_key=True
+    )
+    question_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
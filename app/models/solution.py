@@ -15,6 +15,8 @@ class Solution(Base):
     )
 
     contents: Mapped[list["SolutionContent"]] = relationship(
-        back_populates="solution", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="solution", cascade="all, delete-orphan", lazy="raise"
+    )
+    question: Mapped["Question"] = relationship(
+        back_populates="solutions", lazy="raise"
     )
-    question: Mapped["Question"] = relationship(back_populates="solutions")
@@ -1,9 +1,11 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import Computed, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.search import SEARCH_VECTOR_EXPRESSION
 from app.domain.content_type import ContentType
 
 if TYPE_CHECKING:
@@ -17,8 +19,14 @@ class SolutionContent(Base):
     type: Mapped[ContentType] = mapped_column(String, nullable=False)
     value: Mapped[str] = mapped_column(String, nullable=False)
     order: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Solo para búsqueda: diferida para no cargarla con el contenido
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
     solution_id: Mapped[int] = mapped_column(
         ForeignKey("solutions.id", ondelete="CASCADE"), index=True
     )
 
-    solution: Mapped["Solution"] = relationship(back_populates="contents")
+    solution: Mapped["Solution"] = relationship(back_populates="contents", lazy="raise")
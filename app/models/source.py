@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
 class Source(Base):
     __tablename__ = "sources"
+    __table_args__ = (Index("ix_sources_year_id", "year", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
@@ -21,8 +22,8 @@ class Source(Base):
     )
 
     institution: Mapped["Institution"] = relationship(
-        back_populates="sources", lazy="joined"
+        back_populates="sources", lazy="raise"
     )
     question_sources: Mapped[list["QuestionSource"]] = relationship(
-        back_populates="source", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="source", cascade="all, delete-orphan", lazy="raise"
     )
@@ -13,6 +13,6 @@ class Subtopic(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(200))
-    topic_id: Mapped[int] = mapped_column(ForeignKey("topics.id"))
+    topic_id: Mapped[int] = mapped_column(ForeignKey("topics.id"), index=True)
 
-    topic: Mapped["Topic"] = relationship()
+    topic: Mapped["Topic"] = relationship(lazy="raise")
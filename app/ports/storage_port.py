@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 
 class StoragePort(ABC):
@@ -15,6 +16,21 @@ class StoragePort(ABC):
         """
         pass
 
+    def generate_signed_urls(
+            self, storage_container_name: str, storage_object_names: Iterable[str]
+    ) -> dict[str, str]:
+        """
+        Genera URLs firmadas para varios objetos del mismo contenedor.
+        Los adaptadores pueden sobrescribirlo para reutilizar recursos entre firmas.
+        :param storage_container_name: Nombre del bucket o contenedor.
+        :param storage_object_names: Nombres o rutas de los objetos (sin duplicados).
+        :return: Diccionario ``{nombre del objeto: URL firmada}``.
+        """
+        return {
+            name: self.generate_signed_url(storage_container_name, name)
+            for name in storage_object_names
+        }
+
     @abstractmethod
     def upload_object_from_bytes(
             self,
@@ -1,7 +1,7 @@
-from typing import List
+from collections.abc import Iterable
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.models.area import Area
 
@@ -10,7 +10,19 @@ class AreaRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_areas(self, ids: List[int]):
-        stmt = select(Area).where(Area.id.in_(ids))
-        areas = self.db.scalars(stmt).all()
+    def get_area_refs_db(self):
+        """Todas las áreas (``id``, ``name``, ``code``) para la caché de referencia"""
+        return self.db.execute(select(Area.id, Area.name, Area.code)).all()
+
+    def attach_areas(self, rows: Iterable[Row]) -> list[Area]:
+        """
+        Instancias de ``Area`` asociadas a la sesión a partir de filas cacheadas, sin
+        consultar la BD: ``merge(load=False)`` las trata como ya cargadas (o reutiliza
+        la instancia del identity map si la sesión ya la tiene).
+        """
+        areas = []
+        for row in rows:
+            area = Area(id=row.id, name=row.name, code=row.code)
+            make_transient_to_detached(area)
+            areas.append(self.db.merge(area, load=False))
         return areas
@@ -0,0 +1,154 @@
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import aget_or_compute_count, ainvalidate_counts
+from app.core.question_cache import ainvalidate_question_cache
+from app.core.question_hash_index import question_hash_index
+from app.domain.question.filters import QuestionFilters
+from app.models.question import Question
+from app.models.question_areas import question_areas
+from app.repositories.question_repository import (
+    QUESTIONS_COUNT_NAMESPACE,
+    QUESTIONS_FILTERED_COUNT_NAMESPACE,
+    build_exam_sample_stmt,
+    build_question_stmt,
+    build_questions_count_stmt,
+    build_questions_document_page_stmt,
+    build_questions_search_count_stmt,
+    build_questions_search_stmt,
+    build_questions_solve_stmt,
+    questions_count_cache_key,
+)
+from app.repositories.question_stats_repository import QuestionStatsDelta
+
+
+class AsyncQuestionRepository:
+    """Variante asíncrona de ``QuestionRepository`` (mismas consultas)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_questions_db(
+            self,
+            limit: int,
+            view: str,
+            page: int = 1,
+            after_id: int | None = None,
+            filters: QuestionFilters | None = None,
+    ) -> list[dict]:
+        """Página de preguntas, cada una como documento JSON (``dict``)."""
+        stmt = build_questions_document_page_stmt(
+            view=view, limit=limit, page=page, after_id=after_id, filters=filters
+        )
+        result = await self.db.scalars(stmt)
+        return list(result.all())
+
+    async def count_questions_db(self, filters: QuestionFilters | None = None) -> int:
+        namespace, variant = questions_count_cache_key(filters)
+
+        return await aget_or_compute_count(
+            namespace,
+            variant,
+            lambda: self.db.scalar(build_questions_count_stmt(filters)),
+            ttl=300,
+        )
+
+    async def search_questions_db(
+            self,
+            query: str,
+            limit: int,
+            view: str,
+            page: int = 1,
+            filters: QuestionFilters | None = None,
+    ) -> list[dict]:
+        stmt = build_questions_search_stmt(
+            query=query, view=view, limit=limit, page=page, filters=filters
+        )
+        result = await self.db.scalars(stmt)
+        return list(result.all())
+
+    async def count_search_questions_db(
+            self, query: str, filters: QuestionFilters | None = None
+    ) -> int:
+        # Sin caché: las búsquedas rara vez se repiten con los mismos términos
+        return await self.db.scalar(build_questions_search_count_stmt(query, filters))
+
+    async def sample_exam_question_ids_db(
+            self,
+            sections: list[tuple[QuestionFilters, int, list[float]]],
+            exclude_hashes: list[str] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Candidatos ``(sección, id)`` de cada sección, en orden de muestreo."""
+        stmt = build_exam_sample_stmt(sections, exclude_hashes)
+        result = await self.db.execute(stmt)
+        return [(row.section, row.id) for row in result]
+
+    async def get_questions_for_solve_db(self, question_ids: list[int]):
+        result = await self.db.scalars(build_questions_solve_stmt(question_ids))
+        return list(result.all())
+
+    async def get_question_db(self, question_id: int, view: str):
+        stmt = build_question_stmt(question_id=question_id, view=view)
+        return await self.db.scalar(stmt)
+
+    async def question_exists_db(self, question_id: int) -> bool:
+        stmt = select(Question.id).where(Question.id == question_id)
+        return await self.db.scalar(stmt) is not None
+
+    async def delete_question_db(self, question_id: int) -> bool:
+        stmt = (
+            delete(Question)
+            .where(Question.id == question_id)
+            .returning(
+                Question.question_hash,
+                Question.subtopic_id,
+                Question.difficulty_id,
+                Question.question_type_id,
+            )
+        )
+
+        try:
+            # Se bloquea la pregunta antes de leer sus áreas: una edición en curso
+            # podría cambiarlas y los conteos restarían las anteriores
+            locked = await self.db.scalar(
+                select(Question.id).where(Question.id == question_id).with_for_update()
+            )
+            if locked is None:
+                return False
+
+            # Las áreas se leen antes: el borrado en cascada las elimina
+            area_ids = list(
+                await self.db.scalars(
+                    select(question_areas.c.area_id).where(
+                        question_areas.c.question_id == question_id
+                    )
+                )
+            )
+            result = await self.db.execute(stmt)
+            deleted = result.one_or_none()
+            if deleted is None:
+                return False
+
+            deleted_hash = deleted.question_hash
+            stats = QuestionStatsDelta()
+            stats.add(
+                deleted.subtopic_id,
+                deleted.difficulty_id,
+                deleted.question_type_id,
+                area_ids,
+                sign=-1,
+            )
+            for stats_stmt, rows in stats.statements():
+                await self.db.execute(stats_stmt, rows)
+
+            await self.db.commit()
+            await ainvalidate_counts(
+                QUESTIONS_COUNT_NAMESPACE, QUESTIONS_FILTERED_COUNT_NAMESPACE
+            )
+            await question_hash_index.aremove([deleted_hash])
+            await ainvalidate_question_cache(question_id)
+            return True
+        except SQLAlchemyError:
+            await self.db.rollback()
+            raise
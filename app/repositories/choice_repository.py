@@ -1,78 +1,112 @@
-from sqlalchemy import func, select, update
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
+from app.core.question_cache import invalidate_question_cache
 from app.models.choice import Choice
 from app.models.choice_content import ChoiceContent
+from app.models.question import Question
+
+CHOICE_CONTENT_COLUMNS = (
+    ChoiceContent.id,
+    ChoiceContent.type,
+    ChoiceContent.value,
+    ChoiceContent.order,
+)
 
 
 class ChoiceRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_choice_db(self, question_id: int, choice_id: int):
-        """Obtiene una alternativa por ``question_id`` y ``choice_id``"""
-        stmt = (
-            select(Choice)
-            .where(Choice.id == choice_id, Choice.question_id == question_id)
-            .options(selectinload(Choice.contents))
-        )
-        return self.db.scalar(stmt)
-
-    def count_correct_choices_db(
-            self, question_id: int, exclude_choice_id: int | None = None
-    ):
-        """
-        Cuenta las alternativas correctas de una pregunta, excluyendo opcionalmente
-        una alternativa específica.
+    def lock_question_choices_db(self, question_id: int) -> dict[int, dict] | None:
         """
-        stmt = (
-            select(func.count())
-            .select_from(Choice)
-            .where(Choice.question_id == question_id, Choice.is_correct.is_(True))
-        )
-        if exclude_choice_id is not None:
-            # Excluir la alternativa especificada del conteo de repuestas correctas
-            stmt = stmt.where(Choice.id != exclude_choice_id)
+        Bloquea la pregunta (``SELECT ... FOR UPDATE``) y obtiene en la misma
+        consulta todas sus alternativas con sus contenidos.
 
-        return self.db.scalar(stmt) or 0
+        El bloqueo dura hasta ``update_choice_db`` o ``rollback_db``: dos ediciones
+        simultáneas de la misma pregunta se validan en serie, cada una contra el
+        estado que dejó la anterior.
 
-    def get_other_choice_content_values_db(self, question_id: int, choice_id: int):
-        """
-        Obtiene los valores normalizados de los contenidos de las demás alternativas de una pregunta,
-        excluyendo ``choice_id``.
+        :return: ``{choice_id: {id, label, is_correct, contents}}`` o ``None`` si la
+            pregunta no existe.
         """
         stmt = (
-            select(ChoiceContent.value)
-            .join(Choice, ChoiceContent.choice_id == Choice.id)
-            .where(Choice.question_id == question_id, Choice.id != choice_id)
+            select(
+                Question.id.label("question_id"),
+                Choice.id.label("choice_id"),
+                Choice.label,
+                Choice.is_correct,
+                *CHOICE_CONTENT_COLUMNS,
+            )
+            .select_from(Question)
+            .outerjoin(Choice, Choice.question_id == Question.id)
+            .outerjoin(ChoiceContent, ChoiceContent.choice_id == Choice.id)
+            .where(Question.id == question_id)
+            .order_by(Choice.id, ChoiceContent.order)
+            # Solo se bloquea la pregunta (no se puede bloquear el lado nulo del JOIN)
+            .with_for_update(of=Question)
         )
-        values = self.db.scalars(stmt).all()
-        return {value.strip().lower() for value in values}
+        rows = self.db.execute(stmt).all()
+        if not rows:
+            return None
+
+        choices: dict[int, dict] = {}
+        for row in rows:
+            if row.choice_id is None:
+                continue
+
+            choice = choices.setdefault(
+                row.choice_id,
+                {
+                    "id": row.choice_id,
+                    "label": row.label,
+                    "is_correct": row.is_correct,
+                    "contents": [],
+                },
+            )
+            if row.id is not None:
+                choice["contents"].append(
+                    {
+                        "id": row.id,
+                        "type": row.type,
+                        "value": row.value,
+                        "order": row.order,
+                    }
+                )
+        return choices
 
     def update_choice_db(
             self,
-            choice: Choice,
+            choice: dict,
             question_id: int,
             label: str | None,
             is_correct: bool | None,
-            contents: list[ChoiceContent] | None,
+            contents: list[dict] | None,
             demote_others: bool,
-    ):
+    ) -> dict:
         """
-        Actualiza los campos de una alternativa en la base de datos.
+        Actualiza una alternativa dentro de la transacción abierta por
+        ``lock_question_choices_db`` y la confirma.
 
-        :param choice: Instancia de ``Choice`` a actualizar.
+        :param choice: Alternativa tal como la devolvió ``lock_question_choices_db``.
         :param question_id: ID de la pregunta a la que pertenece la alternativa.
         :param label: Nueva etiqueta de la alternativa.
         :param is_correct: Nuevo valor de corrección de la alternativa.
-        :param contents: Nueva lista de contenidos de la alternativa.
-        :param demote_others: Si es ``True``, marca como incorrectas las demás alternativas correctas
-            de la misma pregunta antes de aplicar los cambios.
-        :return: La instancia de ``Choice`` actualizada y refrescada desde la base de datos.
-        :raises SQLAlchemyError: Si ocurre un error durante la transacción, se hace rollback y se
-            relanza la excepción.
+        :param contents: Nuevos contenidos (``type``, ``value``, ``order``); reemplazan
+            a los actuales.
+        :param demote_others: Si es ``True``, marca como incorrectas las demás
+            alternativas correctas de la misma pregunta.
+        :return: La alternativa actualizada (columnas devueltas por ``RETURNING``).
+        :raises SQLAlchemyError: Si ocurre un error durante la transacción, se hace
+            rollback y se relanza la excepción.
         """
+        choice_id = choice["id"]
+        values = {
+            key: value
+            for key, value in (("label", label), ("is_correct", is_correct))
+            if value is not None
+        }
 
         try:
             if demote_others:
@@ -80,24 +114,42 @@ class ChoiceRepository:
                     update(Choice)
                     .where(
                         Choice.question_id == question_id,
-                        Choice.id != choice.id,
+                        Choice.id != choice_id,
                         Choice.is_correct.is_(True),
                     )
                     .values(is_correct=False)
                 )
 
-            if label is not None:
-                choice.label = label
-
-            if is_correct is not None:
-                choice.is_correct = is_correct
+            updated = dict(choice)
+            if values:
+                row = self.db.execute(
+                    update(Choice)
+                    .where(Choice.id == choice_id)
+                    .values(values)
+                    .returning(Choice.id, Choice.label, Choice.is_correct)
+                ).one()
+                updated.update(row._asdict())
 
             if contents is not None:
-                choice.contents = contents
+                self.db.execute(
+                    delete(ChoiceContent).where(ChoiceContent.choice_id == choice_id)
+                )
+                rows = self.db.execute(
+                    insert(ChoiceContent).returning(
+                        *CHOICE_CONTENT_COLUMNS, sort_by_parameter_order=True
+                    ),
+                    [{**content, "choice_id": choice_id} for content in contents],
+                )
+                updated["contents"] = [row._asdict() for row in rows]
 
             self.db.commit()
-            self.db.refresh(choice)
-            return choice
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        invalidate_question_cache(question_id)
+        return updated
+
+    def rollback_db(self):
+        """Descarta la transacción (y libera el bloqueo de la pregunta)"""
+        self.db.rollback()
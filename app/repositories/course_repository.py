@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.taxonomy_cache import invalidate_taxonomy
 from app.models.course import Course
 
 
@@ -24,6 +25,7 @@ class CourseRepository:
         try:
             self.db.add(db_course)
             self.db.commit()
+            invalidate_taxonomy()
             self.db.refresh(db_course)
             return db_course
         except IntegrityError:
@@ -45,6 +47,7 @@ class CourseRepository:
 
         try:
             self.db.commit()
+            invalidate_taxonomy()
             self.db.refresh(db_course)
             return db_course
         except IntegrityError:
@@ -64,6 +67,7 @@ class CourseRepository:
         try:
             self.db.delete(db_course)
             self.db.commit()
+            invalidate_taxonomy()
             return db_course
         except SQLAlchemyError:
             self.db.rollback()
@@ -4,7 +4,8 @@ from sqlalchemy import select, func
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.core.cache import get_cached_count, set_cached_count
+from app.core.cache import get_or_compute_count, invalidate_counts
+from app.core.reference_cache import INSTITUTIONS, invalidate_reference_data
 from app.models.institution import Institution
 
 
@@ -16,21 +17,31 @@ class InstitutionRepository:
         stmt = select(Institution).where(Institution.id == institution_id)
         return self.db.scalar(stmt)
 
-    def get_institutions(self, page: int, limit: int):
+    def get_institutions(self, page: int, limit: int, include_total: bool = True):
         offset = (page - 1) * limit
 
-        stmt = select(Institution).offset(offset).limit(limit)
+        # Un registro extra indica si existe una página siguiente
+        stmt = select(Institution).offset(offset).limit(limit + 1)
         items = list(self.db.scalars(stmt).all())
 
-        # Intentar obtener del caché
-        total = get_cached_count(name="institutions:total_count")
+        if not include_total:
+            return items, None
 
-        if total is None:
-            total = self.db.scalar(select(func.count()).select_from(Institution))
-            # Guardar en caché por 5 minutos
-            set_cached_count(name="institutions:total_count", value=total, ttl=300)
+        total = get_or_compute_count(
+            "institutions",
+            "total",
+            lambda: self.db.scalar(select(func.count()).select_from(Institution)),
+            ttl=300,
+        )
 
-        return items
+        return items, total
+
+    def get_institution_refs_db(self):
+        """Todas las instituciones para la caché de referencia"""
+        stmt = select(
+            Institution.id, Institution.name, Institution.code, Institution.type
+        )
+        return self.db.execute(stmt).all()
 
     def get_institutions_by_ids(self, ids: list[int]):
         stmt = select(Institution).where(Institution.id.in_(ids))
@@ -43,7 +54,6 @@ class InstitutionRepository:
             self.db.add(db_institution)
             self.db.commit()
             self.db.refresh(db_institution)
-            return db_institution
         except IntegrityError:
             self.db.rollback()
             raise
@@ -51,6 +61,10 @@ class InstitutionRepository:
             self.db.rollback()
             raise
 
+        invalidate_counts("institutions")
+        invalidate_reference_data(INSTITUTIONS)
+        return db_institution
+
     def update_institution(
             self, institution_id: int, update_data: Mapping[str, object]
     ):
@@ -65,6 +79,7 @@ class InstitutionRepository:
 
         try:
             self.db.commit()
+            invalidate_reference_data(INSTITUTIONS)
             self.db.refresh(db_institution)
             return db_institution
         except IntegrityError:
@@ -84,7 +99,10 @@ class InstitutionRepository:
         try:
             self.db.delete(db_institution)
             self.db.commit()
-            return db_institution
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        invalidate_counts("institutions")
+        invalidate_reference_data(INSTITUTIONS)
+        return db_institution
@@ -2,58 +2,98 @@ from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.question_cache import invalidate_question_cache
+from app.core.question_hash_index import question_hash_index
 from app.models.question import Question
 from app.models.question_content import QuestionContent
 
+QUESTION_CONTENT_COLUMNS = (
+    QuestionContent.id,
+    QuestionContent.label,
+    QuestionContent.type,
+    QuestionContent.value,
+    QuestionContent.order,
+)
+
 
 class QuestionContentRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_question_content_db(self, question_id: int, content_id: int):
-        stmt = select(QuestionContent).where(
-            QuestionContent.id == content_id,
-            QuestionContent.question_id == question_id,
-        )
-        return self.db.scalar(stmt)
+    def lock_question_contents_db(
+            self, question_id: int
+    ) -> tuple[str, list[dict]] | None:
+        """
+        Bloquea la pregunta (``SELECT ... FOR UPDATE``) y obtiene en la misma
+        consulta su hash y todos sus contenidos ordenados por su campo 'order'. El
+        bloqueo dura hasta ``update_question_content_db`` o ``rollback_db``.
 
-    def get_question_contents_db(self, question_id: int):
-        """Obtiene todos los contenidos de una pregunta ordenados por su campo 'order'."""
+        :return: ``(question_hash, contenidos)`` o ``None`` si la pregunta no existe.
+        """
         stmt = (
-            select(QuestionContent)
-            .where(QuestionContent.question_id == question_id)
+            select(Question.question_hash, *QUESTION_CONTENT_COLUMNS)
+            .select_from(Question)
+            .outerjoin(QuestionContent, QuestionContent.question_id == Question.id)
+            .where(Question.id == question_id)
             .order_by(QuestionContent.order)
+            .with_for_update(of=Question)
         )
-        return list(self.db.scalars(stmt).all())
+        rows = self.db.execute(stmt).all()
+        if not rows:
+            return None
+
+        contents = [
+            {
+                "id": row.id,
+                "label": row.label,
+                "type": row.type,
+                "value": row.value,
+                "order": row.order,
+            }
+            for row in rows
+            if row.id is not None
+        ]
+        return rows[0].question_hash, contents
 
     def update_question_content_db(
             self,
-            content: QuestionContent,
-            label: str | None,
-            content_type,
-            value: str | None,
-            order: int | None,
+            question_id: int,
+            content_id: int,
+            values: dict,
+            previous_hash: str,
             question_hash: str,
-    ):
-        """Actualiza los campos de un contenido de pregunta y el hash de la pregunta asociada."""
+    ) -> dict:
+        """
+        Actualiza un contenido (``UPDATE ... RETURNING``) y, si cambió, el hash de
+        la pregunta, dentro de la transacción abierta por
+        ``lock_question_contents_db``, y la confirma.
+
+        :return: El contenido actualizado.
+        """
         try:
-            if label is not None:
-                content.label = label
-            if content_type is not None:
-                content.type = content_type
-            if value is not None:
-                content.value = value
-            if order is not None:
-                content.order = order
-
-            self.db.execute(
-                update(Question)
-                .where(Question.id == content.question_id)
-                .values(question_hash=question_hash)
-            )
+            row = self.db.execute(
+                update(QuestionContent)
+                .where(QuestionContent.id == content_id)
+                .values(values)
+                .returning(*QUESTION_CONTENT_COLUMNS)
+            ).one()
+            if question_hash != previous_hash:
+                self.db.execute(
+                    update(Question)
+                    .where(Question.id == question_id)
+                    .values(question_hash=question_hash)
+                )
             self.db.commit()
-            self.db.refresh(content)
-            return content
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        if previous_hash != question_hash:
+            question_hash_index.remove([previous_hash])
+            question_hash_index.add([question_hash])
+        invalidate_question_cache(question_id)
+        return row._asdict()
+
+    def rollback_db(self):
+        """Descarta la transacción (y libera el bloqueo de la pregunta)"""
+        self.db.rollback()
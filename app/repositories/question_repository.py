@@ -1,11 +1,463 @@
-from sqlalchemy import select, delete, func
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    Integer,
+    Select,
+    String,
+    Subquery,
+    all_,
+    any_,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.core.cache import invalidate_count_cache, get_cached_count, set_cached_count
+from app.core.cache import invalidate_counts
+from app.core.config import settings
+from app.core.question_cache import (
+    invalidate_question_cache,
+    invalidate_question_caches,
+)
+from app.core.question_hash_index import question_hash_index
+from app.db.question_json import (
+    join_question_document,
+    question_document_json,
+    question_export_json,
+)
+from app.db.search import search_tsquery
+from app.domain.question.filters import QuestionFilters
+from app.models.area import Area
 from app.models.choice import Choice
+from app.models.choice_content import ChoiceContent
+from app.models.difficulty import Difficulty
 from app.models.question import Question
+from app.models.question_areas import question_areas
+from app.models.question_content import QuestionContent
+from app.models.question_source import QuestionSource
+from app.models.question_type import QuestionType
 from app.models.solution import Solution
+from app.models.solution_content import SolutionContent
+from app.models.source import Source
+from app.models.subtopic import Subtopic
+from app.models.topic import Topic
+from app.repositories.question_stats_repository import QuestionStatsDelta
+
+# Namespaces de la caché de conteos: el total y las combinaciones de filtros
+QUESTIONS_COUNT_NAMESPACE = "questions"
+QUESTIONS_FILTERED_COUNT_NAMESPACE = "questions:filtered"
+
+# Peso de cada parte de la pregunta en la relevancia de la búsqueda
+SEARCH_WEIGHT_QUESTION = 1.0
+SEARCH_WEIGHT_CHOICES = 0.4
+SEARCH_WEIGHT_SOLUTIONS = 0.2
+
+
+def apply_question_filters(stmt: Select, filters: QuestionFilters | None) -> Select:
+    """Agrega al ``stmt`` los predicados correspondientes a los filtros activos."""
+    if filters is None or filters.is_empty():
+        return stmt
+
+    if filters.subtopic_id is not None:
+        stmt = stmt.where(Question.subtopic_id == filters.subtopic_id)
+
+    if filters.difficulty_id is not None:
+        stmt = stmt.where(Question.difficulty_id == filters.difficulty_id)
+
+    if filters.question_type_id is not None:
+        stmt = stmt.where(Question.question_type_id == filters.question_type_id)
+
+    # Tema y curso se resuelven a un conjunto de subtemas (tablas pequeñas), de modo
+    # que el filtro sobre questions usa el índice (subtopic_id, id)
+    if filters.topic_id is not None or filters.course_id is not None:
+        subtopic_ids = select(Subtopic.id)
+        if filters.topic_id is not None:
+            subtopic_ids = subtopic_ids.where(Subtopic.topic_id == filters.topic_id)
+        if filters.course_id is not None:
+            subtopic_ids = subtopic_ids.join(
+                Topic, Topic.id == Subtopic.topic_id
+            ).where(Topic.course_id == filters.course_id)
+        stmt = stmt.where(Question.subtopic_id.in_(subtopic_ids))
+
+    if filters.area_codes:
+        stmt = stmt.where(
+            exists()
+            .where(question_areas.c.question_id == Question.id)
+            .where(question_areas.c.area_id == Area.id)
+            .where(Area.code.in_(filters.area_codes))
+        )
+
+    if filters.source_id is not None or filters.year is not None:
+        source_exists = exists().where(QuestionSource.question_id == Question.id)
+        if filters.source_id is not None:
+            source_exists = source_exists.where(
+                QuestionSource.source_id == filters.source_id
+            )
+        if filters.year is not None:
+            source_exists = source_exists.where(
+                QuestionSource.source_id == Source.id, Source.year == filters.year
+            )
+        stmt = stmt.where(source_exists)
+
+    return stmt
+
+
+def question_load_options(view: str) -> list:
+    """
+    Cargas que necesita la serialización de una pregunta con ``view`` (``summary``
+    o ``full``). Las relaciones de los modelos son ``lazy="raise"``: cada consulta
+    declara lo que usa y el acceso a lo demás falla en lugar de consultar por fila.
+    """
+    options = [
+        joinedload(Question.subtopic),
+        joinedload(Question.difficulty),
+        selectinload(Question.contents),
+        selectinload(Question.areas),
+        selectinload(Question.question_sources).joinedload(QuestionSource.source),
+    ]
+    if view == "full":
+        options += [
+            selectinload(Question.choices).selectinload(Choice.contents),
+            selectinload(Question.solutions).selectinload(Solution.contents),
+        ]
+    return options
+
+
+def build_questions_page_stmt(
+        limit: int,
+        view: str,
+        page: int = 1,
+        after_id: int | None = None,
+        filters: QuestionFilters | None = None,
+) -> Select:
+    """
+    Consulta de una página de preguntas ordenadas por ID.
+
+    Si se indica ``after_id`` se usa paginación por cursor (keyset) y se ignora
+    ``page``. Se recupera un registro adicional (``limit + 1``) para que el servicio
+    pueda saber si existe una página siguiente.
+    """
+    stmt = select(Question).order_by(Question.id).limit(limit + 1)
+    stmt = apply_question_filters(stmt, filters)
+
+    if after_id is not None:
+        # Keyset: el costo no depende de la profundidad de la página
+        stmt = stmt.where(Question.id > after_id)
+    else:
+        stmt = stmt.offset((page - 1) * limit)
+
+    return stmt.options(*question_load_options(view))
+
+
+def build_questions_document_page_stmt(
+        view: str,
+        limit: int,
+        page: int = 1,
+        after_id: int | None = None,
+        filters: QuestionFilters | None = None,
+) -> Select:
+    """
+    Misma página que ``build_questions_page_stmt``, pero cada pregunta se devuelve
+    como documento JSON armado en PostgreSQL (ver ``app.db.question_json``): una
+    sola consulta, sin entidades del ORM ni las cargas de ``question_load_options``
+    (una ida y vuelta por relación y por nivel).
+    """
+    stmt = join_question_document(
+        select(question_document_json(view)).select_from(Question)
+    )
+    stmt = stmt.order_by(Question.id).limit(limit + 1)
+    stmt = apply_question_filters(stmt, filters)
+
+    if after_id is not None:
+        return stmt.where(Question.id > after_id)
+
+    return stmt.offset((page - 1) * limit)
+
+
+def build_question_stmt(question_id: int, view: str) -> Select:
+    return (
+        select(Question)
+        .where(Question.id == question_id)
+        .options(*question_load_options(view))
+    )
+
+
+def build_questions_export_stmt(filters: QuestionFilters | None = None) -> Select:
+    """
+    Consulta de exportación: el documento completo de cada pregunta (ordenadas por
+    ID) como texto JSON, listo para escribirse como una línea NDJSON.
+    """
+    stmt = join_question_document(
+        select(question_export_json()).select_from(Question)
+    )
+    stmt = stmt.order_by(Question.id)
+    return apply_question_filters(stmt, filters)
+
+
+def build_exam_sample_stmt(
+        sections: list[tuple[QuestionFilters, int, list[float]]],
+        exclude_hashes: list[str] | None = None,
+        run_length: int = settings.EXAM_SAMPLE_RUN_LENGTH,
+) -> Select:
+    """
+    IDs candidatos de cada sección de un examen, en una sola consulta.
+
+    Cada sección es ``(filtros, límite, inicios)``: desde cada inicio (un punto al
+    azar en ``random_key``) se toman ``run_length`` preguntas (``LATERAL`` con el
+    índice sobre ``random_key``). Tramos cortos desde muchos inicios evitan que las
+    preguntas vecinas en ``random_key`` aparezcan siempre juntas. Si los tramos no
+    alcanzan (pocas preguntas), se completa con las primeras ``límite`` en orden de
+    ``random_key`` (``part`` 1).
+
+    :return: Filas ``(section, part, ord, id, random_key)`` en el orden de
+        muestreo; un mismo ID puede repetirse si dos tramos se solapan.
+    """
+
+    def restrict(stmt: Select, filters: QuestionFilters) -> Select:
+        stmt = apply_question_filters(stmt, filters)
+        if exclude_hashes:
+            # Un solo parámetro (arreglo) en lugar de uno por hash
+            stmt = stmt.where(
+                Question.question_hash != all_(literal(exclude_hashes, ARRAY(String)))
+            )
+        return stmt
+
+    branches = []
+    for index, (filters, limit, starts) in enumerate(sections):
+        points = (
+            func.unnest(literal(starts, ARRAY(Float)))
+            .table_valued("start", with_ordinality="ord")
+            .render_derived()
+        )
+        run = restrict(
+            select(Question.id, Question.random_key)
+            .where(Question.random_key >= points.c.start)
+            .order_by(Question.random_key)
+            .limit(run_length),
+            filters,
+        ).lateral()
+        branches.append(
+            select(
+                literal(index, Integer).label("section"),
+                literal(0, Integer).label("part"),
+                points.c.ord.label("ord"),
+                run.c.id,
+                run.c.random_key,
+            )
+            .select_from(points)
+            .join(run, true())
+        )
+
+        fallback = restrict(
+            select(
+                literal(index, Integer).label("section"),
+                literal(1, Integer).label("part"),
+                literal(0, BigInteger).label("ord"),
+                Question.id,
+                Question.random_key,
+            )
+            .order_by(Question.random_key)
+            .limit(limit),
+            filters,
+        )
+        branches.append(select(fallback.subquery()))
+
+    samples = union_all(*branches).subquery()
+    return select(samples).order_by(
+        samples.c.section, samples.c.part, samples.c.ord, samples.c.random_key
+    )
+
+
+def build_questions_solve_stmt(question_ids: list[int]) -> Select:
+    """Preguntas con lo necesario para resolverlas: enunciado y alternativas."""
+    return (
+        select(Question)
+        .where(Question.id.in_(question_ids))
+        .options(
+            selectinload(Question.contents),
+            selectinload(Question.choices).selectinload(Choice.contents),
+        )
+    )
+
+
+def build_search_matches(query: str) -> Subquery:
+    """
+    Preguntas cuyo enunciado, alternativas o soluciones coinciden con ``query``, con
+    su relevancia (``rank``). Cada rama usa el índice GIN de ``search_vector``.
+    """
+    tsquery = search_tsquery(query)
+
+    def branch(content, weight: float, question_id, *joins):
+        stmt = select(
+            question_id.label("question_id"),
+            (func.ts_rank_cd(content.search_vector, tsquery) * weight).label("rank"),
+        ).select_from(content)
+        for target, onclause in joins:
+            stmt = stmt.join(target, onclause)
+        return stmt.where(content.search_vector.bool_op("@@")(tsquery))
+
+    matches = union_all(
+        branch(QuestionContent, SEARCH_WEIGHT_QUESTION, QuestionContent.question_id),
+        branch(
+            ChoiceContent,
+            SEARCH_WEIGHT_CHOICES,
+            Choice.question_id,
+            (Choice, Choice.id == ChoiceContent.choice_id),
+        ),
+        branch(
+            SolutionContent,
+            SEARCH_WEIGHT_SOLUTIONS,
+            Solution.question_id,
+            (Solution, Solution.id == SolutionContent.solution_id),
+        ),
+    ).subquery()
+
+    return (
+        select(matches.c.question_id, func.sum(matches.c.rank).label("rank"))
+        .group_by(matches.c.question_id)
+        .subquery("matches")
+    )
+
+
+def build_questions_search_stmt(
+        query: str,
+        view: str,
+        limit: int,
+        page: int = 1,
+        filters: QuestionFilters | None = None,
+) -> Select:
+    """
+    Página de resultados de búsqueda, de mayor a menor relevancia, como documentos
+    JSON. Como en el listado, se recupera un registro adicional para saber si hay
+    página siguiente.
+    """
+    matches = build_search_matches(query)
+    stmt = join_question_document(
+        select(question_document_json(view))
+        .select_from(Question)
+        .join(matches, matches.c.question_id == Question.id)
+    )
+    stmt = (
+        stmt.order_by(matches.c.rank.desc(), Question.id)
+        .offset((page - 1) * limit)
+        .limit(limit + 1)
+    )
+    return apply_question_filters(stmt, filters)
+
+
+def build_questions_search_count_stmt(
+        query: str, filters: QuestionFilters | None = None
+) -> Select:
+    matches = build_search_matches(query)
+    stmt = (
+        select(func.count())
+        .select_from(Question)
+        .join(matches, matches.c.question_id == Question.id)
+    )
+    return apply_question_filters(stmt, filters)
+
+
+def build_questions_count_stmt(filters: QuestionFilters | None = None) -> Select:
+    return apply_question_filters(select(func.count()).select_from(Question), filters)
+
+
+def questions_count_cache_key(
+        filters: QuestionFilters | None = None,
+) -> tuple[str, str]:
+    """Namespace y variante del conteo: una variante por combinación de filtros."""
+    if filters is None or filters.is_empty():
+        return QUESTIONS_COUNT_NAMESPACE, "total"
+
+    return QUESTIONS_FILTERED_COUNT_NAMESPACE, filters.cache_key()
+
+
+def sync_children(
+        current: list,
+        incoming: list[dict],
+        model,
+        fields: tuple[str, ...],
+        children: tuple[str, type, tuple[str, ...]] | None = None,
+        key: str | None = None,
+) -> list:
+    """
+    Empareja los hijos ``current`` con ``incoming``, por el campo ``key`` si se
+    indica o, si no, por posición (ambas listas ya ordenadas):
+
+    - en los pares se asignan ``fields`` (el ORM solo emite ``UPDATE`` si algún
+      valor cambió);
+    - los elementos sin pareja de ``incoming`` se crean (``INSERT``);
+    - los sin pareja de ``current`` quedan fuera de la lista devuelta y, al
+      asignarla a la relación, se eliminan (``delete-orphan``).
+
+    :param children: ``(relación, modelo, campos)`` de los hijos de cada elemento,
+        que se sincronizan por posición, ambos lados ordenados por ``order``
+        (p. ej. los contenidos de una alternativa).
+    :param key: Campo por el que se emparejan; con valores repetidos (o nulos)
+        se emparejan en orden entre los que comparten valor.
+    """
+    if key is None:
+        matches = [
+            current[index] if index < len(current) else None
+            for index in range(len(incoming))
+        ]
+    else:
+        pending: dict[object, list] = defaultdict(list)
+        for item in current:
+            pending[getattr(item, key)].append(item)
+        matches = [
+            pending[data[key]].pop(0) if pending[data[key]] else None
+            for data in incoming
+        ]
+
+    result = []
+    for data, item in zip(incoming, matches):
+        is_new = item is None
+        if is_new:
+            item = model(**{field: data[field] for field in fields})
+        else:
+            for field in fields:
+                setattr(item, field, data[field])
+
+        if children is not None:
+            relation, child_model, child_fields = children
+            # Un elemento nuevo no tiene hijos (no se consulta la relación); los
+            # actuales se ordenan aquí porque no toda relación define ``order_by``
+            current_children = (
+                []
+                if is_new
+                else sorted(getattr(item, relation), key=lambda child: child.order)
+            )
+            setattr(
+                item,
+                relation,
+                sync_children(
+                    current_children,
+                    sorted(data[relation], key=lambda child: child["order"]),
+                    child_model,
+                    child_fields,
+                ),
+            )
+        result.append(item)
+    return result
+
+
+def iter_question_hashes(bind, batch_size: int = 5000) -> Iterator[str]:
+    """Todos los ``question_hash`` de la BD, con una sesión propia (sin bloquear)."""
+    with Session(bind) as session:
+        stmt = select(Question.question_hash).execution_options(yield_per=batch_size)
+        yield from session.scalars(stmt)
 
 
 class QuestionRepository:
@@ -16,10 +468,30 @@ class QuestionRepository:
         """Crea una pregunta en la BD"""
         try:
             self.db.add(question)
+            self.db.flush()
+
+            stats = QuestionStatsDelta()
+            stats.add(
+                question.subtopic_id,
+                question.difficulty_id,
+                question.question_type_id,
+                [area.id for area in question.areas],
+            )
+            stats.apply(self.db)
+
+            question_id = question.id
             self.db.commit()
-            self.db.refresh(question)
+            # En lugar de ``refresh``: recarga con las relaciones de la respuesta
+            question = self.db.scalar(
+                build_question_stmt(question_id, "full").options(
+                    joinedload(Question.question_type)
+                )
+            )
 
-            invalidate_count_cache("questions:total_count")
+            invalidate_counts(
+                QUESTIONS_COUNT_NAMESPACE, QUESTIONS_FILTERED_COUNT_NAMESPACE
+            )
+            question_hash_index.add([question.question_hash])
 
         # No se necesita capturar IntegrityError porque ya hereda de SQLAlchemyError
         except SQLAlchemyError:
@@ -28,84 +500,477 @@ class QuestionRepository:
         else:
             return question
 
-    def get_questions_db(self, page: int, limit: int, view: str):
-        offset = (page - 1) * limit
+    def create_questions_bulk_db(self, questions: list[dict]) -> dict[str, int]:
+        """
+        Crea varias preguntas con sus relaciones en una sola transacción, usando
+        INSERT multi-fila por tabla en lugar de construir el grafo ORM.
 
-        if view == "summary":
-            stmt = select(Question).order_by(Question.id).limit(limit).offset(offset)
-        else:
-            stmt = (
-                select(Question)
-                .order_by(Question.id)
-                .limit(limit)
-                .offset(offset)
-                .options(
-                    selectinload(Question.choices).selectinload(Choice.contents),
-                    selectinload(Question.solutions).selectinload(Solution.contents),
+        Cada elemento de ``questions`` contiene las columnas de la pregunta más
+        ``area_ids``, ``contents``, ``choices`` (con ``contents``), ``solutions``
+        (con ``contents``) y ``sources``.
+
+        Las preguntas cuyo ``question_hash`` ya existe se omiten
+        (``ON CONFLICT DO NOTHING``).
+
+        :return: Diccionario ``{question_hash: id}`` de las preguntas creadas.
+        """
+        if not questions:
+            return {}
+
+        try:
+            question_stmt = (
+                pg_insert(Question)
+                .values(
+                    [
+                        {
+                            "question_type_id": q["question_type_id"],
+                            "subtopic_id": q["subtopic_id"],
+                            "difficulty_id": q["difficulty_id"],
+                            "question_hash": q["question_hash"],
+                        }
+                        for q in questions
+                    ]
                 )
+                .on_conflict_do_nothing(index_elements=[Question.question_hash])
+                .returning(Question.id, Question.question_hash)
             )
+            id_by_hash = {
+                question_hash: question_id
+                for question_id, question_hash in self.db.execute(question_stmt)
+            }
 
-        # GUARDAR EL TOTAL DE PREGUNTAS EN CACHÉ
-        # Intentar obtener del cache
-        total = get_cached_count(name="questions:total_count")
-        if total is None:
-            # Si no está en cache, consultar BD
-            total = self.db.scalar(select(func.count()).select_from(Question))
-            # Guardar en cache por 5 minutos
-            set_cached_count(name="questions:total_count", value=total, ttl=300)
-
-        # Obtener preguntas
-        return list(self.db.scalars(stmt).all())  # Convertir el Sequence a list
+            created = [q for q in questions if q["question_hash"] in id_by_hash]
+            if not created:
+                self.db.rollback()
+                return {}
 
-    def get_question_db(self, question_id: int, view: str):
-        if view == "summary":
-            stmt = select(Question).where(Question.id == question_id)
+            stats = QuestionStatsDelta()
+            area_rows = []
+            content_rows = []
+            choice_rows = []
+            choice_contents = []
+            solution_rows = []
+            solution_contents = []
+            source_rows = []
 
-        else:
-            stmt = (
-                select(Question)
-                .where(Question.id == question_id)
-                .options(
-                    selectinload(Question.choices).selectinload(Choice.contents),
-                    selectinload(Question.solutions).selectinload(Solution.contents),
+            for q in created:
+                question_id = id_by_hash[q["question_hash"]]
+                stats.add(
+                    q["subtopic_id"],
+                    q["difficulty_id"],
+                    q["question_type_id"],
+                    q["area_ids"],
                 )
-            )
+                area_rows.extend(
+                    {"question_id": question_id, "area_id": area_id}
+                    for area_id in q["area_ids"]
+                )
+                content_rows.extend(
+                    {**content, "question_id": question_id} for content in q["contents"]
+                )
+                for choice in q["choices"]:
+                    choice_rows.append(
+                        {
+                            "question_id": question_id,
+                            "label": choice["label"],
+                            "is_correct": choice["is_correct"],
+                        }
+                    )
+                    choice_contents.append(choice["contents"])
+                for solution in q["solutions"]:
+                    solution_rows.append({"question_id": question_id})
+                    solution_contents.append(solution["contents"])
+                source_rows.extend(
+                    {**source, "question_id": question_id} for source in q["sources"]
+                )
+
+            # Los IDs se devuelven en el mismo orden de las filas enviadas
+            choice_ids = self._insert_returning_ids(Choice, choice_rows)
+            solution_ids = self._insert_returning_ids(Solution, solution_rows)
+
+            choice_content_rows = [
+                {**content, "choice_id": choice_id}
+                for choice_id, contents in zip(choice_ids, choice_contents)
+                for content in contents
+            ]
+            solution_content_rows = [
+                {**content, "solution_id": solution_id}
+                for solution_id, contents in zip(solution_ids, solution_contents)
+                for content in contents
+            ]
+
+            for table, rows in (
+                (question_areas, area_rows),
+                (QuestionContent, content_rows),
+                (QuestionSource, source_rows),
+                (ChoiceContent, choice_content_rows),
+                (SolutionContent, solution_content_rows),
+            ):
+                # Un executemany vacío insertaría una fila con valores por defecto
+                if rows:
+                    self.db.execute(insert(table), rows)
+
+            stats.apply(self.db)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        # Un solo invalidado por lote
+        invalidate_counts(QUESTIONS_COUNT_NAMESPACE, QUESTIONS_FILTERED_COUNT_NAMESPACE)
+        question_hash_index.add(id_by_hash)
+
+        return id_by_hash
+
+    def replace_question_db(
+            self, question_id: int, document: dict, areas: list[Area]
+    ) -> Question | None:
+        """
+        Reemplaza una pregunta completa aplicando solo las diferencias con lo
+        guardado, en una transacción con la pregunta bloqueada (``FOR UPDATE``).
 
-        return self.db.scalar(stmt)
+        ``document`` tiene la forma de las filas de ``create_questions_bulk_db``.
+        Los hijos se emparejan así (ver ``sync_children``):
 
-    def delete_question_db(self, question_id: int) -> bool:
-        stmt = delete(Question).where(Question.id == question_id).returning(Question.id)
+        - contenidos (de la pregunta, alternativas y soluciones): por posición,
+          ambos lados ordenados por ``order``;
+        - alternativas: por ``label`` (quitar una no reescribe las demás, y sus
+          IDs siguen apuntando a la misma opción);
+        - soluciones: por posición (las actuales en orden de ID);
+        - fuentes: por ``source_id``; áreas: por ID.
+
+        Lo que no cambia no genera sentencias; el hash se recalcula una sola vez
+        (``document["question_hash"]``).
+
+        :return: La pregunta con las relaciones de la respuesta, o ``None`` si no
+            existe.
+        """
+        stmt = (
+            select(Question)
+            .where(Question.id == question_id)
+            .options(
+                selectinload(Question.contents),
+                selectinload(Question.areas),
+                selectinload(Question.question_sources),
+                selectinload(Question.choices).selectinload(Choice.contents),
+                selectinload(Question.solutions).selectinload(Solution.contents),
+            )
+            .with_for_update(of=Question)
+        )
 
         try:
-            deleted_id = self.db.execute(stmt).scalar_one_or_none()
-            if deleted_id is None:
-                return False
+            question = self.db.scalar(stmt)
+            if question is None:
+                self.db.rollback()
+                return None
+
+            previous_hash = question.question_hash
+            stats = QuestionStatsDelta()
+            stats.add(
+                question.subtopic_id,
+                question.difficulty_id,
+                question.question_type_id,
+                [area.id for area in question.areas],
+                sign=-1,
+            )
+
+            for key in ("question_type_id", "subtopic_id", "difficulty_id"):
+                setattr(question, key, document[key])
+            question.question_hash = document["question_hash"]
+            question.areas = areas
+
+            content_fields = ("type", "value", "order")
+            question.contents = sync_children(
+                question.contents,
+                sorted(document["contents"], key=lambda c: c["order"]),
+                QuestionContent,
+                ("label", *content_fields),
+            )
+            question.choices = sync_children(
+                question.choices,
+                document["choices"],
+                Choice,
+                ("label", "is_correct"),
+                children=("contents", ChoiceContent, content_fields),
+                key="label",
+            )
+            question.solutions = sync_children(
+                sorted(question.solutions, key=lambda s: s.id),
+                document["solutions"],
+                Solution,
+                (),
+                children=("contents", SolutionContent, content_fields),
+            )
 
+            current_sources = {qs.source_id: qs for qs in question.question_sources}
+            question_sources = []
+            for source in document["sources"]:
+                question_source = current_sources.pop(source["source_id"], None)
+                if question_source is None:
+                    question_source = QuestionSource(source_id=source["source_id"])
+                question_source.page = source["page"]
+                question_sources.append(question_source)
+            question.question_sources = question_sources
+
+            stats.add(
+                question.subtopic_id,
+                question.difficulty_id,
+                question.question_type_id,
+                [area.id for area in areas],
+            )
+            self.db.flush()
+            stats.apply(self.db)
             self.db.commit()
-            invalidate_count_cache("questions:total_count")
-            return True
+
+            question = self.db.scalar(
+                build_question_stmt(question_id, "full").options(
+                    joinedload(Question.question_type)
+                )
+            )
         except SQLAlchemyError:
             self.db.rollback()
             raise
 
+        if previous_hash != question.question_hash:
+            question_hash_index.remove([previous_hash])
+            question_hash_index.add([question.question_hash])
+        invalidate_counts(QUESTIONS_FILTERED_COUNT_NAMESPACE)
+        invalidate_question_cache(question_id)
+        return question
+
+    def _insert_returning_ids(self, model, rows: list[dict]) -> list[int]:
+        if not rows:
+            return []
+
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        return list(self.db.scalars(stmt, rows).all())
+
+    def stream_questions_db(
+            self, filters: QuestionFilters | None = None, batch_size: int = 500
+    ) -> Iterator[list[str]]:
+        """
+        Recorre los documentos JSON de las preguntas en bloques de ``batch_size``
+        usando un cursor del servidor (``yield_per`` activa ``stream_results``).
+
+        Solo se reciben cadenas (sin identity map), de modo que la memoria no crece
+        con el tamaño del banco.
+        """
+        stmt = build_questions_export_stmt(filters).execution_options(
+            yield_per=batch_size
+        )
+
+        for documents in self.db.scalars(stmt).partitions():
+            yield list(documents)
+
+    def find_existing_hashes_db(self, hashes: Iterable[str]) -> dict[str, int]:
+        """
+        Busca qué hashes ya existen. El índice en Redis descarta los que seguro son
+        nuevos y solo los restantes se confirman en la BD.
+
+        :return: Diccionario ``{question_hash: id}`` de las preguntas existentes.
+        """
+        candidates = question_hash_index.filter_candidates(
+            set(hashes),
+            load_hashes=lambda: iter_question_hashes(self.db.get_bind()),
+        )
+        if not candidates:
+            return {}
+
+        stmt = select(Question.question_hash, Question.id).where(
+            Question.question_hash.in_(candidates)
+        )
+        return dict(self.db.execute(stmt).tuples().all())
+
+    def find_subtopic_ids_db(self, subtopic_ids: Iterable[int]) -> set[int]:
+        """IDs existentes entre ``subtopic_ids`` (una consulta)"""
+        subtopic_ids = list(subtopic_ids)
+        if not subtopic_ids:
+            return set()
+
+        stmt = select(Subtopic.id).where(
+            Subtopic.id == any_(literal(subtopic_ids, ARRAY(Integer)))
+        )
+        return set(self.db.scalars(stmt))
+
+    def get_difficulty_refs_db(self):
+        """Todas las dificultades para la caché de referencia"""
+        return self.db.execute(
+            select(Difficulty.id, Difficulty.name, Difficulty.code)
+        ).all()
+
+    def get_question_type_refs_db(self):
+        """Todos los tipos de pregunta para la caché de referencia"""
+        return self.db.execute(
+            select(QuestionType.id, QuestionType.name, QuestionType.code)
+        ).all()
+
     def question_exists_db(self, question_id: int) -> bool:
         stmt = select(Question.id).where(Question.id == question_id)
         return self.db.scalar(stmt) is not None
 
     def update_question_fields_db(self, question_id: int, update_data: dict):
-        """Actualiza los campos areas, difficulty, question type, subtopic de una pregunta en la BD"""
-        stmt = select(Question).where(Question.id == question_id)
+        """
+        Actualiza los campos areas, difficulty, question type, subtopic de una
+        pregunta en la BD
+        """
+        # Se bloquea la pregunta: dos ediciones simultáneas restarían el mismo
+        # estado anterior de los conteos
+        stmt = (
+            select(Question)
+            .where(Question.id == question_id)
+            .options(selectinload(Question.areas))
+            .with_for_update(of=Question)
+        )
         db_question = self.db.scalar(stmt)
 
         if not db_question:
             return None
 
+        # Los conteos se ajustan en la misma transacción: -1 al estado anterior,
+        # +1 al nuevo
+        stats = QuestionStatsDelta()
+        stats.add(
+            db_question.subtopic_id,
+            db_question.difficulty_id,
+            db_question.question_type_id,
+            [area.id for area in db_question.areas],
+            sign=-1,
+        )
+
         for key, value in update_data.items():
             setattr(db_question, key, value)
 
+        stats.add(
+            db_question.subtopic_id,
+            db_question.difficulty_id,
+            db_question.question_type_id,
+            [area.id for area in db_question.areas],
+        )
+
+        try:
+            stats.apply(self.db)
+            self.db.commit()
+            # No se realiza un refresh ya que el endpoint devuelve un estado 204
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        # Los conteos filtrados dependen del subtema, dificultad, tipo y áreas
+        invalidate_counts(QUESTIONS_FILTERED_COUNT_NAMESPACE)
+        invalidate_question_cache(question_id)
+        return db_question
+
+    def reclassify_questions_db(
+            self,
+            question_ids: list[int],
+            update_data: dict,
+            add_area_ids: list[int],
+            remove_area_ids: list[int],
+    ) -> dict[int, bool | None]:
+        """
+        Reclasifica varias preguntas en una transacción con sentencias por conjunto:
+        un ``UPDATE ... WHERE id = ANY(...)`` para subtema, dificultad y tipo y,
+        para las áreas, solo las diferencias sobre ``question_areas`` (``INSERT ...
+        ON CONFLICT DO NOTHING`` de las que faltan y ``DELETE`` de las que sobran).
+
+        Las preguntas se bloquean (``FOR UPDATE``, en orden de ID) antes de leer su
+        clasificación actual, de la que sale la variación de los conteos.
+
+        Las preguntas que se quedarían sin áreas no se modifican.
+
+        :return: ``{question_id: modificada}`` de las preguntas existentes;
+            ``None`` si se omitió por quedar sin áreas.
+        """
+        add_area_ids = set(add_area_ids)
+        remove_area_ids = set(remove_area_ids)
+
         try:
+            current = self.db.execute(
+                select(
+                    Question.id,
+                    Question.subtopic_id,
+                    Question.difficulty_id,
+                    Question.question_type_id,
+                )
+                .where(Question.id == any_(literal(question_ids, ARRAY(Integer))))
+                .order_by(Question.id)
+                .with_for_update()
+            ).all()
+            if not current:
+                self.db.rollback()
+                return {}
+
+            areas_by_question: dict[int, set[int]] = defaultdict(set)
+            found_ids = literal([row.id for row in current], ARRAY(Integer))
+            area_stmt = select(
+                question_areas.c.question_id, question_areas.c.area_id
+            ).where(question_areas.c.question_id == any_(found_ids))
+            for question_id, area_id in self.db.execute(area_stmt):
+                areas_by_question[question_id].add(area_id)
+
+            stats = QuestionStatsDelta()
+            changed: dict[int, bool | None] = {}
+            field_ids, removal_ids, area_rows = [], [], []
+
+            for row in current:
+                old_key = (row.subtopic_id, row.difficulty_id, row.question_type_id)
+                new_key = (
+                    update_data.get("subtopic_id", row.subtopic_id),
+                    update_data.get("difficulty_id", row.difficulty_id),
+                    update_data.get("question_type_id", row.question_type_id),
+                )
+                old_areas = areas_by_question[row.id]
+                added = add_area_ids - old_areas
+                removed = remove_area_ids & old_areas
+                new_areas = (old_areas | added) - removed
+
+                if removed and not new_areas:
+                    changed[row.id] = None
+                    continue
+
+                changed[row.id] = bool(new_key != old_key or added or removed)
+                if not changed[row.id]:
+                    continue
+
+                if new_key != old_key:
+                    field_ids.append(row.id)
+                if removed:
+                    removal_ids.append(row.id)
+                area_rows.extend(
+                    {"question_id": row.id, "area_id": area_id}
+                    for area_id in sorted(added)
+                )
+                stats.add(*old_key, old_areas, sign=-1)
+                stats.add(*new_key, new_areas)
+
+            if field_ids:
+                self.db.execute(
+                    update(Question)
+                    .where(Question.id == any_(literal(field_ids, ARRAY(Integer))))
+                    .values(update_data)
+                )
+            if removal_ids:
+                self.db.execute(
+                    delete(question_areas).where(
+                        question_areas.c.question_id
+                        == any_(literal(removal_ids, ARRAY(Integer))),
+                        question_areas.c.area_id
+                        == any_(literal(sorted(remove_area_ids), ARRAY(Integer))),
+                    )
+                )
+            if area_rows:
+                self.db.execute(
+                    pg_insert(question_areas).on_conflict_do_nothing(), area_rows
+                )
+
+            stats.apply(self.db)
             self.db.commit()
-            # No se realizan un refresh ni se retorna nada ya que se devuelve un estado 204
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        changed_ids = [question_id for question_id, c in changed.items() if c]
+        if changed_ids:
+            invalidate_counts(QUESTIONS_FILTERED_COUNT_NAMESPACE)
+            invalidate_question_caches(changed_ids)
+        return changed
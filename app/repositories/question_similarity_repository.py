@@ -0,0 +1,178 @@
+from collections.abc import Iterator
+
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    SmallInteger,
+    and_,
+    column,
+    delete,
+    exists,
+    func,
+    select,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.domain.question.similarity import lsh_buckets
+from app.models.question import Question
+from app.models.question_content import QuestionContent
+from app.models.question_lsh_bucket import QuestionLshBucket
+from app.models.question_signature import QuestionSignature
+
+
+class QuestionSimilarityRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save_signatures_db(self, signatures: dict[int, list[int] | None]):
+        """Guarda (o reemplaza) la firma MinHash y los buckets LSH de cada pregunta."""
+        if not signatures:
+            return
+
+        question_ids = list(signatures)
+        bucket_rows = [
+            {"band": band, "bucket": bucket, "question_id": question_id}
+            for question_id, signature in signatures.items()
+            if signature is not None
+            for band, bucket in enumerate(lsh_buckets(signature))
+        ]
+
+        try:
+            self.db.execute(
+                delete(QuestionLshBucket).where(
+                    QuestionLshBucket.question_id.in_(question_ids)
+                )
+            )
+
+            stmt = pg_insert(QuestionSignature)
+            self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[QuestionSignature.question_id],
+                    set_={"signature": stmt.excluded.signature},
+                ),
+                [
+                    {"question_id": question_id, "signature": signature}
+                    for question_id, signature in signatures.items()
+                ],
+            )
+
+            if bucket_rows:
+                self.db.execute(pg_insert(QuestionLshBucket), bucket_rows)
+
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+    def find_candidates_db(
+            self, probes: dict[int, list[int]], max_candidates: int
+    ) -> dict[int, list[int]]:
+        """
+        Preguntas que comparten al menos un bucket con cada firma de ``probes``
+        (``{clave: buckets}``), en una sola consulta.
+
+        Se conservan hasta ``max_candidates`` por clave, priorizando las que
+        coinciden en más bandas; así un bucket muy poblado no dispara el costo.
+        """
+        if not probes:
+            return {}
+
+        probe = values(
+            column("probe", Integer),
+            column("band", SmallInteger),
+            column("bucket", BigInteger),
+            name="probe",
+        ).data(
+            [
+                (key, band, bucket)
+                for key, buckets in probes.items()
+                for band, bucket in enumerate(buckets)
+            ]
+        )
+        stmt = (
+            select(
+                probe.c.probe,
+                QuestionLshBucket.question_id,
+                func.count().label("hits"),
+            )
+            .join(
+                QuestionLshBucket,
+                and_(
+                    QuestionLshBucket.band == probe.c.band,
+                    QuestionLshBucket.bucket == probe.c.bucket,
+                ),
+            )
+            .group_by(probe.c.probe, QuestionLshBucket.question_id)
+        )
+
+        hits_by_probe: dict[int, list[tuple[int, int]]] = {}
+        for key, question_id, hits in self.db.execute(stmt):
+            hits_by_probe.setdefault(key, []).append((hits, question_id))
+
+        return {
+            key: [
+                question_id
+                for _, question_id in sorted(hits, reverse=True)[:max_candidates]
+            ]
+            for key, hits in hits_by_probe.items()
+        }
+
+    def get_signatures_db(self, question_ids: list[int]) -> dict[int, list[int] | None]:
+        if not question_ids:
+            return {}
+
+        stmt = select(QuestionSignature.question_id, QuestionSignature.signature).where(
+            QuestionSignature.question_id.in_(question_ids)
+        )
+        return dict(self.db.execute(stmt).tuples().all())
+
+    def get_question_contents_db(
+            self, question_id: int
+    ) -> list[QuestionContent] | None:
+        """Contenidos de la pregunta, o ``None`` si la pregunta no existe."""
+        stmt = select(Question.id).where(Question.id == question_id)
+        if self.db.scalar(stmt) is None:
+            return None
+
+        stmt = select(QuestionContent).where(QuestionContent.question_id == question_id)
+        return list(self.db.scalars(stmt).all())
+
+    def iter_unindexed_contents_db(
+            self, batch_size: int = 500
+    ) -> Iterator[dict[int, list[QuestionContent]]]:
+        """
+        Recorre (por lotes y en orden de ID) las preguntas que aún no tienen firma,
+        con sus contenidos.
+        """
+        last_id = 0
+        while True:
+            stmt = (
+                select(Question.id)
+                .where(
+                    Question.id > last_id,
+                    ~exists().where(QuestionSignature.question_id == Question.id),
+                )
+                .order_by(Question.id)
+                .limit(batch_size)
+            )
+            question_ids = list(self.db.scalars(stmt).all())
+            if not question_ids:
+                return
+
+            contents_by_id: dict[int, list[QuestionContent]] = {
+                question_id: [] for question_id in question_ids
+            }
+            contents = self.db.scalars(
+                select(QuestionContent).where(
+                    QuestionContent.question_id.in_(question_ids)
+                )
+            )
+            for content in contents:
+                contents_by_id[content.question_id].append(content)
+
+            yield contents_by_id
+            self.db.expunge_all()
+            last_id = question_ids[-1]
@@ -2,7 +2,10 @@ from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.cache import invalidate_counts
+from app.core.question_cache import invalidate_question_cache
 from app.models.question_source import QuestionSource
+from app.repositories.question_repository import QUESTIONS_FILTERED_COUNT_NAMESPACE
 
 
 class QuestionSourceRepository:
@@ -22,6 +25,7 @@ class QuestionSourceRepository:
         source_id: int | None,
         page: int | None,
     ):
+        question_id = question_source.question_id
         if source_id is not None:
             question_source.source_id = source_id
         if page is not None:
@@ -29,8 +33,12 @@ class QuestionSourceRepository:
 
         try:
             self.db.commit()
-            self.db.refresh(question_source)
-            return question_source
+            # Sin refresh: el endpoint devuelve 204 y la fuente no se serializa
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        # Los conteos filtrados por fuente/año dependen de esta relación
+        invalidate_counts(QUESTIONS_FILTERED_COUNT_NAMESPACE)
+        invalidate_question_cache(question_id)
+        return question_source
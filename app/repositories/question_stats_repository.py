@@ -0,0 +1,201 @@
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import Insert, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.area import Area
+from app.models.question import Question
+from app.models.question_area_stat import QuestionAreaStat
+from app.models.question_areas import question_areas
+from app.models.question_stat import QuestionStat
+from app.models.subtopic import Subtopic
+from app.models.topic import Topic
+
+STATS_DIMENSIONS = (
+    "course",
+    "topic",
+    "subtopic",
+    "difficulty",
+    "question_type",
+    "area",
+)
+
+
+def _upsert_increment(model) -> Insert:
+    stmt = pg_insert(model)
+    return stmt.on_conflict_do_update(
+        index_elements=[c for c in model.__table__.primary_key.columns],
+        set_={"question_count": model.question_count + stmt.excluded.question_count},
+    )
+
+
+class QuestionStatsDelta:
+    """
+    Acumula variaciones de los conteos para aplicarlas con un UPSERT por tabla
+    dentro de la transacción que modifica las preguntas.
+    """
+
+    def __init__(self):
+        self.totals: Counter[tuple[int, int, int]] = Counter()
+        self.areas: Counter[tuple[int, int, int, int]] = Counter()
+
+    def add(
+            self,
+            subtopic_id: int,
+            difficulty_id: int,
+            question_type_id: int,
+            area_ids: Iterable[int],
+            sign: int = 1,
+    ):
+        key = (subtopic_id, difficulty_id, int(question_type_id))
+        self.totals[key] += sign
+        for area_id in set(area_ids):
+            self.areas[(area_id, *key)] += sign
+
+    def statements(self) -> list[tuple[Insert, list[dict]]]:
+        """Sentencias ``(stmt, filas)`` a ejecutar; omite las variaciones nulas."""
+        statements = []
+
+        total_rows = [
+            {
+                "subtopic_id": subtopic_id,
+                "difficulty_id": difficulty_id,
+                "question_type_id": question_type_id,
+                "question_count": delta,
+            }
+            for (subtopic_id, difficulty_id, question_type_id), delta in sorted(
+                self.totals.items()
+            )
+            if delta
+        ]
+        if total_rows:
+            statements.append((_upsert_increment(QuestionStat), total_rows))
+
+        area_rows = [
+            {
+                "area_id": area_id,
+                "subtopic_id": subtopic_id,
+                "difficulty_id": difficulty_id,
+                "question_type_id": question_type_id,
+                "question_count": delta,
+            }
+            for (
+                area_id,
+                subtopic_id,
+                difficulty_id,
+                question_type_id,
+            ), delta in sorted(self.areas.items())
+            if delta
+        ]
+        if area_rows:
+            statements.append((_upsert_increment(QuestionAreaStat), area_rows))
+
+        # Filas ordenadas: transacciones concurrentes bloquean en el mismo orden
+        return statements
+
+    def apply(self, db: Session):
+        for stmt, rows in self.statements():
+            db.execute(stmt, rows)
+
+
+class QuestionStatsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_stats_db(
+            self,
+            group_by: list[str],
+            course_id: int | None = None,
+            topic_id: int | None = None,
+            subtopic_id: int | None = None,
+            difficulty_id: int | None = None,
+            question_type_id: int | None = None,
+            area_codes: tuple[str, ...] = (),
+    ) -> list[dict]:
+        """
+        Conteos agrupados por ``group_by`` (subconjunto de ``STATS_DIMENSIONS``).
+
+        Si se agrupa o filtra por área se usa ``question_area_stats``: una pregunta
+        con varias áreas cuenta una vez en cada una.
+        """
+        by_area = "area" in group_by or bool(area_codes)
+        model = QuestionAreaStat if by_area else QuestionStat
+
+        columns = {
+            "course": Topic.course_id.label("course_id"),
+            "topic": Subtopic.topic_id.label("topic_id"),
+            "subtopic": model.subtopic_id.label("subtopic_id"),
+            "difficulty": model.difficulty_id.label("difficulty_id"),
+            "question_type": model.question_type_id.label("question_type_id"),
+            "area": Area.code.label("area_code"),
+        }
+        dimensions = [columns[name] for name in STATS_DIMENSIONS if name in group_by]
+        total = func.sum(model.question_count)
+
+        stmt = (
+            select(*dimensions, total.label("count"))
+            .select_from(model)
+            .join(Subtopic, Subtopic.id == model.subtopic_id)
+            .join(Topic, Topic.id == Subtopic.topic_id)
+        )
+        if by_area:
+            stmt = stmt.join(Area, Area.id == model.area_id)
+            if area_codes:
+                stmt = stmt.where(Area.code.in_(area_codes))
+
+        if course_id is not None:
+            stmt = stmt.where(Topic.course_id == course_id)
+        if topic_id is not None:
+            stmt = stmt.where(Subtopic.topic_id == topic_id)
+        if subtopic_id is not None:
+            stmt = stmt.where(model.subtopic_id == subtopic_id)
+        if difficulty_id is not None:
+            stmt = stmt.where(model.difficulty_id == difficulty_id)
+        if question_type_id is not None:
+            stmt = stmt.where(model.question_type_id == question_type_id)
+
+        stmt = stmt.group_by(*dimensions).having(total > 0).order_by(*dimensions)
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
+
+    def rebuild_stats_db(self):
+        """Recalcula todos los conteos desde ``questions`` (corrige desvíos)."""
+        dimensions = [
+            Question.subtopic_id,
+            Question.difficulty_id,
+            Question.question_type_id,
+        ]
+        try:
+            self.db.execute(delete(QuestionStat))
+            self.db.execute(delete(QuestionAreaStat))
+            self.db.execute(
+                insert(QuestionStat).from_select(
+                    [
+                        "subtopic_id",
+                        "difficulty_id",
+                        "question_type_id",
+                        "question_count",
+                    ],
+                    select(*dimensions, func.count()).group_by(*dimensions),
+                )
+            )
+            self.db.execute(
+                insert(QuestionAreaStat).from_select(
+                    [
+                        "area_id",
+                        "subtopic_id",
+                        "difficulty_id",
+                        "question_type_id",
+                        "question_count",
+                    ],
+                    select(question_areas.c.area_id, *dimensions, func.count())
+                    .join(question_areas, question_areas.c.question_id == Question.id)
+                    .group_by(question_areas.c.area_id, *dimensions),
+                )
+            )
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
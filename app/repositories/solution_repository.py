@@ -1,7 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
+from app.core.question_cache import invalidate_question_cache
+from app.models.question import Question
 from app.models.solution import Solution
 from app.models.solution_content import SolutionContent
 
@@ -10,20 +12,62 @@ class SolutionRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_solution_db(self, question_id: int, solution_id: int):
+    def lock_question_solutions_db(self, question_id: int) -> set[int] | None:
+        """
+        Bloquea la pregunta (``SELECT ... FOR UPDATE``) y obtiene en la misma
+        consulta los IDs de sus soluciones. El bloqueo dura hasta
+        ``update_solution_db`` o ``rollback_db``.
+
+        :return: IDs de las soluciones o ``None`` si la pregunta no existe.
+        """
         stmt = (
-            select(Solution)
-            .where(Solution.id == solution_id, Solution.question_id == question_id)
-            .options(selectinload(Solution.contents))
+            select(Question.id, Solution.id.label("solution_id"))
+            .select_from(Question)
+            .outerjoin(Solution, Solution.question_id == Question.id)
+            .where(Question.id == question_id)
+            .with_for_update(of=Question)
         )
-        return self.db.scalar(stmt)
+        rows = self.db.execute(stmt).all()
+        if not rows:
+            return None
+
+        return {row.solution_id for row in rows if row.solution_id is not None}
+
+    def update_solution_db(
+            self, question_id: int, solution_id: int, contents: list[dict]
+    ) -> dict:
+        """
+        Reemplaza los contenidos de una solución (``DELETE`` + ``INSERT ...
+        RETURNING``) dentro de la transacción abierta por
+        ``lock_question_solutions_db`` y la confirma.
 
-    def update_solution_db(self, solution: Solution, contents: list[SolutionContent]):
+        :return: La solución ``{id, contents}`` con los contenidos insertados.
+        """
         try:
-            solution.contents = contents
+            self.db.execute(
+                delete(SolutionContent).where(
+                    SolutionContent.solution_id == solution_id
+                )
+            )
+            rows = self.db.execute(
+                insert(SolutionContent).returning(
+                    SolutionContent.id,
+                    SolutionContent.type,
+                    SolutionContent.value,
+                    SolutionContent.order,
+                    sort_by_parameter_order=True,
+                ),
+                [{**content, "solution_id": solution_id} for content in contents],
+            )
+            solution = {"id": solution_id, "contents": [row._asdict() for row in rows]}
             self.db.commit()
-            self.db.refresh(solution)
-            return solution
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        invalidate_question_cache(question_id)
+        return solution
+
+    def rollback_db(self):
+        """Descarta la transacción (y libera el bloqueo de la pregunta)"""
+        self.db.rollback()
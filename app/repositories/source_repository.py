@@ -2,45 +2,69 @@ from collections.abc import Mapping
 
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.core.cache import get_cached_count, set_cached_count
+from app.core.cache import get_or_compute_count, invalidate_counts
+from app.core.question_cache import invalidate_question_caches
+from app.core.reference_cache import SOURCES, invalidate_reference_data
+from app.models.question_source import QuestionSource
 from app.models.source import Source
 
+# Campos de la fuente incluidos en el detalle cacheado de sus preguntas
+QUESTION_CACHED_FIELDS = {"name", "year"}
+
 
 class SourceRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def get_source(self, source_id: int):
-        stmt = select(Source).where(Source.id == source_id)
+        stmt = (
+            select(Source)
+            .where(Source.id == source_id)
+            .options(joinedload(Source.institution))
+        )
         return self.db.scalar(stmt)
 
-    def get_sources(self, page: int, limit: int):
+    def get_sources(self, page: int, limit: int, include_total: bool = True):
         offset = (page - 1) * limit
 
-        stmt = select(Source).offset(offset).limit(limit)
+        # Un registro extra indica si existe una página siguiente
+        stmt = (
+            select(Source)
+            .options(joinedload(Source.institution))
+            .offset(offset)
+            .limit(limit + 1)
+        )
         items = list(self.db.scalars(stmt).all())
 
-        total = get_cached_count("sources:total_count")
-        if total is None:
-            total = self.db.scalar(select(func.count()).select_from(Source))
-            set_cached_count(name="sources:total_count", value=total, ttl=300)
+        if not include_total:
+            return items, None
+
+        total = get_or_compute_count(
+            "sources",
+            "total",
+            lambda: self.db.scalar(select(func.count()).select_from(Source)),
+            ttl=300,
+        )
 
-        return items
+        return items, total
 
-    def get_sources_by_ids(self, ids: list[int]):
-        stmt = select(Source).where(Source.id.in_(ids))
-        return list(self.db.scalars(stmt).all())
+    def get_source_refs_db(self):
+        """Todas las fuentes (sin la institución) para la caché de referencia"""
+        stmt = select(Source.id, Source.name, Source.year, Source.institution_id)
+        return self.db.execute(stmt).all()
 
     def create_source(self, source_data: Mapping[str, object]):
         db_source = Source(**source_data)
 
         try:
             self.db.add(db_source)
+            self.db.flush()
+            source_id = db_source.id
             self.db.commit()
-            self.db.refresh(db_source)
-            return db_source
+            # Recarga con la institución (``refresh`` no carga relaciones ``raise``)
+            db_source = self.get_source(source_id)
         except IntegrityError:
             self.db.rollback()
             raise
@@ -48,6 +72,10 @@ class SourceRepository:
             self.db.rollback()
             raise
 
+        invalidate_counts("sources")
+        invalidate_reference_data(SOURCES)
+        return db_source
+
     def update_source(self, source_id: int, update_data: Mapping[str, object]):
         stmt = select(Source).where(Source.id == source_id)
         db_source = self.db.scalar(stmt)
@@ -58,9 +86,19 @@ class SourceRepository:
         for key, value in update_data.items():
             setattr(db_source, key, value)
 
+        question_ids = []
+        if QUESTION_CACHED_FIELDS & update_data.keys():
+            question_ids = self.db.scalars(
+                select(QuestionSource.question_id).where(
+                    QuestionSource.source_id == source_id
+                )
+            ).all()
+
         try:
             self.db.commit()
-            self.db.refresh(db_source)
+            invalidate_reference_data(SOURCES)
+            invalidate_question_caches(question_ids)
+            db_source = self.get_source(source_id)
             return db_source
         except IntegrityError:
             self.db.rollback()
@@ -70,16 +108,27 @@ class SourceRepository:
             raise
 
     def delete_source(self, source_id: int):
-        stmt = select(Source).where(Source.id == source_id)
+        # La cascada del ORM elimina sus ``question_sources``: se cargan aquí,
+        # en una sola consulta, en lugar de en cada lectura de la fuente
+        stmt = (
+            select(Source)
+            .where(Source.id == source_id)
+            .options(selectinload(Source.question_sources))
+        )
         db_source = self.db.scalar(stmt)
 
         if not db_source:
             return None
 
+        question_ids = [qs.question_id for qs in db_source.question_sources]
         try:
             self.db.delete(db_source)
             self.db.commit()
-            return db_source
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        invalidate_counts("sources")
+        invalidate_reference_data(SOURCES)
+        invalidate_question_caches(question_ids)
+        return db_source
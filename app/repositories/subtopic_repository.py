@@ -2,9 +2,12 @@ from collections.abc import Mapping
 
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from app.core.cache import get_cached_count, set_cached_count
+from app.core.cache import get_or_compute_count, invalidate_counts
+from app.core.question_cache import invalidate_question_caches
+from app.core.taxonomy_cache import invalidate_taxonomy
+from app.models.question import Question
 from app.models.subtopic import Subtopic
 
 
@@ -13,30 +16,48 @@ class SubtopicRepository:
         self.db = db
 
     def get_subtopic(self, subtopic_id: int):
-        stmt = select(Subtopic).where(Subtopic.id == subtopic_id)
+        stmt = (
+            select(Subtopic)
+            .where(Subtopic.id == subtopic_id)
+            .options(joinedload(Subtopic.topic))
+        )
         return self.db.scalar(stmt)
 
-    def get_subtopics(self, page: int = 1, limit: int = 100):
+    def get_subtopics(
+            self, page: int = 1, limit: int = 100, include_total: bool = True
+    ):
         offset = (page - 1) * limit
 
-        # OBTENEMOS SUBTEMAS
-        stmt = select(Subtopic).offset(offset).limit(limit)
+        # OBTENEMOS SUBTEMAS (uno extra indica si existe una página siguiente)
+        stmt = (
+            select(Subtopic)
+            .options(joinedload(Subtopic.topic))
+            .offset(offset)
+            .limit(limit + 1)
+        )
         items = list(self.db.scalars(stmt).all())  # Convertir el Sequence a list
 
-        # OBTENER TOTAL DE CACHÉ
-        total = get_cached_count("subtopics:total_count")
-        if total is None:
-            total = self.db.scalar(select(func.count()).select_from(Subtopic))
-            set_cached_count(name="subtopics:total_count", value=total, ttl=300)
+        if not include_total:
+            return items, None
+
+        total = get_or_compute_count(
+            "subtopics",
+            "total",
+            lambda: self.db.scalar(select(func.count()).select_from(Subtopic)),
+            ttl=300,
+        )
 
-        return items
+        return items, total
 
     def create_subtopic(self, subtopic_data: Mapping[str, object]):
         db_subtopic = Subtopic(**subtopic_data)
         try:
             self.db.add(db_subtopic)
+            self.db.flush()
+            subtopic_id = db_subtopic.id
             self.db.commit()
-            self.db.refresh(db_subtopic)
+            # Recarga con el tema (``refresh`` no carga relaciones ``raise``)
+            db_subtopic = self.get_subtopic(subtopic_id)
         except IntegrityError:
             self.db.rollback()
             raise
@@ -44,6 +65,8 @@ class SubtopicRepository:
             self.db.rollback()
             raise
         else:
+            invalidate_counts("subtopics")
+            invalidate_taxonomy()
             return db_subtopic
 
     def update_subtopic(self, subtopic_id: int, update_data: Mapping[str, object]):
@@ -56,9 +79,18 @@ class SubtopicRepository:
         for key, value in update_data.items():
             setattr(db_subtopic, key, value)
 
+        # El nombre del subtema forma parte del detalle cacheado de sus preguntas
+        question_ids = []
+        if "name" in update_data:
+            question_ids = self.db.scalars(
+                select(Question.id).where(Question.subtopic_id == subtopic_id)
+            ).all()
+
         try:
             self.db.commit()
-            self.db.refresh(db_subtopic)
+            invalidate_taxonomy()
+            invalidate_question_caches(question_ids)
+            db_subtopic = self.get_subtopic(subtopic_id)
         except SQLAlchemyError:
             self.db.rollback()
             raise
@@ -79,4 +111,6 @@ class SubtopicRepository:
             self.db.rollback()
             raise
         else:
+            invalidate_counts("subtopics")
+            invalidate_taxonomy()
             return db_subtopic
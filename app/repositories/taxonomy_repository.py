@@ -0,0 +1,63 @@
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.db.question_json import json_array
+from app.models.area import Area
+from app.models.course import Course
+from app.models.difficulty import Difficulty
+from app.models.question_type import QuestionType
+from app.models.subtopic import Subtopic
+from app.models.topic import Topic
+
+
+def reference_json(model):
+    """Arreglo ``[{id, name, code}, ...]`` de una tabla de referencia."""
+    return json_array(
+        func.json_build_object("id", model.id, "name", model.name, "code", model.code),
+        model.id,
+    )
+
+
+def build_taxonomy_stmt() -> Select:
+    """
+    Árbol completo de la taxonomía como un solo documento JSON armado en PostgreSQL
+    (una consulta, sin importar la cantidad de cursos, temas o subtemas).
+    """
+    subtopics = json_array(
+        func.json_build_object("id", Subtopic.id, "name", Subtopic.name),
+        Subtopic.id,
+        Subtopic.topic_id == Topic.id,
+    )
+    topics = json_array(
+        func.json_build_object(
+            "id", Topic.id, "name", Topic.name, "subtopics", subtopics
+        ),
+        Topic.id,
+        Topic.course_id == Course.id,
+    )
+    courses = json_array(
+        func.json_build_object(
+            "id", Course.id, "name", Course.name, "code", Course.code, "topics", topics
+        ),
+        Course.id,
+    )
+    return select(
+        func.json_build_object(
+            "courses",
+            courses,
+            "areas",
+            reference_json(Area),
+            "difficulties",
+            reference_json(Difficulty),
+            "question_types",
+            reference_json(QuestionType),
+        )
+    )
+
+
+class TaxonomyRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_taxonomy_db(self) -> dict:
+        return self.db.scalar(build_taxonomy_stmt())
@@ -2,9 +2,10 @@ from collections.abc import Mapping
 
 from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
-from app.core.cache import get_cached_count, set_cached_count
+from app.core.cache import get_or_compute_count, invalidate_counts
+from app.core.taxonomy_cache import invalidate_taxonomy
 from app.models.topic import Topic
 
 
@@ -13,29 +14,46 @@ class TopicRepository:
         self.db = db
 
     def get_topic(self, topic_id: int):
-        stmt = select(Topic).where(Topic.id == topic_id)
+        stmt = (
+            select(Topic)
+            .where(Topic.id == topic_id)
+            .options(joinedload(Topic.course))
+        )
         return self.db.scalar(stmt)
 
-    def get_topics(self, page: int, limit: int):
+    def get_topics(self, page: int, limit: int, include_total: bool = True):
         offset = (page - 1) * limit
 
-        stmt = select(Topic).offset(offset).limit(limit)
+        # Un registro extra indica si existe una página siguiente
+        stmt = (
+            select(Topic)
+            .options(joinedload(Topic.course))
+            .offset(offset)
+            .limit(limit + 1)
+        )
         items = list(self.db.scalars(stmt).all())
 
-        total = get_cached_count("topics:total_count")
-        if total is None:
-            total = self.db.scalar(select(func.count()).select_from(Topic))
-            set_cached_count(name="topics:total_count", value=total, ttl=300)
+        if not include_total:
+            return items, None
+
+        total = get_or_compute_count(
+            "topics",
+            "total",
+            lambda: self.db.scalar(select(func.count()).select_from(Topic)),
+            ttl=300,
+        )
 
-        return items
+        return items, total
 
     def create_topic(self, topic_data: Mapping[str, object]):
         db_topic = Topic(**topic_data)
         try:
             self.db.add(db_topic)
+            self.db.flush()
+            topic_id = db_topic.id
             self.db.commit()
-            self.db.refresh(db_topic)
-            return db_topic
+            # Recarga con el curso (``refresh`` no carga relaciones ``raise``)
+            db_topic = self.get_topic(topic_id)
         except IntegrityError:
             self.db.rollback()
             raise
@@ -43,6 +61,10 @@ class TopicRepository:
             self.db.rollback()
             raise
 
+        invalidate_counts("topics")
+        invalidate_taxonomy()
+        return db_topic
+
     def update_topic(self, topic_id: int, update_data: Mapping[str, object]):
         stmt = select(Topic).where(Topic.id == topic_id)
         db_topic = self.db.scalar(stmt)
@@ -55,7 +77,8 @@ class TopicRepository:
 
         try:
             self.db.commit()
-            self.db.refresh(db_topic)
+            invalidate_taxonomy()
+            db_topic = self.get_topic(topic_id)
             return db_topic
         except IntegrityError:
             self.db.rollback()
@@ -74,7 +97,10 @@ class TopicRepository:
         try:
             self.db.delete(db_topic)
             self.db.commit()
-            return db_topic
         except SQLAlchemyError:
             self.db.rollback()
             raise
+
+        invalidate_counts("topics")
+        invalidate_taxonomy()
+        return db_topic
@@ -3,9 +3,12 @@ from pydantic.generics import GenericModel
 
 
 class PaginationMeta(BaseModel):
-    page: int
+    page: int | None = None
     size: int
-    total: int
-    pages: int
+    # Sin ``include_total`` no se cuenta el total (solo se informa ``has_next``)
+    total: int | None = None
+    pages: int | None = None
+    has_next: bool = False
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -4,6 +4,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.exceptions.domain import ResourceNotFoundException
 from app.core.exceptions.technical import RetrievalError
+from app.core.reference_cache import AREAS, reference_cache
 from app.repositories.area_repository import AreaRepository
 
 logger = logging.getLogger(__name__)
@@ -14,19 +15,27 @@ class AreaService:
         self.area_repository = area_repository
 
     def get_areas(self, ids: list[int]):
-        try:
-            areas = self.area_repository.get_areas(ids)
-        except SQLAlchemyError as e:
-            logger.exception(f"Error al obtener áreas")
-            raise RetrievalError("Error al obtener áreas") from e
-
-        # Obtener los ID's encontrados
-        found_ids = {area.id for area in areas}
-
-        # Obtener los ID's faltantes
-        missing_ids = set(ids) - found_ids  # Convertimos las lista de ids en un set
+        """
+        Áreas con ``ids`` (resueltas en memoria, ver ``app.core.reference_cache``),
+        listas para asignarse a ``Question.areas``.
+        """
+        rows, missing_ids = self._resolve(ids)
 
         if missing_ids:
             raise ResourceNotFoundException(f"IDs not found: {missing_ids}")
 
-        return areas
+        return self.area_repository.attach_areas(rows)
+
+    def find_area_ids(self, ids) -> set[int]:
+        """IDs existentes entre ``ids``, sin fallar por los faltantes."""
+        rows, _ = self._resolve(ids)
+        return {row.id for row in rows}
+
+    def _resolve(self, ids):
+        try:
+            return reference_cache.resolve(
+                AREAS, ids, self.area_repository.get_area_refs_db
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener áreas")
+            raise RetrievalError("Error al obtener áreas") from e
@@ -0,0 +1,306 @@
+import logging
+import math
+import random
+from collections import defaultdict
+
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+from app.api.v1.question.schemas import (
+    ExamBlueprintInput,
+    QuestionDetailPublic,
+    QuestionSolveResponse,
+    QuestionSummaryPublic,
+)
+from app.core.config import settings
+from app.core.exceptions.domain import (
+    InsufficientQuestionsError,
+    ResourceNotFoundException,
+)
+from app.core.exceptions.technical import DeleteError, RetrievalError
+from app.core.question_cache import aget_cached_question, aset_cached_question
+from app.domain.question.filters import QuestionFilters
+from app.helpers.content_signer import (
+    sign_image_contents_bulk,
+    sign_image_documents_bulk,
+)
+from app.helpers.cursor import decode_cursor, encode_cursor
+from app.repositories.async_question_repository import AsyncQuestionRepository
+from app.services.image_service import ImageService
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncQuestionService:
+    """Operaciones de lectura y eliminación de preguntas sobre ``AsyncSession``."""
+
+    def __init__(
+            self,
+            question_repository: AsyncQuestionRepository,
+            image_service: ImageService,
+    ):
+        self.question_repository = question_repository
+        self.image_service = image_service
+
+    async def get_all_questions(
+            self,
+            page: int,
+            limit: int,
+            view: str,
+            cursor: str | None = None,
+            filters: QuestionFilters | None = None,
+            include_total: bool = True,
+    ):
+        """
+        Obtiene las preguntas que cumplen los filtros indicados.
+
+        Con ``cursor`` se pagina por keyset a partir del último ID devuelto; en ambos
+        modos se devuelve ``next_cursor`` para continuar sin usar OFFSET. Sin
+        ``include_total`` no se ejecuta el conteo y el total es ``None``.
+
+        Las preguntas son documentos JSON (``dict``) armados en PostgreSQL con la
+        forma de ``QuestionSummaryPublic``/``QuestionDetailPublic``; aquí solo se
+        firman las imágenes.
+        """
+        after_id = decode_cursor(cursor) if cursor is not None else None
+
+        total = None
+        try:
+            questions = await self.question_repository.get_questions_db(
+                limit=limit, view=view, page=page, after_id=after_id, filters=filters
+            )
+            if include_total:
+                total = await self.question_repository.count_questions_db(
+                    filters=filters
+                )
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener las preguntas")
+            raise RetrievalError("Error al obtener las preguntas") from e
+
+        # El repositorio devuelve un registro extra si existe una página siguiente
+        next_cursor = None
+        if len(questions) > limit:
+            questions = questions[:limit]
+            next_cursor = encode_cursor(questions[-1]["id"])
+
+        # Generar URLs firmadas para todas las imágenes de la página
+        await self._sign_documents_images(questions)
+
+        return questions, total, next_cursor
+
+    async def search_questions(
+            self,
+            query: str,
+            page: int,
+            limit: int,
+            view: str,
+            filters: QuestionFilters | None = None,
+            include_total: bool = True,
+    ):
+        """
+        Busca preguntas por texto; se ordenan de mayor a menor relevancia. Como en
+        ``get_all_questions``, las preguntas son documentos JSON.
+        """
+        total = None
+        try:
+            questions = await self.question_repository.search_questions_db(
+                query=query, limit=limit, view=view, page=page, filters=filters
+            )
+            if include_total:
+                total = await self.question_repository.count_search_questions_db(
+                    query=query, filters=filters
+                )
+        except SQLAlchemyError as e:
+            logger.exception("Error al buscar preguntas")
+            raise RetrievalError("Error al buscar preguntas") from e
+
+        # El repositorio devuelve un registro extra si existe una página siguiente
+        has_next = len(questions) > limit
+        questions = questions[:limit]
+
+        await self._sign_documents_images(questions)
+
+        return questions, total, has_next
+
+    async def get_question(self, question_id: int, view: str):
+        """
+        Obtiene una pregunta. La versión serializada se guarda en caché con los
+        nombres de las imágenes (no las URLs), de modo que la firma siempre es nueva.
+        """
+        schema = QuestionSummaryPublic if view == "summary" else QuestionDetailPublic
+
+        cached = await aget_cached_question(question_id, view)
+        if cached is not None:
+            # by_name: el JSON usa los nombres de campo (``sources``), no los alias
+            item = schema.model_validate_json(cached, by_name=True)
+            await self._sign_questions_images([item], view)
+            return item
+
+        try:
+            question = await self.question_repository.get_question_db(
+                question_id=question_id, view=view
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener la pregunta con ID %s", question_id)
+            raise RetrievalError(
+                f"Error al obtener la pregunta con ID {question_id}"
+            ) from e
+
+        if not question:
+            raise ResourceNotFoundException(
+                message=f"Pregunta con ID {question_id} no encontrada."
+            )
+
+        # Se serializa antes de firmar para guardar los nombres de los objetos
+        item = schema.model_validate(question)
+        await aset_cached_question(question_id, view, item.model_dump_json())
+
+        await self._sign_questions_images([item], view)
+        return item
+
+    async def generate_exam(
+            self, blueprint: ExamBlueprintInput
+    ) -> list[QuestionSolveResponse]:
+        """
+        Arma un simulacro según las cuotas de ``blueprint``, sin repetir preguntas
+        entre secciones ni incluir las de ``exclude_hashes``.
+
+        Cada sección se muestrea en tramos cortos desde varios puntos al azar de
+        ``random_key`` (con índice); para cubrir los solapamientos entre tramos y
+        entre secciones se piden el doble de tramos de los necesarios para su cuota
+        más las cuotas anteriores.
+        """
+        area_codes = tuple(
+            sorted(
+                {code.strip().upper() for code in blueprint.area_codes if code.strip()}
+            )
+        )
+
+        sections = []
+        demanded = 0
+        for section in blueprint.sections:
+            filters = QuestionFilters(
+                subtopic_id=section.subtopic_id,
+                topic_id=section.topic_id,
+                course_id=section.course_id,
+                difficulty_id=section.difficulty_id,
+                area_codes=area_codes,
+            )
+            limit = section.count + demanded
+            starts = [
+                random.random()
+                for _ in range(2 * math.ceil(limit / settings.EXAM_SAMPLE_RUN_LENGTH))
+            ]
+            sections.append((filters, limit, starts))
+            demanded += section.count
+
+        try:
+            rows = await self.question_repository.sample_exam_question_ids_db(
+                sections, exclude_hashes=blueprint.exclude_hashes
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al generar el examen")
+            raise RetrievalError("Error al generar el examen") from e
+
+        candidates: dict[int, list[int]] = defaultdict(list)
+        for section_index, question_id in rows:
+            candidates[section_index].append(question_id)
+
+        picked: list[int] = []
+        seen: set[int] = set()
+        for index, section in enumerate(blueprint.sections):
+            chosen = [
+                qid for qid in dict.fromkeys(candidates[index]) if qid not in seen
+            ]
+            chosen = chosen[: section.count]
+            if len(chosen) < section.count:
+                raise InsufficientQuestionsError(
+                    f"La sección {index + 1} requiere {section.count} preguntas y "
+                    f"solo hay {len(chosen)} disponibles"
+                )
+            seen.update(chosen)
+            picked.extend(chosen)
+
+        if blueprint.shuffle:
+            random.shuffle(picked)
+
+        try:
+            questions = await self.question_repository.get_questions_for_solve_db(
+                picked
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener las preguntas del examen")
+            raise RetrievalError("Error al generar el examen") from e
+
+        position = {question_id: i for i, question_id in enumerate(picked)}
+        questions.sort(key=lambda question: position[question.id])
+
+        contents = []
+        for question in questions:
+            contents.extend(question.contents)
+            for choice in question.choices:
+                contents.extend(choice.contents)
+        await self._sign_contents(contents)
+
+        return [QuestionSolveResponse.model_validate(q) for q in questions]
+
+    async def delete_question(self, question_id: int):
+        try:
+            deleted_question = await self.question_repository.delete_question_db(
+                question_id=question_id
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al eliminar la pregunta con ID %s", question_id)
+            raise DeleteError(
+                f"Error al eliminar la pregunta con ID {question_id}"
+            ) from e
+
+        if not deleted_question:
+            raise ResourceNotFoundException(
+                message=f"Pregunta con ID {question_id} no encontrada."
+            )
+
+    async def _sign_questions_images(self, questions, view):
+        """
+        Genera URLs firmadas para todas las imágenes de un conjunto de preguntas,
+        firmando cada objeto una sola vez.
+        """
+        contents = []
+        for question in questions:
+            # Imágenes en contents
+            contents.extend(question.contents)
+
+            if view == "full":
+                # Imágenes en choices
+                for choice in question.choices:
+                    contents.extend(choice.contents)
+
+                # Imágenes en solutions
+                for solution in question.solutions:
+                    contents.extend(solution.contents)
+
+        await self._sign_contents(contents)
+
+    async def _sign_documents_images(self, documents: list[dict]):
+        """Igual que ``_sign_questions_images`` para documentos JSON."""
+        contents = []
+        for document in documents:
+            contents.extend(document["contents"])
+            # Solo presentes con ``view=full``
+            for choice in document.get("choices", ()):
+                contents.extend(choice["contents"])
+            for solution in document.get("solutions", ()):
+                contents.extend(solution["contents"])
+
+        if contents:
+            await run_in_threadpool(
+                sign_image_documents_bulk,
+                contents,
+                self.image_service.generate_signatures,
+            )
+
+    async def _sign_contents(self, contents):
+        # La firma puede requerir llamadas de red a GCP: no bloquear el event loop
+        await run_in_threadpool(
+            sign_image_contents_bulk, contents, self.image_service.generate_signatures
+        )
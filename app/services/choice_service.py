@@ -3,6 +3,7 @@ import logging
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.api.v1.choice.schemas import ChoicePublic, ChoiceUpdateInput
+from app.core.exceptions.base import DomainException
 from app.core.exceptions.domain import (
     DuplicateChoiceContentError,
     ForeignKeyViolationError,
@@ -11,24 +12,16 @@ from app.core.exceptions.domain import (
 )
 from app.core.exceptions.technical import PersistenceError, RetrievalError
 from app.helpers.content_signer import sign_image_contents
-from app.models.choice_content import ChoiceContent
 from app.repositories.choice_repository import ChoiceRepository
 from app.services.image_service import ImageService
-from app.services.question_guard_service import QuestionGuardService
 
 logger = logging.getLogger(__name__)
 
 
 class ChoiceService:
-    def __init__(
-            self,
-            repository: ChoiceRepository,
-            image_service: ImageService,
-            question_guard_service: QuestionGuardService,
-    ):
+    def __init__(self, repository: ChoiceRepository, image_service: ImageService):
         self.repository = repository
         self.image_service = image_service
-        self.question_guard_service = question_guard_service
 
     def update_choice(
             self,
@@ -36,43 +29,36 @@ class ChoiceService:
             choice_id: int,
             payload: ChoiceUpdateInput,
     ):
-        self.question_guard_service.ensure_exists(question_id=question_id)
-
+        """
+        Actualiza una alternativa en una sola transacción: la pregunta queda
+        bloqueada desde la lectura hasta el commit, de modo que las validaciones
+        (contenido único, al menos una alternativa correcta) no pueden romperse
+        por otra edición simultánea de la misma pregunta.
+        """
         try:
-            db_choice = self.repository.get_choice_db(
-                question_id=question_id, choice_id=choice_id
-            )
+            choices = self.repository.lock_question_choices_db(question_id)
         except SQLAlchemyError as e:
             logger.exception(
-                "Error al obtener alternativa %s de la pregunta %s",
-                choice_id,
-                question_id,
+                "Error al obtener alternativas de la pregunta %s", question_id
             )
             raise RetrievalError("Error al obtener la alternativa") from e
 
-        if not db_choice:
+        if choices is None:
             raise ResourceNotFoundException(
-                message=(
-                    f"Alternativa con ID {choice_id} no encontrada "
-                    f"en la pregunta con ID {question_id}."
-                )
+                message=f"Pregunta con ID {question_id} no encontrada."
             )
 
-        if payload.contents is not None:
-            self._validate_unique_choice_contents(
-                question_id=question_id, choice_id=choice_id, contents=payload.contents
-            )
-
-        # Si se quiere desmarcar la alternativa como correcta
-        if payload.is_correct is False and db_choice.is_correct:
-            # Verificar que exista al menos otra alternativa correcta antes de permitir el cambio.
-            self._validate_other_correct_choice_exists(question_id, choice_id)
+        try:
+            db_choice = self._validate_update(choices, question_id, choice_id, payload)
+        except DomainException:
+            # Libera el bloqueo de la pregunta
+            self.repository.rollback_db()
+            raise
 
-        demote_others = payload.is_correct is True
         new_contents = None
         if payload.contents is not None:
             new_contents = [
-                ChoiceContent(type=item.type, value=item.value, order=item.order)
+                {"type": item.type, "value": item.value, "order": item.order}
                 for item in payload.contents
             ]
 
@@ -83,7 +69,7 @@ class ChoiceService:
                 label=payload.label,
                 is_correct=payload.is_correct,
                 contents=new_contents,
-                demote_others=demote_others,
+                demote_others=payload.is_correct is True,
             )
         except IntegrityError as e:
             logger.exception("IntegrityError al actualizar alternativa")
@@ -98,56 +84,62 @@ class ChoiceService:
             logger.exception("Error al actualizar alternativa")
             raise PersistenceError("Error al actualizar la alternativa") from e
 
-        sign_image_contents(
-            updated_choice.contents, self.image_service.generate_signature
-        )
-        return ChoicePublic.model_validate(updated_choice)
+        response = ChoicePublic.model_validate(updated_choice)
+        sign_image_contents(response.contents, self.image_service.generate_signature)
+        return response
 
-    def _validate_other_correct_choice_exists(self, question_id: int, choice_id: int):
+    @staticmethod
+    def _validate_update(
+            choices: dict[int, dict],
+            question_id: int,
+            choice_id: int,
+            payload: ChoiceUpdateInput,
+    ) -> dict:
         """
-        Valida que exista al menos otra alternativa correcta en la pregunta,
-        excluyendo la alternativa indicada por `choice_id`
+        Valida el cambio contra las alternativas de la pregunta (ya bloqueada).
+
+        :return: La alternativa a actualizar.
         """
-        try:
-            correct_others = self.repository.count_correct_choices_db(
-                question_id=question_id, exclude_choice_id=choice_id
+        db_choice = choices.get(choice_id)
+        if db_choice is None:
+            raise ResourceNotFoundException(
+                message=(
+                    f"Alternativa con ID {choice_id} no encontrada "
+                    f"en la pregunta con ID {question_id}."
+                )
             )
-        except SQLAlchemyError as e:
-            logger.exception("Error al validar alternativa correcta")
-            raise RetrievalError("Error al validar alternativas correctas") from e
 
-        if correct_others == 0:
-            raise NoCorrectChoiceError("Debe existir al menos una alternativa correcta")
+        others = [choice for choice in choices.values() if choice["id"] != choice_id]
 
-    def _validate_unique_choice_contents(
-            self,
-            question_id: int,
-            choice_id: int,
-            contents,
-    ):
-        """Valida que los contenidos de una alternativa sean únicos tanto dentro de la propia alternativa
-        como respecto a las demás alternativas de la misma pregunta."""
-
-        # 1
-        incoming_values = [content.value.strip().lower() for content in contents]
-        if len(incoming_values) != len(set(incoming_values)):
-            raise DuplicateChoiceContentError(
-                "Las respuestas deben ser únicas dentro de la alternativa."
-            )
+        if payload.contents is not None:
+            # Contenidos únicos dentro de la propia alternativa y respecto a las
+            # demás alternativas de la pregunta
+            incoming_values = [
+                content.value.strip().lower() for content in payload.contents
+            ]
+            if len(incoming_values) != len(set(incoming_values)):
+                raise DuplicateChoiceContentError(
+                    "Las respuestas deben ser únicas dentro de la alternativa."
+                )
 
-        try:
-            other_values = self.repository.get_other_choice_content_values_db(
-                question_id=question_id, choice_id=choice_id
-            )
-        except SQLAlchemyError as e:
-            logger.exception("Error al validar contenido duplicado de alternativas")
-            raise RetrievalError("Error al validar contenido de alternativas") from e
-
-        # 2
-        duplicated = [value for value in incoming_values if value in other_values]
-        if duplicated:
-            message = (
-                "Las respuestas deben ser únicas. "
-                f"Contenido duplicado: '{duplicated[0]}'"
-            )
-            raise DuplicateChoiceContentError(message)
+            other_values = {
+                content["value"].strip().lower()
+                for choice in others
+                for content in choice["contents"]
+            }
+            duplicated = [value for value in incoming_values if value in other_values]
+            if duplicated:
+                message = (
+                    "Las respuestas deben ser únicas. "
+                    f"Contenido duplicado: '{duplicated[0]}'"
+                )
+                raise DuplicateChoiceContentError(message)
+
+        # Si se quiere desmarcar la alternativa como correcta, debe quedar otra
+        if payload.is_correct is False and db_choice["is_correct"]:
+            if not any(choice["is_correct"] for choice in others):
+                raise NoCorrectChoiceError(
+                    "Debe existir al menos una alternativa correcta"
+                )
+
+        return db_choice
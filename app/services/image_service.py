@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 
 from fastapi import UploadFile
 from google.api_core.exceptions import (
@@ -9,6 +10,7 @@ from google.api_core.exceptions import (
 )
 
 from app.core.exceptions.domain import ContentTypeError
+from app.core.signed_url_cache import signed_url_cache
 from app.core.exceptions.technical import (
     StorageBucketNotFoundError,
     StoragePermissionDeniedError,
@@ -66,10 +68,25 @@ class ImageService:
             return image_path
 
     def generate_signature(self, storage_object_name: str):
+        return self.generate_signatures([storage_object_name])[storage_object_name]
+
+    def generate_signatures(self, storage_object_names: Iterable[str]):
+        """
+        Genera URLs firmadas para varios objetos. Los nombres se deduplican y solo se
+        firman los que no están en la caché de URLs firmadas.
+        :return: Diccionario ``{nombre del objeto: URL firmada}``.
+        """
+        names = list(dict.fromkeys(storage_object_names))
+        urls = signed_url_cache.get_many(self.storage_container_name, names)
+
+        missing = [name for name in names if name not in urls]
+        if not missing:
+            return urls
+
         try:
-            url = self.storage.generate_signed_url(
+            signed = self.storage.generate_signed_urls(
                 storage_container_name=self.storage_container_name,
-                storage_object_name=storage_object_name,
+                storage_object_names=missing,
             )
         except Forbidden:
             logger.error("Permisos insuficientes para generar URL firmada")
@@ -85,5 +102,7 @@ class ImageService:
         except Exception as e:
             logger.exception("Error inesperado al generar la URL firmada: %s", e)
             raise StorageError("Error inesperado al generar la URL firmada") from e
-        else:
-            return url
+
+        signed_url_cache.set_many(self.storage_container_name, signed)
+        urls.update(signed)
+        return urls
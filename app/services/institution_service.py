@@ -7,9 +7,9 @@ from app.api.v1.institution.schemas import (
     InstitutionPublic,
     InstitutionUpdate,
 )
-from app.core.cache import get_cached_count
 from app.core.exceptions.domain import ResourceNotFoundException, DuplicateValueError
 from app.core.exceptions.technical import DeleteError, PersistenceError, RetrievalError
+from app.core.reference_cache import INSTITUTIONS, reference_cache
 from app.repositories.institution_repository import InstitutionRepository
 
 logger = logging.getLogger(__name__)
@@ -35,23 +35,43 @@ class InstitutionService:
 
         return institution
 
-    def get_institutions(self, page: int, limit: int):
+    def ensure_institution_exists(self, institution_id: int):
+        """Valida el ID en memoria (ver ``app.core.reference_cache``)"""
         try:
-            institutions = self.repository.get_institutions(page, limit)
+            _, missing_ids = reference_cache.resolve(
+                INSTITUTIONS,
+                [institution_id],
+                self.repository.get_institution_refs_db,
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener instituciones")
+            raise RetrievalError("Error al obtener instituciones") from e
+
+        if missing_ids:
+            raise ResourceNotFoundException(
+                message=f"Institución con ID {institution_id} no encontrada"
+            )
+
+    def get_institutions(self, page: int, limit: int, include_total: bool = True):
+        try:
+            institutions, total = self.repository.get_institutions(
+                page, limit, include_total
+            )
         except SQLAlchemyError as e:
             logger.exception(
                 f"Error al listar instituciones (page={page}, limit={limit})"
             )
             raise RetrievalError("Error al listar instituciones") from e
 
+        has_next = len(institutions) > limit
+        institutions = institutions[:limit]
+
         items = [
             InstitutionPublic.model_validate(institution)
             for institution in institutions
         ]
 
-        total = get_cached_count("institutions:total_count")
-
-        return items, total
+        return items, total, has_next
 
     def get_institutions_by_ids(self, ids: list[int]):
         try:
@@ -17,7 +17,7 @@ from app.domain.question.hash import generate_question_hash
 from app.helpers.content_signer import sign_image_contents
 from app.repositories.question_content_repository import QuestionContentRepository
 from app.services.image_service import ImageService
-from app.services.question_guard_service import QuestionGuardService
+from app.services.question_similarity_service import QuestionSimilarityService
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +27,11 @@ class QuestionContentService:
             self,
             repository: QuestionContentRepository,
             image_service: ImageService,
-            question_guard_service: QuestionGuardService,
+            similarity_service: QuestionSimilarityService,
     ):
         self.repository = repository
         self.image_service = image_service
-        self.question_guard_service = question_guard_service
+        self.similarity_service = similarity_service
 
     def update_question_content(
             self,
@@ -39,22 +39,29 @@ class QuestionContentService:
             content_id: int,
             payload: QuestionContentUpdateInput,
     ):
-        self.question_guard_service.ensure_exists(question_id=question_id)
-
+        """
+        Actualiza un contenido de la pregunta y su hash en una sola transacción:
+        la pregunta queda bloqueada desde la lectura de sus contenidos hasta el
+        commit, de modo que el hash siempre corresponde al contenido guardado aunque
+        se editen otros contenidos de la misma pregunta a la vez.
+        """
         try:
-            db_content = self.repository.get_question_content_db(
-                question_id=question_id,
-                content_id=content_id,
-            )
+            locked = self.repository.lock_question_contents_db(question_id)
         except SQLAlchemyError as e:
             logger.exception(
-                "Error al obtener contenido %s de la pregunta %s",
-                content_id,
-                question_id,
+                "Error al obtener contenidos de la pregunta con ID %s", question_id
             )
-            raise RetrievalError("Error al obtener el contenido de la pregunta") from e
+            raise RetrievalError("Error al obtener contenidos de la pregunta") from e
 
-        if not db_content:
+        if locked is None:
+            raise ResourceNotFoundException(
+                message=f"Pregunta con ID {question_id} no encontrada."
+            )
+
+        previous_hash, contents = locked
+        if all(content["id"] != content_id for content in contents):
+            # Libera el bloqueo de la pregunta
+            self.repository.rollback_db()
             raise ResourceNotFoundException(
                 message=(
                     f"Contenido con ID {content_id} no encontrado "
@@ -62,53 +69,37 @@ class QuestionContentService:
                 )
             )
 
-        try:
-            contents = self.repository.get_question_contents_db(question_id=question_id)
-        except SQLAlchemyError as e:
-            logger.exception(
-                "Error al obtener contenidos de la pregunta con ID %s", question_id
+        values = {
+            key: value
+            for key, value in (
+                ("label", payload.label),
+                ("type", payload.type),
+                ("value", payload.value),
+                ("order", payload.order),
             )
-            raise RetrievalError("Error al obtener contenidos de la pregunta") from e
+            if value is not None
+        }
 
-        # Se usa para generar un hash de la pregunta y detectar duplicados antes de persistir
+        # Se usa para generar un hash de la pregunta y detectar duplicados antes de
+        # persistir
         projected_contents = []
         for content in contents:
-            if content.id == content_id:
-                projected_contents.append(
-                    # Simulamos el objeto QuestionContent
-                    SimpleNamespace(
-                        type=payload.type if payload.type is not None else content.type,
-                        value=(
-                            payload.value
-                            if payload.value is not None
-                            else content.value
-                        ),
-                        order=(
-                            payload.order
-                            if payload.order is not None
-                            else content.order
-                        ),
-                    )
-                )
-                continue
-
+            if content["id"] == content_id:
+                content = {**content, **values}
+            # Simulamos el objeto QuestionContent
             projected_contents.append(
                 SimpleNamespace(
-                    type=content.type,
-                    value=content.value,
-                    order=content.order,
+                    type=content["type"], value=content["value"], order=content["order"]
                 )
             )
-
         question_hash = generate_question_hash(projected_contents)
 
         try:
             updated_content = self.repository.update_question_content_db(
-                content=db_content,
-                label=payload.label,
-                content_type=payload.type,
-                value=payload.value,
-                order=payload.order,
+                question_id=question_id,
+                content_id=content_id,
+                values=values,
+                previous_hash=previous_hash,
                 question_hash=question_hash,
             )
         except IntegrityError as e:
@@ -133,6 +124,9 @@ class QuestionContentService:
                 "Error al actualizar el contenido de la pregunta"
             ) from e
 
-        sign_image_contents([updated_content], self.image_service.generate_signature)
+        # El texto cambió: se recalcula la firma de similitud
+        self.similarity_service.index_questions({question_id: projected_contents})
 
-        return QuestionContentResponse.model_validate(updated_content)
+        response = QuestionContentResponse.model_validate(updated_content)
+        sign_image_contents([response], self.image_service.generate_signature)
+        return response
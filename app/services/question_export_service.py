@@ -0,0 +1,38 @@
+import logging
+from collections.abc import Iterator
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.domain.question.filters import QuestionFilters
+from app.repositories.question_repository import QuestionRepository
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionExportService:
+    def __init__(self, question_repository: QuestionRepository):
+        self.question_repository = question_repository
+
+    def export_ndjson(
+            self,
+            filters: QuestionFilters | None = None,
+            batch_size: int = settings.EXPORT_BATCH_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Genera el banco de preguntas en formato NDJSON (una pregunta por línea),
+        un bloque de líneas por cada lote leído de la base de datos.
+
+        Las imágenes se exportan con el nombre del objeto, sin firmar: una URL
+        firmada vencería antes de que el archivo exportado se use.
+        """
+        try:
+            # Cada documento ya es el JSON de ``QuestionExportRecord`` (PostgreSQL)
+            for documents in self.question_repository.stream_questions_db(
+                filters=filters, batch_size=batch_size
+            ):
+                yield b"".join(document.encode() + b"\n" for document in documents)
+        except SQLAlchemyError:
+            # La respuesta ya comenzó: solo queda registrar el error y cortar
+            logger.exception("Error al exportar las preguntas")
+            raise
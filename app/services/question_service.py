@@ -1,25 +1,33 @@
 import logging
+from collections import Counter
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.api.v1.question.schemas import (
     QuestionAreasSpecificUpdate,
+    QuestionBulkCreateResponse,
+    QuestionBulkItemResult,
+    QuestionBulkItemStatus,
     QuestionCreateInput,
-    QuestionDetailPublic,
+    QuestionCreateResponse,
     QuestionDifficultySpecificUpdate,
+    QuestionDuplicateCheckInput,
+    QuestionDuplicateCheckResult,
+    QuestionReclassifyInput,
+    QuestionReclassifyItemResult,
+    QuestionReclassifyItemStatus,
+    QuestionReclassifyResponse,
     QuestionSubtopicSpecificUpdate,
-    QuestionSummaryPublic,
     QuestionTypeSpecificUpdate,
 )
-from app.core.cache import get_cached_count
 from app.core.exceptions.domain import (
     DuplicateValueError,
     ForeignKeyViolationError,
     ResourceNotFoundException,
 )
-from app.core.exceptions.technical import DeleteError, PersistenceError, RetrievalError
+from app.core.exceptions.technical import PersistenceError, RetrievalError
+from app.core.reference_cache import DIFFICULTIES, QUESTION_TYPES, reference_cache
 from app.domain.question.hash import generate_question_hash
-from app.helpers.content_signer import sign_image_contents
 from app.models.choice import Choice
 from app.models.choice_content import ChoiceContent
 from app.models.question import Question
@@ -30,11 +38,24 @@ from app.models.solution_content import SolutionContent
 from app.repositories.question_repository import QuestionRepository
 from app.services.area_service import AreaService
 from app.services.image_service import ImageService
+from app.services.question_similarity_service import QuestionSimilarityService
 from app.services.source_service import SourceService
 
 logger = logging.getLogger(__name__)
 
 
+def build_bulk_response(
+        items: list[QuestionBulkItemResult],
+) -> QuestionBulkCreateResponse:
+    """Agrupa los resultados por elemento de una importación masiva."""
+    return QuestionBulkCreateResponse(
+        created=sum(i.status == QuestionBulkItemStatus.CREATED for i in items),
+        duplicates=sum(i.status == QuestionBulkItemStatus.DUPLICATE for i in items),
+        invalid=sum(i.status == QuestionBulkItemStatus.INVALID for i in items),
+        items=items,
+    )
+
+
 class QuestionService:
     def __init__(
             self,
@@ -42,21 +63,27 @@ class QuestionService:
             area_service: AreaService,
             source_service: SourceService,
             image_service: ImageService,
+            similarity_service: QuestionSimilarityService,
     ):
         self.question_repository = question_repository
         self.area_service = area_service
         self.source_service = source_service
         self.image_service = image_service
+        self.similarity_service = similarity_service
 
-    async def create_question(self, question: QuestionCreateInput):
+    def create_question(self, question: QuestionCreateInput):
         question_hash = generate_question_hash(question.contents)
 
+        # Evita construir e insertar el grafo completo si la pregunta ya existe
+        if self.question_repository.find_existing_hashes_db([question_hash]):
+            raise DuplicateValueError("La pregunta ya existe en la base de datos")
+
+        # Referencias validadas en memoria: sin consultas antes del INSERT
+        self._ensure_classification(question.difficulty_id, question.question_type_id)
         areas = self.area_service.get_areas(question.area_ids)
-        sources_ids = [
-            question_source.source_id for question_source in question.sources
-        ]
-        valid_sources = self.source_service.get_sources_by_ids(sources_ids)
-        source_by_id = {source.id: source for source in valid_sources}
+        self.source_service.ensure_sources_exist(
+            [question_source.source_id for question_source in question.sources]
+        )
 
         try:
             # Crear solución con contenidos
@@ -90,9 +117,7 @@ class QuestionService:
 
             question_sources = [
                 QuestionSource(
-                    source_id=question_source.source_id,
-                    page=question_source.page,
-                    source=source_by_id[question_source.source_id],
+                    source_id=question_source.source_id, page=question_source.page
                 )
                 for question_source in question.sources
             ]
@@ -110,7 +135,7 @@ class QuestionService:
                 question_sources=question_sources,
             )
 
-            return self.question_repository.create_question_db(new_question)
+            db_question = self.question_repository.create_question_db(new_question)
         except IntegrityError as e:
             # Ya logueas stacktrace.
             logger.exception("IntegrityError al crear la pregunta")
@@ -136,61 +161,279 @@ class QuestionService:
                 message="Error al crear la pregunta en la base de datos."
             ) from e
 
-    def get_all_questions(self, page: int, limit: int, view: str):
-        """Obtiene todas las preguntas."""
+        # Se serializa antes de indexar: el commit de la firma expira la instancia
+        response = QuestionCreateResponse.model_validate(db_question)
+        similar = self.similarity_service.index_and_find_similar(
+            {db_question.id: question.contents}
+        )
+        return response.model_copy(
+            update={"similar_questions": similar.get(db_question.id, [])}
+        )
+
+    def replace_question(
+            self, question_id: int, question: QuestionCreateInput
+    ) -> QuestionCreateResponse:
+        """
+        Reemplaza una pregunta completa (mismo documento que la creación) en una
+        sola transacción, aplicando solo las diferencias con lo guardado.
+        """
+        self._ensure_classification(question.difficulty_id, question.question_type_id)
+        areas = self.area_service.get_areas(question.area_ids)
+        self.source_service.ensure_sources_exist(
+            [question_source.source_id for question_source in question.sources]
+        )
+
+        question_hash = generate_question_hash(question.contents)
         try:
-            questions = self.question_repository.get_questions_db(
-                page=page, limit=limit, view=view
+            db_question = self.question_repository.replace_question_db(
+                question_id=question_id,
+                document=self._to_bulk_row(question, question_hash),
+                areas=areas,
             )
+        except IntegrityError as e:
+            logger.exception("IntegrityError al reemplazar la pregunta %s", question_id)
+
+            orig = getattr(e, "orig", None)
+            pgcode = getattr(orig, "pgcode", None)
+
+            if pgcode == "23505":
+                raise DuplicateValueError(
+                    "La pregunta ya existe en la base de datos"
+                ) from e
+
+            if pgcode == "23503":
+                raise ForeignKeyViolationError("La clave foránea no existe") from e
+
+            raise PersistenceError(
+                "Error al reemplazar la pregunta en la base de datos."
+            ) from e
         except SQLAlchemyError as e:
-            logger.exception("Error al obtener las preguntas")
-            raise RetrievalError("Error al obtener las preguntas") from e
+            logger.exception("Error al reemplazar la pregunta %s", question_id)
+            raise PersistenceError(
+                "Error al reemplazar la pregunta en la base de datos."
+            ) from e
 
-        # Obtener el total de preguntas de caché
-        total = get_cached_count("questions:total_count")
+        if db_question is None:
+            raise ResourceNotFoundException(
+                message=f"Pregunta con ID {question_id} no encontrada."
+            )
 
-        # Generar URLs firmadas para todas las imágenes
-        for question in questions:
-            self._sign_question_images(question, view)
+        response = QuestionCreateResponse.model_validate(db_question)
+        self.similarity_service.index_questions({question_id: question.contents})
+        return response
 
-        if view == "summary":
-            items = [
-                QuestionSummaryPublic.model_validate(question) for question in questions
-            ]
+    def create_questions_bulk(
+            self,
+            questions: list[QuestionCreateInput],
+            indexes: list[int] | None = None,
+    ) -> QuestionBulkCreateResponse:
+        """
+        Crea un lote de preguntas en una sola transacción.
+
+        Las referencias (subtemas, áreas, fuentes, dificultades y tipos) se
+        resuelven una vez para todo el lote. Las preguntas duplicadas (en la BD o
+        dentro del mismo lote) y las que referencian registros inexistentes se
+        omiten y se informan por elemento, sin abortar el lote.
+
+        :param indexes: Posición de cada pregunta en la petición original (por
+            defecto, su posición en ``questions``).
+        """
+        if indexes is None:
+            indexes = list(range(len(questions)))
+
+        area_ids = {area_id for q in questions for area_id in q.area_ids}
+        source_ids = {s.source_id for q in questions for s in q.sources}
+        valid_area_ids = self.area_service.find_area_ids(area_ids)
+        valid_subtopic_ids = self._find_subtopic_ids(
+            {q.subtopic_id for q in questions}
+        )
+        valid_source_ids = self.source_service.find_source_ids(source_ids)
+        valid_difficulty_ids = self._find_reference_ids(
+            DIFFICULTIES,
+            {q.difficulty_id for q in questions},
+            self.question_repository.get_difficulty_refs_db,
+        )
+        valid_question_type_ids = self._find_reference_ids(
+            QUESTION_TYPES,
+            {q.question_type_id for q in questions},
+            self.question_repository.get_question_type_refs_db,
+        )
 
-            return items, total
+        hashes = [generate_question_hash(q.contents) for q in questions]
+        existing = self.question_repository.find_existing_hashes_db(hashes)
+
+        results: dict[int, QuestionBulkItemResult] = {}
+        rows = []
+        index_by_hash: dict[str, int] = {}
+        question_by_hash: dict[str, QuestionCreateInput] = {}
+
+        for index, question, question_hash in zip(indexes, questions, hashes):
+            if question_hash in existing:
+                results[index] = QuestionBulkItemResult(
+                    index=index,
+                    status=QuestionBulkItemStatus.DUPLICATE,
+                    id=existing[question_hash],
+                    question_hash=question_hash,
+                    message="La pregunta ya existe en la base de datos",
+                )
+                continue
+
+            missing_areas = set(question.area_ids) - valid_area_ids
+            missing_sources = {s.source_id for s in question.sources} - valid_source_ids
+            missing_difficulty = question.difficulty_id not in valid_difficulty_ids
+            missing_type = question.question_type_id not in valid_question_type_ids
+            missing_subtopic = question.subtopic_id not in valid_subtopic_ids
+            if (
+                missing_areas
+                or missing_sources
+                or missing_difficulty
+                or missing_type
+                or missing_subtopic
+            ):
+                message = "Referencias no encontradas:"
+                if missing_subtopic:
+                    message += f" subtema {question.subtopic_id}"
+                if missing_areas:
+                    message += f" áreas {sorted(missing_areas)}"
+                if missing_sources:
+                    message += f" fuentes {sorted(missing_sources)}"
+                if missing_difficulty:
+                    message += f" dificultad {question.difficulty_id}"
+                if missing_type:
+                    message += f" tipo de pregunta {question.question_type_id}"
+                results[index] = QuestionBulkItemResult(
+                    index=index,
+                    status=QuestionBulkItemStatus.INVALID,
+                    question_hash=question_hash,
+                    message=message,
+                )
+                continue
+
+            if question_hash in index_by_hash:
+                results[index] = QuestionBulkItemResult(
+                    index=index,
+                    status=QuestionBulkItemStatus.DUPLICATE,
+                    question_hash=question_hash,
+                    message=(
+                        "Pregunta duplicada dentro del lote "
+                        f"(posición {index_by_hash[question_hash]})"
+                    ),
+                )
+                continue
 
-        items = [
-            QuestionDetailPublic.model_validate(question) for question in questions
-        ]
-        return items, total
+            index_by_hash[question_hash] = index
+            question_by_hash[question_hash] = question
+            rows.append(self._to_bulk_row(question, question_hash))
 
-    def get_question(self, question_id: int, view: str):
         try:
-            question = self.question_repository.get_question_db(
-                question_id=question_id, view=view
-            )
+            id_by_hash = self.question_repository.create_questions_bulk_db(rows)
+        except IntegrityError as e:
+            logger.exception("IntegrityError al crear preguntas en lote")
+
+            orig = getattr(e, "orig", None)
+            pgcode = getattr(orig, "pgcode", None)
+
+            if pgcode == "23503":
+                raise ForeignKeyViolationError("La clave foránea no existe") from e
+
+            raise PersistenceError(
+                "Error al crear las preguntas en la base de datos."
+            ) from e
         except SQLAlchemyError as e:
-            logger.exception("Error al obtener la pregunta con ID %s", question_id)
-            raise RetrievalError(
-                f"Error al obtener la pregunta con ID {question_id}"
+            logger.exception("Error al crear preguntas en lote")
+            raise PersistenceError(
+                "Error al crear las preguntas en la base de datos."
             ) from e
 
-        if not question:
-            raise ResourceNotFoundException(
-                message=f"Pregunta con ID {question_id} no encontrada."
+        similar = self.similarity_service.index_and_find_similar(
+            {
+                question_id: question_by_hash[question_hash].contents
+                for question_hash, question_id in id_by_hash.items()
+            }
+        )
+
+        for question_hash, index in index_by_hash.items():
+            question_id = id_by_hash.get(question_hash)
+            if question_id is None:
+                results[index] = QuestionBulkItemResult(
+                    index=index,
+                    status=QuestionBulkItemStatus.DUPLICATE,
+                    question_hash=question_hash,
+                    message="La pregunta ya existe en la base de datos",
+                )
+                continue
+
+            results[index] = QuestionBulkItemResult(
+                index=index,
+                status=QuestionBulkItemStatus.CREATED,
+                id=question_id,
+                question_hash=question_hash,
+                similar_questions=similar.get(question_id, []),
             )
 
-        self._sign_question_images(question, view)
+        return build_bulk_response([results[index] for index in indexes])
 
-        if view == "summary":
-            return QuestionSummaryPublic.model_validate(question)
+    def check_duplicates(
+            self, candidates: list[QuestionDuplicateCheckInput]
+    ) -> list[QuestionDuplicateCheckResult]:
+        """Indica, por candidato, si ya existe una pregunta con el mismo contenido."""
+        hashes = [generate_question_hash(c.contents) for c in candidates]
+        existing = self.question_repository.find_existing_hashes_db(hashes)
 
-        return QuestionDetailPublic.model_validate(question)
+        return [
+            QuestionDuplicateCheckResult(
+                index=index,
+                question_hash=question_hash,
+                exists=question_hash in existing,
+                question_id=existing.get(question_hash),
+            )
+            for index, question_hash in enumerate(hashes)
+        ]
+
+    @staticmethod
+    def _to_bulk_row(question: QuestionCreateInput, question_hash: str) -> dict:
+        """
+        Convierte una pregunta en las filas que inserta ``create_questions_bulk_db``.
+        """
+        return {
+            "question_type_id": question.question_type_id,
+            "subtopic_id": question.subtopic_id,
+            "difficulty_id": question.difficulty_id,
+            "question_hash": question_hash,
+            "area_ids": list(dict.fromkeys(question.area_ids)),
+            "contents": [
+                {"label": c.label, "type": c.type, "value": c.value, "order": c.order}
+                for c in question.contents
+            ],
+            "choices": [
+                {
+                    "label": c.label,
+                    "is_correct": c.is_correct,
+                    "contents": [
+                        {"type": i.type, "value": i.value, "order": i.order}
+                        for i in c.contents
+                    ],
+                }
+                for c in question.choices
+            ],
+            "solutions": [
+                {
+                    "contents": [
+                        {"type": i.type, "value": i.value, "order": i.order}
+                        for i in s.contents
+                    ]
+                }
+                for s in question.solutions
+            ],
+            "sources": [
+                {"source_id": s.source_id, "page": s.page} for s in question.sources
+            ],
+        }
 
     def update_question_type(
             self, question_id: int, payload: QuestionTypeSpecificUpdate
     ):
+        self._ensure_classification(question_type_id=payload.question_type_id)
         self._update_question_fields(
             question_id=question_id,
             update_data={"question_type_id": payload.question_type_id},
@@ -208,6 +451,7 @@ class QuestionService:
     def update_question_difficulty(
             self, question_id: int, payload: QuestionDifficultySpecificUpdate
     ):
+        self._ensure_classification(difficulty_id=payload.difficulty_id)
         self._update_question_fields(
             question_id=question_id,
             update_data={"difficulty_id": payload.difficulty_id},
@@ -223,6 +467,75 @@ class QuestionService:
             question_id=question_id, update_data={"areas": areas}
         )
 
+    def reclassify_questions(
+            self, payload: QuestionReclassifyInput
+    ) -> QuestionReclassifyResponse:
+        """
+        Aplica el mismo cambio de clasificación (subtema, dificultad, tipo y/o
+        áreas) a un conjunto de preguntas en una sola transacción.
+
+        Las referencias se validan una vez para todo el lote; los IDs inexistentes
+        y las preguntas que se quedarían sin áreas se informan por elemento sin
+        abortar el resto.
+        """
+        self._ensure_classification(payload.difficulty_id, payload.question_type_id)
+
+        area_ids = set(payload.add_area_ids) | set(payload.remove_area_ids)
+        missing_areas = area_ids - self.area_service.find_area_ids(area_ids)
+        if missing_areas:
+            raise ResourceNotFoundException(
+                message=f"Áreas no encontradas: {sorted(missing_areas)}"
+            )
+
+        question_ids = list(dict.fromkeys(payload.question_ids))
+        try:
+            changed = self.question_repository.reclassify_questions_db(
+                question_ids=question_ids,
+                update_data=payload.field_updates(),
+                add_area_ids=payload.add_area_ids,
+                remove_area_ids=payload.remove_area_ids,
+            )
+        except IntegrityError as e:
+            logger.exception("IntegrityError al reclasificar preguntas")
+
+            orig = getattr(e, "orig", None)
+            pgcode = getattr(orig, "pgcode", None)
+
+            if pgcode == "23503":
+                raise ForeignKeyViolationError("La clave foránea no existe") from e
+
+            raise PersistenceError(
+                "Error al reclasificar las preguntas en la base de datos."
+            ) from e
+        except SQLAlchemyError as e:
+            logger.exception("Error al reclasificar preguntas")
+            raise PersistenceError(
+                "Error al reclasificar las preguntas en la base de datos."
+            ) from e
+
+        items = []
+        for question_id in question_ids:
+            if question_id not in changed:
+                item_status = QuestionReclassifyItemStatus.NOT_FOUND
+            elif changed[question_id] is None:
+                item_status = QuestionReclassifyItemStatus.INVALID
+            elif changed[question_id]:
+                item_status = QuestionReclassifyItemStatus.UPDATED
+            else:
+                item_status = QuestionReclassifyItemStatus.UNCHANGED
+            items.append(
+                QuestionReclassifyItemResult(id=question_id, status=item_status)
+            )
+
+        totals = Counter(item.status for item in items)
+        return QuestionReclassifyResponse(
+            updated=totals[QuestionReclassifyItemStatus.UPDATED],
+            unchanged=totals[QuestionReclassifyItemStatus.UNCHANGED],
+            not_found=totals[QuestionReclassifyItemStatus.NOT_FOUND],
+            invalid=totals[QuestionReclassifyItemStatus.INVALID],
+            items=items,
+        )
+
     def _update_question_fields(self, question_id: int, update_data: dict):
         try:
             updated_question = self.question_repository.update_question_fields_db(
@@ -253,36 +566,40 @@ class QuestionService:
                 message=f"Pregunta con ID {question_id} no encontrada."
             )
 
-    def delete_question(self, question_id: int):
-        try:
-            deleted_question = self.question_repository.delete_question_db(
-                question_id=question_id
+    def _ensure_classification(
+            self, difficulty_id: int | None = None, question_type_id: int | None = None
+    ):
+        """Valida la dificultad y el tipo de pregunta en memoria."""
+        if difficulty_id is not None and not self._find_reference_ids(
+            DIFFICULTIES,
+            [difficulty_id],
+            self.question_repository.get_difficulty_refs_db,
+        ):
+            raise ResourceNotFoundException(
+                message=f"Dificultad con ID {difficulty_id} no encontrada."
             )
-        except SQLAlchemyError as e:
-            logger.exception("Error al eliminar la pregunta con ID %s", question_id)
-            raise DeleteError(
-                f"Error al eliminar la pregunta con ID {question_id}"
-            ) from e
 
-        if not deleted_question:
+        if question_type_id is not None and not self._find_reference_ids(
+            QUESTION_TYPES,
+            [question_type_id],
+            self.question_repository.get_question_type_refs_db,
+        ):
             raise ResourceNotFoundException(
-                message=f"Pregunta con ID {question_id} no encontrada."
+                message=f"Tipo de pregunta con ID {question_type_id} no encontrado."
             )
 
-    def _sign_question_images(self, question, view):
-        """Genera URLs firmadas para todas las imágenes de una pregunta."""
-        # Firmar imágenes en contents
-        sign_image_contents(question.contents, self.image_service.generate_signature)
-
-        if view == "full":
-            # Firmar imágenes en choices
-            for choice in question.choices:
-                sign_image_contents(
-                    choice.contents, self.image_service.generate_signature
-                )
+    def _find_subtopic_ids(self, ids: set[int]) -> set[int]:
+        try:
+            return self.question_repository.find_subtopic_ids_db(ids)
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener subtemas")
+            raise RetrievalError("Error al obtener subtemas") from e
 
-            # Firmar imágenes en solutions
-            for solution in question.solutions:
-                sign_image_contents(
-                    solution.contents, self.image_service.generate_signature
-                )
+    @staticmethod
+    def _find_reference_ids(table: str, ids, load) -> set[int]:
+        try:
+            rows, _ = reference_cache.resolve(table, ids, load)
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener la tabla de referencia %s", table)
+            raise RetrievalError("Error al obtener datos de referencia") from e
+        return {row.id for row in rows}
@@ -0,0 +1,154 @@
+import logging
+from collections.abc import Iterable, Mapping
+
+from fastapi import BackgroundTasks
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.api.v1.question.schemas import SimilarQuestionPublic
+from app.core.config import settings
+from app.core.exceptions.domain import ResourceNotFoundException
+from app.domain.question.hash import QuestionHashContent
+from app.domain.question.similarity import (
+    estimate_similarity,
+    lsh_buckets,
+    question_signature,
+)
+from app.repositories.question_similarity_repository import (
+    QuestionSimilarityRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def index_questions_task(
+        bind, contents_by_id: Mapping[int, Iterable[QuestionHashContent]]
+):
+    """Indexa en segundo plano con una sesión propia (la de la petición ya cerró)."""
+    with Session(bind) as session:
+        repository = QuestionSimilarityRepository(session)
+        QuestionSimilarityService(repository).index_questions(contents_by_id)
+
+
+class QuestionSimilarityService:
+    def __init__(
+            self,
+            repository: QuestionSimilarityRepository,
+            background_tasks: BackgroundTasks | None = None,
+    ):
+        self.repository = repository
+        self.background_tasks = background_tasks
+
+    def index_questions(
+            self, contents_by_id: Mapping[int, Iterable[QuestionHashContent]]
+    ):
+        """
+        Calcula y guarda la firma de cada pregunta. Un error aquí no debe deshacer la
+        creación de la pregunta: se registra y la pregunta queda sin indexar hasta la
+        próxima ejecución de ``app.cli.index_similarity``.
+        """
+        signatures = {
+            question_id: question_signature(contents)
+            for question_id, contents in contents_by_id.items()
+        }
+        try:
+            self.repository.save_signatures_db(signatures)
+        except SQLAlchemyError:
+            logger.exception("Error al indexar la similitud de las preguntas")
+
+    def find_similar(
+            self,
+            signatures: Mapping[int, list[int] | None],
+            limit: int = 5,
+            min_similarity: float = settings.SIMILARITY_MIN_SCORE,
+    ) -> dict[int, list[SimilarQuestionPublic]]:
+        """
+        Preguntas similares a cada firma de ``signatures`` (``{question_id: firma}``).
+        Cada pregunta se excluye de sus propios resultados.
+        """
+        probes = {
+            question_id: lsh_buckets(signature)
+            for question_id, signature in signatures.items()
+            if signature is not None
+        }
+        candidates = self.repository.find_candidates_db(
+            probes, max_candidates=settings.SIMILARITY_MAX_CANDIDATES
+        )
+        candidate_signatures = self.repository.get_signatures_db(
+            list({c for ids in candidates.values() for c in ids})
+        )
+
+        results: dict[int, list[SimilarQuestionPublic]] = {}
+        for question_id, candidate_ids in candidates.items():
+            signature = signatures[question_id]
+            scored = []
+            for candidate_id in candidate_ids:
+                candidate_signature = candidate_signatures.get(candidate_id)
+                if candidate_id == question_id or candidate_signature is None:
+                    continue
+
+                similarity = estimate_similarity(signature, candidate_signature)
+                if similarity >= min_similarity:
+                    scored.append(
+                        SimilarQuestionPublic(id=candidate_id, similarity=similarity)
+                    )
+
+            scored.sort(key=lambda s: (-s.similarity, s.id))
+            if scored:
+                results[question_id] = scored[:limit]
+
+        return results
+
+    def index_and_find_similar(
+            self,
+            contents_by_id: Mapping[int, Iterable[QuestionHashContent]],
+            limit: int = 5,
+    ) -> dict[int, list[SimilarQuestionPublic]]:
+        """
+        Indexa preguntas recién creadas y devuelve las casi duplicadas de cada una
+        (advertencia al importar). Nunca interrumpe la creación.
+
+        La firma MinHash cuesta decenas de ms por pregunta: solo los lotes de hasta
+        ``SIMILARITY_INLINE_MAX_ITEMS`` preguntas se indexan dentro de la petición.
+        Los mayores se indexan en segundo plano, tras enviar la respuesta, y se
+        devuelven sin advertencias (``GET /questions/{id}/similar`` las calcula
+        después); si el proceso cae antes, ``app.cli.index_similarity`` los indexa.
+        """
+        if (
+            self.background_tasks is not None
+            and len(contents_by_id) > settings.SIMILARITY_INLINE_MAX_ITEMS
+        ):
+            self.background_tasks.add_task(
+                index_questions_task, self.repository.db.get_bind(), contents_by_id
+            )
+            return {}
+
+        signatures = {
+            question_id: question_signature(contents)
+            for question_id, contents in contents_by_id.items()
+        }
+        try:
+            self.repository.save_signatures_db(signatures)
+            return self.find_similar(signatures, limit=limit)
+        except SQLAlchemyError:
+            logger.exception("Error al buscar preguntas similares")
+            return {}
+
+    def get_similar_questions(
+            self, question_id: int, limit: int, min_similarity: float
+    ) -> list[SimilarQuestionPublic]:
+        signature = self.repository.get_signatures_db([question_id]).get(question_id)
+
+        if signature is None:
+            # Sin firma guardada: pregunta aún no indexada (o solo con imágenes)
+            contents = self.repository.get_question_contents_db(question_id)
+            if contents is None:
+                raise ResourceNotFoundException(
+                    message=f"Pregunta con ID {question_id} no encontrada."
+                )
+            signature = question_signature(contents)
+
+        similar = self.find_similar(
+            {question_id: signature}, limit=limit, min_similarity=min_similarity
+        )
+        return similar.get(question_id, [])
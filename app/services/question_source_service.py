@@ -53,7 +53,7 @@ class QuestionSourceService:
             )
 
         if payload.source_id is not None:
-            self.source_service.get_sources_by_ids([payload.source_id])
+            self.source_service.ensure_sources_exist([payload.source_id])
 
         try:
             self.repository.update_question_source_db(
@@ -0,0 +1,42 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.api.v1.question.schemas import QuestionStatsRow
+from app.core.exceptions.technical import RetrievalError
+from app.repositories.question_stats_repository import QuestionStatsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionStatsService:
+    def __init__(self, repository: QuestionStatsRepository):
+        self.repository = repository
+
+    def get_stats(
+            self,
+            group_by: list[str],
+            course_id: int | None = None,
+            topic_id: int | None = None,
+            subtopic_id: int | None = None,
+            difficulty_id: int | None = None,
+            question_type_id: int | None = None,
+            area_codes: tuple[str, ...] = (),
+    ) -> list[QuestionStatsRow]:
+        try:
+            rows = self.repository.get_stats_db(
+                group_by=group_by,
+                course_id=course_id,
+                topic_id=topic_id,
+                subtopic_id=subtopic_id,
+                difficulty_id=difficulty_id,
+                question_type_id=question_type_id,
+                area_codes=area_codes,
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener las estadísticas de preguntas")
+            raise RetrievalError(
+                "Error al obtener las estadísticas de preguntas"
+            ) from e
+
+        return [QuestionStatsRow.model_validate(row) for row in rows]
@@ -9,24 +9,16 @@ from app.core.exceptions.domain import (
 )
 from app.core.exceptions.technical import PersistenceError, RetrievalError
 from app.helpers.content_signer import sign_image_contents
-from app.models.solution_content import SolutionContent
 from app.repositories.solution_repository import SolutionRepository
 from app.services.image_service import ImageService
-from app.services.question_guard_service import QuestionGuardService
 
 logger = logging.getLogger(__name__)
 
 
 class SolutionService:
-    def __init__(
-            self,
-            repository: SolutionRepository,
-            image_service: ImageService,
-            question_guard_service: QuestionGuardService,
-    ):
+    def __init__(self, repository: SolutionRepository, image_service: ImageService):
         self.repository = repository
         self.image_service = image_service
-        self.question_guard_service = question_guard_service
 
     def update_solution(
             self,
@@ -34,21 +26,26 @@ class SolutionService:
             solution_id: int,
             payload: SolutionUpdateInput,
     ):
-        self.question_guard_service.ensure_exists(question_id=question_id)
-
+        """
+        Reemplaza los contenidos de una solución en una sola transacción, con la
+        pregunta bloqueada desde la verificación hasta el commit.
+        """
         try:
-            db_solution = self.repository.get_solution_db(
-                question_id=question_id, solution_id=solution_id
-            )
+            solution_ids = self.repository.lock_question_solutions_db(question_id)
         except SQLAlchemyError as e:
             logger.exception(
-                "Error al obtener solución %s de la pregunta %s",
-                solution_id,
-                question_id,
+                "Error al obtener soluciones de la pregunta %s", question_id
             )
             raise RetrievalError("Error al obtener la solución") from e
 
-        if not db_solution:
+        if solution_ids is None:
+            raise ResourceNotFoundException(
+                message=f"Pregunta con ID {question_id} no encontrada."
+            )
+
+        if solution_id not in solution_ids:
+            # Libera el bloqueo de la pregunta
+            self.repository.rollback_db()
             raise ResourceNotFoundException(
                 message=(
                     f"Solución con ID {solution_id} no encontrada "
@@ -57,13 +54,13 @@ class SolutionService:
             )
 
         contents = [
-            SolutionContent(type=item.type, value=item.value, order=item.order)
+            {"type": item.type, "value": item.value, "order": item.order}
             for item in payload.contents
         ]
 
         try:
             updated_solution = self.repository.update_solution_db(
-                solution=db_solution, contents=contents
+                question_id=question_id, solution_id=solution_id, contents=contents
             )
         except IntegrityError as e:
             logger.exception("IntegrityError al actualizar solución")
@@ -78,8 +75,6 @@ class SolutionService:
             logger.exception("Error al actualizar solución")
             raise PersistenceError("Error al actualizar la solución") from e
 
-        sign_image_contents(
-            updated_solution.contents, self.image_service.generate_signature
-        )
-
-        return SolutionPublic.model_validate(updated_solution)
+        response = SolutionPublic.model_validate(updated_solution)
+        sign_image_contents(response.contents, self.image_service.generate_signature)
+        return response
@@ -7,9 +7,9 @@ from app.api.v1.source.schemas import (
     SourcePublic,
     SourceUpdate,
 )
-from app.core.cache import get_cached_count
 from app.core.exceptions.domain import ResourceNotFoundException
 from app.core.exceptions.technical import DeleteError, PersistenceError, RetrievalError
+from app.core.reference_cache import SOURCES, reference_cache
 from app.repositories.source_repository import SourceRepository
 from app.services.institution_service import InstitutionService
 
@@ -41,38 +41,45 @@ class SourceService:
 
         return source
 
-    def get_sources(self, page: int, limit: int):
+    def get_sources(self, page: int, limit: int, include_total: bool = True):
         try:
-            sources_page = self.repository.get_sources(page, limit)
+            sources, total = self.repository.get_sources(page, limit, include_total)
         except SQLAlchemyError as e:
             logger.exception(f"Error al listar fuentes (page={page}, limit={limit})")
             raise RetrievalError("Error al listar fuentes") from e
 
-        items = [SourcePublic.model_validate(source) for source in sources_page.items]
+        has_next = len(sources) > limit
+        sources = sources[:limit]
 
-        total = get_cached_count("sources:total_count")
+        items = [SourcePublic.model_validate(source) for source in sources]
 
-        return items, total
+        return items, total, has_next
 
-    def get_sources_by_ids(self, ids: list[int]):
-        try:
-            sources = self.repository.get_sources_by_ids(ids)
-        except SQLAlchemyError as e:
-            logger.exception("Error al obtener fuentes por IDs")
-            raise RetrievalError("Error al obtener fuentes") from e
-
-        found_ids = {source.id for source in sources}
-        missing_ids = set(ids) - found_ids
+    def ensure_sources_exist(self, ids: list[int]):
+        """Valida los IDs en memoria (ver ``app.core.reference_cache``)"""
+        _, missing_ids = self._resolve(ids)
 
         if missing_ids:
             raise ResourceNotFoundException(
                 message=f"Fuentes no encontradas para IDs: {missing_ids}"
             )
 
-        return sources
+    def find_source_ids(self, ids) -> set[int]:
+        """IDs existentes entre ``ids``, sin fallar por los faltantes."""
+        rows, _ = self._resolve(ids)
+        return {row.id for row in rows}
+
+    def _resolve(self, ids):
+        try:
+            return reference_cache.resolve(
+                SOURCES, ids, self.repository.get_source_refs_db
+            )
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener fuentes por IDs")
+            raise RetrievalError("Error al obtener fuentes") from e
 
     def create_source(self, source: SourceCreate):
-        self.institution_service.get_institution(source.institution_id)
+        self.institution_service.ensure_institution_exists(source.institution_id)
 
         try:
             return self.repository.create_source(source.model_dump())
@@ -85,7 +92,7 @@ class SourceService:
 
     def update_source(self, source_id: int, source: SourceUpdate):
         if source.institution_id is not None:
-            self.institution_service.get_institution(source.institution_id)
+            self.institution_service.ensure_institution_exists(source.institution_id)
 
         try:
             updated_source = self.repository.update_source(
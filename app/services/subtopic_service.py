@@ -7,7 +7,6 @@ from app.api.v1.subtopic.schemas import (
     SubtopicPublic,
     SubtopicUpdate,
 )
-from app.core.cache import get_cached_count
 from app.core.exceptions.domain import ResourceNotFoundException
 from app.core.exceptions.technical import PersistenceError, RetrievalError, DeleteError
 from app.repositories.subtopic_repository import SubtopicRepository
@@ -36,22 +35,21 @@ class SubtopicService:
             )
         return subtopic
 
-    def get_subtopics(self, page: int, limit: int):
+    def get_subtopics(self, page: int, limit: int, include_total: bool = True):
         try:
-            subtopics = self.repository.get_subtopics(page, limit)
+            subtopics, total = self.repository.get_subtopics(page, limit, include_total)
         except SQLAlchemyError as e:
             logger.exception(f"Error al listar subtemas (page={page}, limit={limit})")
             raise RetrievalError(
                 f"Error al listar subtemas (page={page}, limit={limit})"
             ) from e
 
-        items = [
-            SubtopicPublic.model_validate(subtopic) for subtopic in subtopics.items
-        ]
+        has_next = len(subtopics) > limit
+        subtopics = subtopics[:limit]
 
-        total = get_cached_count("subtopics:total_count")
+        items = [SubtopicPublic.model_validate(subtopic) for subtopic in subtopics]
 
-        return items, total
+        return items, total, has_next
 
     def create_subtopic(self, subtopic: SubtopicCreate):
         # Validar que el ID de topic (FK) exista
@@ -0,0 +1,25 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.exceptions.technical import RetrievalError
+from app.core.taxonomy_cache import TaxonomySnapshot, taxonomy_cache
+from app.repositories.taxonomy_repository import TaxonomyRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TaxonomyService:
+    def __init__(self, repository: TaxonomyRepository):
+        self.repository = repository
+
+    def get_taxonomy(self) -> TaxonomySnapshot:
+        """Snapshot vigente del árbol; solo consulta la BD si hay que reconstruirlo"""
+        return taxonomy_cache.get(self._load_taxonomy)
+
+    def _load_taxonomy(self) -> dict:
+        try:
+            return self.repository.get_taxonomy_db()
+        except SQLAlchemyError as e:
+            logger.exception("Error al obtener la taxonomía")
+            raise RetrievalError("Error al obtener la taxonomía") from e
@@ -8,7 +8,6 @@ from app.api.v1.topic.schemas import (
     TopicPublicNoDescription,
     TopicUpdate,
 )
-from app.core.cache import get_cached_count
 from app.core.exceptions.domain import ResourceNotFoundException
 from app.core.exceptions.technical import DeleteError, PersistenceError
 from app.repositories.topic_repository import TopicRepository
@@ -45,20 +44,21 @@ class TopicService:
         # Se excluye description
         return TopicPublicNoDescription.model_validate(topic)
 
-    def get_topics(self, page: int, limit: int):
+    def get_topics(self, page: int, limit: int, include_total: bool = True):
         try:
-            topics = self.repository.get_topics(page, limit)
+            topics, total = self.repository.get_topics(page, limit, include_total)
         except SQLAlchemyError as e:
             logger.error(
                 f"Error al listar tópicos desde la base de datos (page={page}, limit={limit}): {e}"
             )
             raise PersistenceError("Error al listar los tópicos desde la base de datos")
 
-        items = [TopicPublic.model_validate(topic) for topic in topics.items]
+        has_next = len(topics) > limit
+        topics = topics[:limit]
 
-        total = get_cached_count("topics:total_count")
+        items = [TopicPublic.model_validate(topic) for topic in topics]
 
-        return items, total
+        return items, total, has_next
 
     def create_topic(self, topic: TopicCreate):
         # Validar que el ID de curso (FK) exista